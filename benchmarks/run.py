@@ -0,0 +1,193 @@
+"""
+End-to-end benchmarks against a local stand-in Panorama (optiv_pan_lib.testing).
+
+    python benchmarks/run.py --scale 1k
+    python benchmarks/run.py --scale 100k --latency 0.005 --json out.json
+    python benchmarks/run.py --scale 100k --baseline out.json --tolerance 0.2
+
+The fake server runs in a child process so its CPU and memory stay out of the
+numbers. Each scenario is timed over --iterations calls (throughput, p50/p99),
+then run once more under tracemalloc for the client's peak Python heap. With
+--baseline, exits 1 when p50, p99 or peak memory regress by more than
+--tolerance.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Dict, List, Optional
+
+from optiv_pan_lib.base.session import PanoramaSession
+from optiv_pan_lib.config import PanoramaConfig, Secret
+from optiv_pan_lib.objects.address.api import create_address, list_addresses
+from optiv_pan_lib.objects.address.model import AddressObject
+from optiv_pan_lib.objects.url_category.api import list_url_categories
+from optiv_pan_lib.panorama.managed_devices.api import list_connected
+
+DEVICE_GROUP = "bench"
+USERNAME = PASSWORD = "admin"
+
+Scenario = Callable[[PanoramaSession, int], int]  # (session, iteration) -> entries handled
+
+SCENARIOS: Dict[str, Scenario] = {
+    "list_addresses": lambda pano, i: len(list_addresses(session=pano, device_group=DEVICE_GROUP)),
+    "list_url_categories": lambda pano, i: len(list_url_categories(session=pano, device_group=DEVICE_GROUP)),
+    "list_connected": lambda pano, i: len(list_connected(session=pano)),
+    "create_address": lambda pano, i: (create_address(
+        AddressObject(name=f"bench-new-{i:06d}", kind="ip-netmask", value=f"172.16.{i >> 8 & 255}.{i & 255}/32", tags=("bench",)),
+        device_group=DEVICE_GROUP,
+        session=pano,
+        ), 1)[1],
+    }
+
+
+@dataclass(slots=True)
+class Result:
+    scenario: str
+    iterations: int
+    entries: int
+    calls_per_s: float
+    entries_per_s: float
+    p50_ms: float
+    p99_ms: float
+    peak_kib: float
+
+
+def parse_scale(s: str) -> int:
+    m = re.fullmatch(r"(\d+)([km]?)", s.strip().lower())
+    if not m:
+        raise argparse.ArgumentTypeError(f"bad scale {s!r} (e.g. 1k, 100k, 1m)")
+    return int(m.group(1)) * {"": 1, "k": 1000, "m": 1_000_000}[m.group(2)]
+
+
+def _pct(samples: List[float], q: float) -> float:
+    s = sorted(samples)
+    if len(s) == 1:
+        return s[0]
+    return statistics.quantiles(s, n=100, method="inclusive")[int(q) - 1]
+
+
+def start_server(*, scale: int, latency: float, devices: int) -> tuple[subprocess.Popen, str]:
+    cmd = [
+        sys.executable, "-m", "optiv_pan_lib.testing",
+        "--addresses", str(scale),
+        "--url-categories", str(scale),
+        "--devices", str(devices),
+        "--latency", str(latency),
+        "--device-group", DEVICE_GROUP,
+        ]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+    assert proc.stdout is not None
+    line = proc.stdout.readline()
+    m = re.search(r"http://([^/]+)/api/", line)
+    if not m:
+        proc.kill()
+        raise RuntimeError(f"fake panorama did not start: {line!r}")
+    return proc, m.group(1)
+
+
+def run_scenario(name: str, fn: Scenario, pano: PanoramaSession, iterations: int, offset: int) -> Result:
+    fn(pano, offset)  # warm-up: connection, server-side render cache
+    samples: List[float] = []
+    entries = 0
+    start = perf_counter()
+    for i in range(iterations):
+        t0 = perf_counter()
+        entries += fn(pano, offset + 1 + i)
+        samples.append(perf_counter() - t0)
+    total = perf_counter() - start
+
+    tracemalloc.start()
+    try:
+        fn(pano, offset + 1 + iterations)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Result(
+        scenario=name,
+        iterations=iterations,
+        entries=entries // iterations,
+        calls_per_s=iterations / total,
+        entries_per_s=entries / total,
+        p50_ms=_pct(samples, 50) * 1000,
+        p99_ms=_pct(samples, 99) * 1000,
+        peak_kib=peak / 1024,
+        )
+
+
+def compare(results: List[Result], baseline: Dict[str, dict], tolerance: float) -> List[str]:
+    regressions = []
+    for r in results:
+        b = baseline.get(r.scenario)
+        if not b:
+            continue
+        for metric in ("p50_ms", "p99_ms", "peak_kib"):
+            old, new = float(b[metric]), float(getattr(r, metric))
+            if old > 0 and new > old * (1 + tolerance):
+                regressions.append(f"{r.scenario}.{metric}: {old:.2f} -> {new:.2f} (+{(new / old - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--scale", type=parse_scale, default=parse_scale("1k"), help="entries per collection: 1k, 100k, 1m (default 1k)")
+    ap.add_argument("--devices", type=int, default=None, help="managed devices (default: min(scale, 5000))")
+    ap.add_argument("--latency", type=float, default=0.0, help="server-side seconds added per response")
+    ap.add_argument("--iterations", type=int, default=None, help="timed calls per scenario (default scales down with --scale)")
+    ap.add_argument("--only", action="append", choices=sorted(SCENARIOS), help="run only these scenarios")
+    ap.add_argument("--json", type=Path, help="write results to this file")
+    ap.add_argument("--baseline", type=Path, help="results file to compare against")
+    ap.add_argument("--tolerance", type=float, default=0.2, help="allowed regression vs baseline (default 0.2 = 20%%)")
+    a = ap.parse_args(argv)
+
+    devices = a.devices if a.devices is not None else min(a.scale, 5000)
+    iterations = a.iterations or max(3, min(50, 200_000 // max(a.scale, 1)))
+    names = a.only or list(SCENARIOS)
+
+    proc, hostname = start_server(scale=a.scale, latency=a.latency, devices=devices)
+    try:
+        cfg = PanoramaConfig(hostname=hostname, username=USERNAME, password=Secret(lambda: PASSWORD), scheme="http", timeout=600.0)
+        results = []
+        with PanoramaSession(cfg) as pano:
+            for n, name in enumerate(names):
+                results.append(run_scenario(name, SCENARIOS[name], pano, iterations, offset=n * (iterations + 2)))
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    print(f"scale={a.scale} devices={devices} latency={a.latency}s iterations={iterations}")
+    print(f"{'scenario':<22}{'entries':>9}{'calls/s':>10}{'entries/s':>12}{'p50 ms':>10}{'p99 ms':>10}{'peak KiB':>11}")
+    for r in results:
+        print(f"{r.scenario:<22}{r.entries:>9}{r.calls_per_s:>10.1f}{r.entries_per_s:>12.0f}{r.p50_ms:>10.2f}{r.p99_ms:>10.2f}{r.peak_kib:>11.0f}")
+
+    if a.json:
+        a.json.write_text(json.dumps({
+            "scale": a.scale,
+            "devices": devices,
+            "latency": a.latency,
+            "iterations": iterations,
+            "results": {r.scenario: asdict(r) for r in results},
+            }, indent=2), encoding="utf-8")
+
+    if a.baseline:
+        base = json.loads(a.baseline.read_text(encoding="utf-8"))
+        if base.get("scale") != a.scale:
+            print(f"warning: baseline scale {base.get('scale')} != {a.scale}", file=sys.stderr)
+        regressions = compare(results, base.get("results", {}), a.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+# src/optiv_pan_lib/base/async_ops.py
+from __future__ import annotations
+
+import asyncio
+from time import perf_counter
+from typing import Any, Dict
+
+import aiohttp
+
+from optiv_pan_lib.base import metrics
+from optiv_pan_lib.base.async_session import AsyncPanoramaSession
+from optiv_pan_lib.base.metrics import CallTrace
+from optiv_pan_lib.base.ops import _parse_result, _retriable_status
+from optiv_pan_lib.base.retry import CircuitOpenError
+from optiv_pan_lib.base.session import PanoramaAPIKeyError, PanoramaCircuitOpenError, PanoramaHTTPError, PanoramaTimeoutError
+
+# Responses longer than this (characters) are parsed in a worker thread so a
+# multi-MB config or device listing does not stall every other call on the loop.
+OFFLOAD_PARSE_CHARS = 256 * 1024
+
+
+async def _call(*, session: AsyncPanoramaSession, method: str, params: Dict[str, Any], retries: int | None = None, backoff: float | None = None) -> dict:
+    """
+    Send one XML API call and return response.result.
+    retries/backoff override session.retry_policy for this call only.
+    Reports a CallMetrics to session.metrics_hooks, if any.
+    """
+    m = method.strip().upper()
+    if m not in {"GET", "POST"}:
+        # Not a transport failure. Fail fast, no retry.
+        raise NotImplementedError(f"Unsupported method: {method}")
+
+    if not session.metrics_hooks:
+        return await _call_cached(session=session, method=m, params=params, retries=retries, backoff=backoff, trace=None)
+
+    trace = CallTrace()
+    start = perf_counter()
+    try:
+        result = await _call_cached(session=session, method=m, params=params, retries=retries, backoff=backoff, trace=trace)
+    except Exception as e:
+        metrics.report(session, params, trace, perf_counter() - start, error=type(e).__name__)
+        raise
+    metrics.report(session, params, trace, perf_counter() - start)
+    return result
+
+
+async def _call_cached(*, session: AsyncPanoramaSession, method: str, params: Dict[str, Any], retries: int | None, backoff: float | None, trace: CallTrace | None) -> dict:
+    cache = session.cache
+    if cache is not None:
+        cached = cache.lookup(session.base_url, params, sanitized=session.sanitize)
+        if cached is not None:
+            if trace is not None:
+                trace.cached = True
+            return cached
+        if method == "POST":
+            try:
+                return await _send_authed(session=session, method=method, params=params, retries=retries, backoff=backoff, trace=trace)
+            finally:
+                cache.observe_write(session.base_url, params)
+
+    generation = cache.generation(session.base_url) if cache is not None else None
+    result = await _send_authed(session=session, method=method, params=params, retries=retries, backoff=backoff, trace=trace)
+    if cache is not None:
+        cache.store(session.base_url, params, result, sanitized=session.sanitize, generation=generation)
+    return result
+
+
+async def _send_authed(*, session: AsyncPanoramaSession, method: str, params: Dict[str, Any], retries: int | None, backoff: float | None, trace: CallTrace | None = None) -> dict:
+    """_send, refreshing the API key once if Panorama rejects it."""
+    stale = session.api_key
+    try:
+        return await _send(session=session, method=method, params=params, retries=retries, backoff=backoff, trace=trace)
+    except PanoramaAPIKeyError:
+        await session.refresh_api_key(stale)
+    if trace is not None:
+        trace.retries += 1
+    return await _send(session=session, method=method, params=params, retries=retries, backoff=backoff, trace=trace)
+
+
+async def _send(*, session: AsyncPanoramaSession, method: str, params: Dict[str, Any], retries: int | None, backoff: float | None, trace: CallTrace | None = None) -> dict:
+    """Same retry/breaker/rate-limit flow as ops._request, on asyncio."""
+    policy = session.retry_policy
+    attempt = 0
+    while True:
+        try:
+            probe = policy.admit(first=attempt == 0)
+        except CircuitOpenError as e:
+            raise PanoramaCircuitOpenError(str(e)) from None
+        try:
+            if session.rate_limiter is not None:
+                await session.rate_limiter.acquire_async(session.hostname, params)
+
+            retry_after: str | None = None
+            try:
+                r = await (session.get("", params=params) if method == "GET" else session.post("", data=params))
+
+            except asyncio.TimeoutError as e:
+                # Timeouts: retry, then raise a distinct error
+                policy.record_failure()
+                reason, failure = "timeout", PanoramaTimeoutError(str(e) or "Request timed out.")
+
+            except aiohttp.ClientConnectionError as e:
+                # TCP resets / DNS / connection aborted: retry then surface
+                policy.record_failure()
+                reason, failure = "connection", PanoramaHTTPError(str(e))
+
+            except aiohttp.ClientError as e:
+                # Other client-side errors: do not retry
+                policy.release(probe)
+                probe = False
+                raise PanoramaHTTPError(str(e)) from None
+
+            else:
+                if r.status < 400:
+                    policy.record_success()
+                    probe = False
+                    if len(r.text) > OFFLOAD_PARSE_CHARS:
+                        return await asyncio.to_thread(_parse_result, r.text, sanitize_result=session.sanitize, trace=trace)
+                    return _parse_result(r.text, sanitize_result=session.sanitize, trace=trace)
+                if not _retriable_status(r.status):
+                    policy.record_success()
+                    probe = False
+                    err = PanoramaAPIKeyError if r.status == 403 else PanoramaHTTPError
+                    raise err(f"HTTP {r.status}: {r.reason}")
+                policy.record_failure()
+                reason, retry_after = f"HTTP {r.status}", r.headers.get("Retry-After")
+                failure = PanoramaHTTPError(f"HTTP {r.status}: {r.reason}")
+        except BaseException:
+            # CancelledError (wait_for, fleet early close) and other unrecorded exits
+            # must not leave a half-open probe claimed.
+            policy.release(probe)
+            raise
+
+        delay = policy.next_delay(attempt, host=session.base_url, reason=reason, retry_after=retry_after, retries=retries, backoff=backoff)
+        if delay is None:
+            raise failure from None
+        await asyncio.sleep(delay)
+        attempt += 1
+        if trace is not None:
+            trace.retries += 1
+
+
+# ---------------------------
+# Config API (returns response.result)
+# ---------------------------
+
+async def config_show(*, session: AsyncPanoramaSession, xpath: str) -> dict:
+    return await _call(session=session, method="GET", params={"type": "config", "action": "show", "xpath": xpath})
+
+
+async def config_get(*, session: AsyncPanoramaSession, xpath: str) -> dict:
+    return await _call(session=session, method="GET", params={"type": "config", "action": "get", "xpath": xpath})
+
+
+async def config_set(*, session: AsyncPanoramaSession, xpath: str, element: str) -> dict:
+    return await _call(session=session, method="POST", params={"type": "config", "action": "set", "xpath": xpath, "element": element}, )
+
+
+async def config_edit(*, session: AsyncPanoramaSession, xpath: str, element: str) -> dict:
+    return await _call(session=session, method="POST", params={"type": "config", "action": "edit", "xpath": xpath, "element": element}, )
+
+
+async def config_delete(*, session: AsyncPanoramaSession, xpath: str) -> dict:
+    return await _call(session=session, method="POST", params={"type": "config", "action": "delete", "xpath": xpath})
+
+
+async def config_rename(*, session: AsyncPanoramaSession, xpath: str, newname: str) -> dict:
+    return await _call(session=session, method="POST", params={"type": "config", "action": "rename", "xpath": xpath, "newname": newname}, )
+
+
+async def config_clone(*, session: AsyncPanoramaSession, xpath: str, newname: str) -> dict:
+    return await _call(session=session, method="POST", params={"type": "config", "action": "clone", "xpath": xpath, "newname": newname}, )
+
+
+async def config_multi(*, session: AsyncPanoramaSession, element: str) -> dict:
+    return await _call(session=session, method="POST", params={"type": "config", "action": "multi-config", "element": element}, )
+
+
+async def config_move(*, session: AsyncPanoramaSession, xpath: str, where: str, dst: str | None = None) -> dict:
+    p: Dict[str, Any] = {"type": "config", "action": "move", "xpath": xpath, "where": where}
+    if dst:
+        p["dst"] = dst
+    return await _call(session=session, method="POST", params=p)
+
+
+# ---------------------------
+# Operational API (returns response.result)
+# ---------------------------
+
+async def op(*, session: AsyncPanoramaSession, cmd: str) -> dict:
+    """
+    Example cmd: "<show><config><running><xpath>shared/address</xpath></running></config></show>"
+    """
+    return await _call(session=session, method="GET", params={"type": "op", "cmd": cmd})
+
+
+# ---------------------------
+# Panorama → device proxy ops/config
+# ---------------------------
+
+async def op_on_device(*, session: AsyncPanoramaSession, cmd: str, target: str, vsys: str | None = None, ) -> dict:
+    """
+    Run an operational command on a managed firewall via Panorama proxy.
+    Returns inner 'result'.
+    """
+    params: Dict[str, Any] = {"type": "op", "cmd": cmd, "target": target}
+    if vsys:
+        params["vsys"] = vsys
+    return await _call(session=session, method="GET", params=params)
+
+
+async def config_show_on_device(*, session: AsyncPanoramaSession, xpath: str, target: str, ) -> dict:
+    """
+    Fetch RUNNING config node from device via Panorama proxy.
+    Returns inner 'result'.
+    """
+    params: Dict[str, Any] = {
+        "type": "config", "action": "show", "xpath": xpath, "target": target,
+        }
+    return await _call(session=session, method="GET", params=params)
+
+
+async def config_get_on_device(*, session: AsyncPanoramaSession, xpath: str, target: str, ) -> dict:
+    """
+    Fetch CANDIDATE config node from device via Panorama proxy.
+    Returns inner 'result'.
+    """
+    params: Dict[str, Any] = {
+        "type": "config", "action": "get", "xpath": xpath, "target": target,
+        }
+    return await _call(session=session, method="GET", params=params)
@@ -0,0 +1,164 @@
+# src/optiv_pan_lib/base/async_session.py
+from __future__ import annotations
+
+import asyncio
+import ssl
+from dataclasses import dataclass
+from typing import Any, Callable, List, Mapping
+
+import aiohttp
+
+from optiv_pan_lib.base.cache import ResponseCache
+from optiv_pan_lib.base.keystore import KeyStore
+from optiv_pan_lib.base.metrics import MetricsHook
+from optiv_pan_lib.base.ratelimit import HostRateLimiter
+from optiv_pan_lib.base.retry import RetryPolicy
+from optiv_pan_lib.base.session import (
+    PanoramaHTTPError,
+    PanoramaTimeoutError,
+    VerifyType,
+    _parse_api_key,
+    _redact,
+    _require_pano_cfg,
+    _silence_verify_warnings,
+)
+from optiv_pan_lib.config import AppConfig, PanoramaConfig
+
+
+def _ssl_for(verify: VerifyType) -> ssl.SSLContext | bool:
+    if verify is False:
+        return False
+    if isinstance(verify, str):
+        return ssl.create_default_context(cafile=verify)
+    return ssl.create_default_context()
+
+
+@dataclass(slots=True, frozen=True)
+class AsyncResponse:
+    """Fully-read HTTP response returned by AsyncPanoramaSession."""
+    status: int
+    reason: str
+    text: str
+    headers: Mapping[str, str]
+
+
+async def _api_key(*, client: aiohttp.ClientSession, base_url: str, username: str, password_get: Callable[[], str]) -> str:
+    pwd = password_get()
+    try:
+        async with client.post(base_url, params={"type": "keygen", "user": username, "password": pwd}) as r:
+            r.raise_for_status()
+            text = await r.text()
+    except asyncio.TimeoutError:
+        raise PanoramaTimeoutError("Panorama keygen timed out.") from None
+    except aiohttp.ClientError as e:
+        raise PanoramaHTTPError(f"Panorama connection error: {_redact(str(e), pwd)}") from None
+    finally:
+        pwd = ""
+
+    return _parse_api_key(text)
+
+
+class AsyncPanoramaSession:
+    """
+    asyncio-native session for Panorama XML API (aiohttp).
+
+    Accepts either:
+      - PanoramaConfig
+      - AppConfig (must have .panorama)
+
+    The API key is obtained on open(); use as an async context manager:
+
+        async with AsyncPanoramaSession(cfg) as pano:
+            await async_ops.config_get(session=pano, xpath="/config/shared/address")
+
+    `limit` caps concurrent connections held by the underlying connector.
+    `key_store` behaves as for PanoramaSession (key reuse, refresh on rejection);
+    its (possibly blocking, file-locked) calls run in a worker thread.
+    """
+
+    def __init__(self, cfg: PanoramaConfig | AppConfig, *, limit: int = 100, key_store: KeyStore | None = None):
+        pano = _require_pano_cfg(cfg)
+
+        self.hostname = pano.hostname
+        self.base_url = f"{pano.scheme}://{pano.hostname}/api/"
+        self.timeout = pano.timeout
+        self.verify = pano.verify
+        self.sanitize = pano.sanitize
+        self.api_key: str | None = None
+        self.cache: ResponseCache | None = None  # opt-in; see base.cache
+        self.retry_policy = RetryPolicy()
+        self.rate_limiter: HostRateLimiter | None = None  # opt-in; share one across sessions
+        self.metrics_hooks: List[MetricsHook] = []  # see base.metrics
+        self.key_store = key_store
+
+        self._username = pano.username
+        self._password_get = pano.password.get
+        self._limit = limit
+        self._client: aiohttp.ClientSession | None = None
+        self._key_lock: asyncio.Lock | None = None
+
+        if pano.verify is False:
+            _silence_verify_warnings()
+
+    async def open(self) -> "AsyncPanoramaSession":
+        if self._client is None:
+            connector = aiohttp.TCPConnector(limit=self._limit, ssl=_ssl_for(self.verify))
+            self._client = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=self.timeout))
+        if self.api_key is None:
+            try:
+                stored = await asyncio.to_thread(self.key_store.get, self.hostname, self._username) if self.key_store is not None else None
+                self.api_key = stored or await self._keygen()
+            except BaseException:
+                await self.close()
+                raise
+        return self
+
+    async def _keygen(self) -> str:
+        assert self._client is not None
+        key = await _api_key(client=self._client, base_url=self.base_url, username=self._username, password_get=self._password_get, )
+        if self.key_store is not None:
+            await asyncio.to_thread(self.key_store.put, self.hostname, self._username, key)
+        return key
+
+    async def refresh_api_key(self, stale: str | None = None) -> str:
+        """
+        Replace a rejected key. Concurrent callers passing the same `stale`
+        key trigger a single keygen.
+        """
+        if self._key_lock is None:
+            self._key_lock = asyncio.Lock()
+        async with self._key_lock:
+            if stale is None or stale == self.api_key:
+                if self.key_store is not None:
+                    await asyncio.to_thread(self.key_store.discard, self.hostname, self._username)
+                self.api_key = await self._keygen()
+            assert self.api_key is not None
+            return self.api_key
+
+    async def close(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.close()
+
+    async def __aenter__(self) -> "AsyncPanoramaSession":
+        return await self.open()
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
+
+    async def request(self, method: str, url: str = "", **kwargs: Any) -> AsyncResponse:
+        if self._client is None or self.api_key is None:
+            raise RuntimeError("AsyncPanoramaSession is not open; use 'async with' or await open().")
+        full_url = url if url.startswith("http") else (self.base_url + url.lstrip("/"))
+        params = dict(kwargs.pop("params", {}) or {})
+        params.setdefault("key", self.api_key)
+        kwargs["params"] = params
+        async with self._client.request(method, full_url, **kwargs) as r:
+            text = await r.text()
+            return AsyncResponse(status=r.status, reason=r.reason or "", text=text, headers=dict(r.headers))
+
+    async def get(self, url: str = "", **kwargs: Any) -> AsyncResponse:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str = "", **kwargs: Any) -> AsyncResponse:
+        return await self.request("POST", url, **kwargs)
@@ -0,0 +1,139 @@
+# src/optiv_pan_lib/base/bulk.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, List, Sequence, Tuple, TypeVar
+from xml.sax.saxutils import quoteattr
+
+from optiv_pan_lib.base import ops
+from optiv_pan_lib.base.session import PanoramaAPIError, PanoramaAuthError, PanoramaHTTPError, PanoramaSession
+
+DEFAULT_MAX_BYTES = 256 * 1024  # XML payload per request, before form encoding
+DEFAULT_MAX_ENTRIES = 1000
+
+T = TypeVar("T", bound=Tuple[str, ...])
+
+
+@dataclass(slots=True, frozen=True)
+class BulkRejection:
+    name: str
+    error: str
+
+
+@dataclass(slots=True, frozen=True)
+class BulkResult:
+    """Outcome of a chunked bulk write. `requests` counts API round-trips."""
+    applied: tuple[str, ...] = ()
+    rejected: tuple[BulkRejection, ...] = ()
+    requests: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return not self.rejected
+
+
+class BulkAborted(PanoramaAuthError):
+    """
+    An auth failure stopped a bulk write part-way (the cause is chained).
+    `result` holds what was applied to / rejected by the candidate config
+    before it; items after that were not sent.
+    """
+
+    def __init__(self, message: str, result: BulkResult) -> None:
+        super().__init__(message)
+        self.result = result
+
+
+def chunk_by_size(items: Iterable[T], *, max_bytes: int = DEFAULT_MAX_BYTES, max_entries: int = DEFAULT_MAX_ENTRIES) -> Iterator[List[T]]:
+    """
+    Group (name, ..., element) tuples so each chunk stays under max_bytes of
+    XML (last tuple field) and max_entries items. An oversize item gets its own chunk.
+    """
+    chunk: List[T] = []
+    size = 0
+    for it in items:
+        n = len(it[-1].encode("utf-8"))
+        if chunk and (size + n > max_bytes or len(chunk) >= max_entries):
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(it)
+        size += n
+    if chunk:
+        yield chunk
+
+
+def _apply(items: Iterable[T], send: Callable[[Sequence[T]], None], *, max_bytes: int, max_entries: int) -> BulkResult:
+    """
+    Send each chunk. A chunk rejected by PAN-OS is bisected until the failing
+    entries are isolated, so valid entries still land and the rejected ones are
+    reported by name. Transport failures (circuit open included) reject the
+    whole chunk without bisecting. Auth failures stop the run with
+    BulkAborted carrying the partial result: the key was already refreshed
+    once by ops, and no later chunk would land either.
+    """
+    applied: List[str] = []
+    rejected: List[BulkRejection] = []
+    requests = 0
+
+    def run(chunk: Sequence[T]) -> None:
+        nonlocal requests
+        requests += 1
+        try:
+            send(chunk)
+        except PanoramaAuthError:
+            raise
+        except PanoramaAPIError as exc:
+            if len(chunk) == 1:
+                rejected.append(BulkRejection(name=chunk[0][0], error=str(exc)))
+                return
+            mid = len(chunk) // 2
+            run(chunk[:mid])
+            run(chunk[mid:])
+            return
+        except PanoramaHTTPError as exc:
+            rejected.extend(BulkRejection(name=it[0], error=str(exc)) for it in chunk)
+            return
+        applied.extend(it[0] for it in chunk)
+
+    try:
+        for chunk in chunk_by_size(items, max_bytes=max_bytes, max_entries=max_entries):
+            run(chunk)
+    except PanoramaAuthError as exc:
+        partial = BulkResult(applied=tuple(applied), rejected=tuple(rejected), requests=requests)
+        raise BulkAborted(f"{exc} (bulk write stopped after {len(applied)} applied, {len(rejected)} rejected)", partial) from exc
+    return BulkResult(applied=tuple(applied), rejected=tuple(rejected), requests=requests)
+
+
+def set_entries(*, session: PanoramaSession, xpath: str, items: Iterable[Tuple[str, str]], max_bytes: int = DEFAULT_MAX_BYTES, max_entries: int = DEFAULT_MAX_ENTRIES) -> BulkResult:
+    """
+    Create (or merge) many <entry> elements under one container xpath.
+    items: (name, "<entry name=...>...</entry>") pairs; one action=set per chunk.
+    """
+    def send(chunk: Sequence[Tuple[str, str]]) -> None:
+        ops.config_set(session=session, xpath=xpath, element="".join(el for _, el in chunk))
+
+    return _apply(items, send, max_bytes=max_bytes, max_entries=max_entries)
+
+
+def edit_entries(*, session: PanoramaSession, items: Iterable[Tuple[str, str, str]], max_bytes: int = DEFAULT_MAX_BYTES, max_entries: int = DEFAULT_MAX_ENTRIES) -> BulkResult:
+    """
+    Replace many entries in place. items: (name, entry_xpath, element) triples;
+    one action=multi-config request of <edit> operations per chunk.
+    """
+    def send(chunk: Sequence[Tuple[str, str, str]]) -> None:
+        ops_xml = "".join(f"<edit id={quoteattr(str(i))} xpath={quoteattr(xp)}>{el}</edit>" for i, (_, xp, el) in enumerate(chunk, 1))
+        ops.config_multi(session=session, element=f"<multi-configure-request>{ops_xml}</multi-configure-request>")
+
+    return _apply(items, send, max_bytes=max_bytes, max_entries=max_entries)
+
+
+def delete_entries(*, session: PanoramaSession, items: Iterable[Tuple[str, str]], max_bytes: int = DEFAULT_MAX_BYTES, max_entries: int = DEFAULT_MAX_ENTRIES) -> BulkResult:
+    """
+    Delete many entries. items: (name, entry_xpath) pairs;
+    one action=multi-config request of <delete> operations per chunk.
+    """
+    def send(chunk: Sequence[Tuple[str, str]]) -> None:
+        ops_xml = "".join(f"<delete id={quoteattr(str(i))} xpath={quoteattr(xp)}/>" for i, (_, xp) in enumerate(chunk, 1))
+        ops.config_multi(session=session, element=f"<multi-configure-request>{ops_xml}</multi-configure-request>")
+
+    return _apply(items, send, max_bytes=max_bytes, max_entries=max_entries)
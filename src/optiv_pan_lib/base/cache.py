@@ -0,0 +1,152 @@
+# src/optiv_pan_lib/base/cache.py
+from __future__ import annotations
+
+import copy
+import re
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+READ_ACTIONS = frozenset({"get", "show"})
+WRITE_ACTIONS = frozenset({"set", "edit", "delete", "rename", "clone", "move", "multi-config"})
+
+CacheKey = Tuple[str, str, str, Optional[str], bool]  # (host, action, xpath, target, sanitized)
+
+_PREDICATE_RE = re.compile(r"\[[^\]]*\]")
+
+
+def _skeleton(xpath: str) -> Tuple[str, ...] | None:
+    """Path steps without predicates; None when the xpath is not a plain location path."""
+    if "//" in xpath or "|" in xpath:
+        return None
+    return tuple(s for s in _PREDICATE_RE.sub("", xpath).split("/") if s)
+
+
+def _overlaps(a: str, b: str) -> bool:
+    """
+    True when one xpath may address a node inside the other. Predicates are
+    ignored, so sibling entries count as overlapping: over-invalidation is
+    cheap, serving a stale read is not.
+    """
+    sa, sb = _skeleton(a), _skeleton(b)
+    if sa is None or sb is None:
+        return True
+    n = min(len(sa), len(sb))
+    return sa[:n] == sb[:n]
+
+
+class ResponseCache:
+    """
+    Opt-in TTL + LRU cache for config get/show results.
+
+    Attach to one or more sessions (`session.cache = ResponseCache(...)`);
+    entries are keyed by (host, action, xpath, target, sanitized), so
+    redacting and raw sessions never share results. Writes issued through
+    base.ops on an overlapping xpath of the same host drop matching entries,
+    and a Panorama commit drops the host's running-config (show) entries.
+    Every invalidation bumps the host's generation; a read that started
+    before it is not stored. Values are deep-copied in and out so callers
+    may mutate results freely.
+    Thread-safe.
+    """
+
+    def __init__(self, *, ttl: float = 60.0, maxsize: int = 1024, clock: Callable[[], float] = monotonic):
+        if ttl <= 0 or maxsize <= 0:
+            raise ValueError("ttl and maxsize must be positive")
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._clock = clock
+        self._data: "OrderedDict[CacheKey, Tuple[float, dict]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    # ---- raw access ----
+
+    def get(self, key: CacheKey) -> dict | None:
+        now = self._clock()
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is None or hit[0] <= now:
+                if hit is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            value = hit[1]
+        return copy.deepcopy(value)
+
+    def put(self, key: CacheKey, value: dict, *, generation: int | None = None) -> None:
+        """Insert value; skipped when generation is given and key's host was invalidated since."""
+        value = copy.deepcopy(value)
+        expires = self._clock() + self.ttl
+        with self._lock:
+            if generation is not None and self._generations.get(key[0], 0) != generation:
+                return
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, host: str, xpath: str | None = None, *, target: str | None = None, action: str | None = None) -> int:
+        """
+        Drop entries for host whose xpath overlaps `xpath` (all of host's
+        entries when None), optionally only those of one read action.
+        """
+        with self._lock:
+            self._generations[host] = self._generations.get(host, 0) + 1
+            doomed = [k for k in self._data if k[0] == host and k[3] == target and (xpath is None or _overlaps(k[2], xpath)) and (action is None or k[1] == action)]
+            for k in doomed:
+                del self._data[k]
+        return len(doomed)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            for host in self._generations:
+                self._generations[host] += 1
+
+    def generation(self, host: str) -> int:
+        """Bumped by every invalidation of host; pass to store() to drop results read before it."""
+        with self._lock:
+            return self._generations.get(host, 0)
+
+    # ---- ops integration ----
+
+    def lookup(self, host: str, params: Mapping[str, Any], *, sanitized: bool) -> dict | None:
+        key = _read_key(host, params, sanitized)
+        return None if key is None else self.get(key)
+
+    def store(self, host: str, params: Mapping[str, Any], result: dict, *, sanitized: bool, generation: int | None = None) -> None:
+        """Cache result unless host was invalidated since `generation` was taken."""
+        key = _read_key(host, params, sanitized)
+        if key is not None:
+            self.put(key, result, generation=generation)
+
+    def observe_write(self, host: str, params: Mapping[str, Any]) -> None:
+        if params.get("type") == "commit":
+            # Commit changes Panorama's running config; commit-all (action=all) only pushes to devices.
+            if not params.get("action"):
+                self.invalidate(host, action="show")
+            return
+        if params.get("type") != "config" or params.get("action") not in WRITE_ACTIONS:
+            return
+        xpath = params.get("xpath")
+        # multi-config carries its xpaths inside the element; drop the whole host.
+        self.invalidate(host, str(xpath) if xpath else None, target=params.get("target"))
+
+
+def _read_key(host: str, params: Mapping[str, Any], sanitized: bool) -> CacheKey | None:
+    if params.get("type") != "config" or params.get("action") not in READ_ACTIONS:
+        return None
+    keys = set(params) - {"type", "action", "xpath", "target"}
+    if keys or not params.get("xpath"):
+        return None
+    return host, str(params["action"]), str(params["xpath"]), params.get("target"), sanitized
+
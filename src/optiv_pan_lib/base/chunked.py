@@ -0,0 +1,100 @@
+# src/optiv_pan_lib/base/chunked.py
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Iterable, Iterator, List, Sequence
+from urllib.parse import quote
+
+from optiv_pan_lib.base import ops
+from optiv_pan_lib.base.session import PanoramaSession
+
+DEFAULT_CHUNK_SIZE = 500
+DEFAULT_MAX_XPATH_BYTES = 6 * 1024  # percent-encoded; config get/show are GETs and request lines are capped near 8 KiB
+
+
+def xpath_literal(value: str) -> str:
+    """XPath 1.0 string literal for value (concat() when it holds both quote kinds)."""
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    parts = value.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{p}'" for p in parts) + ")"
+
+
+def entry_names(*, session: PanoramaSession, xpath: str, candidate: bool = True) -> List[str]:
+    """Names of the <entry> children of the container at xpath, in config order (one light call)."""
+    fetch = ops.config_get_element if candidate else ops.config_show_element
+    root = fetch(session=session, xpath=f"{xpath}/entry/@name")
+    return [n for n in (e.get("name") for e in root.iter("entry")) if n]
+
+
+def name_batches(names: Iterable[str], *, xpath: str, chunk_size: int = DEFAULT_CHUNK_SIZE, max_xpath_bytes: int = DEFAULT_MAX_XPATH_BYTES) -> Iterator[str]:
+    """
+    xpath/entry[@name=... or @name=...] selectors covering names, each with at
+    most chunk_size names and max_xpath_bytes of xpath as it goes out in the
+    query string (percent-encoded, where '@', quotes, brackets, '/' and
+    spaces take three bytes each). A name that alone exceeds the byte budget
+    still gets its own selector.
+    """
+    head = f"{xpath}/entry["
+    base = len(quote(head, safe="")) + len(quote("]", safe=""))
+    sep = len(quote(" or ", safe=""))
+    terms: List[str] = []
+    size = base
+    for name in names:
+        term = f"@name={xpath_literal(name)}"
+        n = len(quote(term, safe="")) + sep
+        if terms and (len(terms) >= chunk_size or size + n > max_xpath_bytes):
+            yield head + " or ".join(terms) + "]"
+            terms, size = [], base
+        terms.append(term)
+        size += n
+    if terms:
+        yield head + " or ".join(terms) + "]"
+
+
+def iter_batches(
+        *,
+        session: PanoramaSession,
+        xpath: str,
+        candidate: bool = True,
+        names: Sequence[str] | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_xpath_bytes: int = DEFAULT_MAX_XPATH_BYTES,
+        max_workers: int = 1,
+        ) -> Iterator[ET.Element]:
+    """
+    Read a large entry container as a series of <result> Elements, each
+    holding up to chunk_size <entry> nodes, in config order.
+
+    Entry names are listed first (entry/@name), then fetched in batches with
+    name-predicate xpaths; with max_workers > 1 that many batches are fetched
+    ahead while earlier ones are consumed. Unlike a single config get this
+    is not one snapshot: entries created after the name listing are not
+    returned and deleted ones are silently skipped. Closing the generator
+    early cancels queued batches.
+    """
+    if names is None:
+        names = entry_names(session=session, xpath=xpath, candidate=candidate)
+    fetch = ops.config_get_element if candidate else ops.config_show_element
+    selectors = name_batches(names, xpath=xpath, chunk_size=chunk_size, max_xpath_bytes=max_xpath_bytes)
+
+    if max_workers <= 1:
+        for sel in selectors:
+            yield fetch(session=session, xpath=sel)
+        return
+
+    pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pan-chunked")
+    try:
+        window: Deque[Future[ET.Element]] = deque()
+        for sel in selectors:
+            window.append(pool.submit(fetch, session=session, xpath=sel))
+            if len(window) > max_workers:
+                yield window.popleft().result()
+        while window:
+            yield window.popleft().result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,145 @@
+# src/optiv_pan_lib/base/keystore.py
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import stat
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Iterator, Protocol
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+
+class KeyStorePermissionError(PermissionError):
+    """Key store file is not private to the current user."""
+
+
+class KeyStore(Protocol):
+    """Where PanoramaSession keeps API keys between sessions/processes."""
+
+    def get(self, host: str, username: str) -> str | None:
+        ...
+
+    def put(self, host: str, username: str, key: str) -> None:
+        ...
+
+    def discard(self, host: str, username: str) -> None:
+        ...
+
+
+def _ident(host: str, username: str) -> str:
+    return f"{username}@{host.lower()}"
+
+
+class MemoryKeyStore:
+    """Process-local key store; share one instance across sessions."""
+
+    def __init__(self) -> None:
+        self._keys: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def get(self, host: str, username: str) -> str | None:
+        with self._lock:
+            return self._keys.get(_ident(host, username))
+
+    def put(self, host: str, username: str, key: str) -> None:
+        with self._lock:
+            self._keys[_ident(host, username)] = key
+
+    def discard(self, host: str, username: str) -> None:
+        with self._lock:
+            self._keys.pop(_ident(host, username), None)
+
+
+class FileKeyStore:
+    """
+    JSON file of API keys shared across processes.
+
+    The file is created 0600 and written atomically; a sidecar '<path>.lock'
+    serializes read-modify-write cycles between processes. On POSIX the file
+    must be owned by the current user and not group/other accessible,
+    otherwise KeyStorePermissionError is raised.
+    """
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path).expanduser()
+        self._lock_path = self.path.with_name(self.path.name + ".lock")
+        self._thread_lock = threading.Lock()
+
+    def get(self, host: str, username: str) -> str | None:
+        with self._locked():
+            return self._read().get(_ident(host, username))
+
+    def put(self, host: str, username: str, key: str) -> None:
+        with self._locked():
+            data = self._read()
+            data[_ident(host, username)] = key
+            self._write(data)
+
+    def discard(self, host: str, username: str) -> None:
+        with self._locked():
+            data = self._read()
+            if data.pop(_ident(host, username), None) is not None:
+                self._write(data)
+
+    # ---- internals ----
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        if not self.path.parent.exists():
+            self.path.parent.mkdir(parents=True, mode=0o700)
+        with self._thread_lock:
+            fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                else:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                try:
+                    yield
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(fd, fcntl.LOCK_UN)
+                    else:
+                        os.lseek(fd, 0, os.SEEK_SET)
+                        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            finally:
+                os.close(fd)
+
+    def _check_private(self) -> None:
+        if os.name != "posix":
+            return
+        st = self.path.stat()
+        if st.st_uid != os.getuid():
+            raise KeyStorePermissionError(f"{self.path} is not owned by the current user")
+        if stat.S_IMODE(st.st_mode) & 0o077:
+            raise KeyStorePermissionError(f"{self.path} must not be accessible by group/other (chmod 600)")
+
+    def _read(self) -> Dict[str, str]:
+        if not self.path.exists():
+            return {}
+        self._check_private()
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8") or "{}")
+        except ValueError:
+            return {}
+        return {str(k): str(v) for k, v in data.items()} if isinstance(data, dict) else {}
+
+    def _write(self, data: Dict[str, str]) -> None:
+        fd, tmp = tempfile.mkstemp(prefix=self.path.name + ".", dir=self.path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(data, fh)
+            os.chmod(tmp, 0o600)
+            os.replace(tmp, self.path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            raise
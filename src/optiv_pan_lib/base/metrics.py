@@ -0,0 +1,320 @@
+# src/optiv_pan_lib/base/metrics.py
+from __future__ import annotations
+
+import bisect
+import math
+import re
+import threading
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, TypeVar, Union
+
+from optiv_pan_lib.base.cache import _PREDICATE_RE
+
+T = TypeVar("T")
+
+LATENCY_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+PARSE_BUCKETS: Tuple[float, ...] = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+_CMD_TAG_RE = re.compile(r"<([A-Za-z][\w.-]*)")
+_CMD_DEPTH = 4
+
+
+@dataclass(slots=True, frozen=True)
+class CallMetrics:
+    """
+    One base.ops/base.async_ops call. Times are seconds.
+
+    latency covers the whole call (rate-limit waits, retries, backoff, parse);
+    parse_time/sanitize_time are the last attempt's XML parse and redaction.
+    error is the exception class name, None on success.
+    """
+    host: str
+    action: str
+    family: str
+    latency: float
+    response_bytes: int = 0
+    parse_time: float = 0.0
+    sanitize_time: float = 0.0
+    retries: int = 0
+    error: Optional[str] = None
+    cached: bool = False
+
+
+@dataclass(slots=True, frozen=True)
+class BuildMetrics:
+    """Model building from a parsed result (e.g. address from_xml)."""
+    family: str
+    seconds: float
+    count: int
+
+
+MetricsEvent = Union[CallMetrics, BuildMetrics]
+MetricsHook = Callable[[MetricsEvent], None]
+
+
+class CallTrace:
+    """Mutable per-call counters filled in by the ops layers."""
+    __slots__ = ("response_bytes", "parse_time", "sanitize_time", "retries", "cached")
+
+    def __init__(self) -> None:
+        self.response_bytes = 0
+        self.parse_time = 0.0
+        self.sanitize_time = 0.0
+        self.retries = 0
+        self.cached = False
+
+
+def xpath_family(xpath: str) -> str:
+    """xpath with predicates dropped: entry[@name='DG1']/address → entry/address."""
+    return _PREDICATE_RE.sub("", xpath)
+
+
+def cmd_family(cmd: str) -> str:
+    """Leading tags of an op command: <show><devices><connected/>… → show/devices/connected."""
+    return "/".join(_CMD_TAG_RE.findall(cmd)[:_CMD_DEPTH])
+
+
+def classify(params: Mapping[str, Any]) -> Tuple[str, str]:
+    """(action, family) for an XML API parameter set."""
+    t = str(params.get("type") or "")
+    if t == "config":
+        xpath = params.get("xpath")
+        return f"config/{params.get('action')}", xpath_family(str(xpath)) if xpath else ""
+    if t == "op":
+        return "op", cmd_family(str(params.get("cmd") or ""))
+    return t, ""
+
+
+def emit(hooks: Sequence[MetricsHook], event: MetricsEvent) -> None:
+    for hook in hooks:
+        hook(event)
+
+
+def report(session: Any, params: Mapping[str, Any], trace: CallTrace, latency: float, *, error: Optional[str] = None) -> None:
+    """Emit the CallMetrics for one finished call to session.metrics_hooks."""
+    action, family = classify(params)
+    emit(session.metrics_hooks, CallMetrics(
+        host=session.hostname,
+        action=action,
+        family=family,
+        latency=latency,
+        response_bytes=trace.response_bytes,
+        parse_time=trace.parse_time,
+        sanitize_time=trace.sanitize_time,
+        retries=trace.retries,
+        error=error,
+        cached=trace.cached,
+        ))
+
+
+def build(session: Any, family: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Call fn(*args, **kwargs) and report a BuildMetrics to session.metrics_hooks."""
+    hooks = session.metrics_hooks
+    if not hooks:
+        return fn(*args, **kwargs)
+    start = perf_counter()
+    out = fn(*args, **kwargs)
+    count = len(out) if hasattr(out, "__len__") else 1  # type: ignore[arg-type]
+    emit(hooks, BuildMetrics(family=family, seconds=perf_counter() - start, count=count))
+    return out
+
+
+# ---------------------------
+# In-process aggregation
+# ---------------------------
+
+class Histogram:
+    """Cumulative-bucket histogram (Prometheus layout) with interpolated quantiles. Not locked."""
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds: Tuple[float, ...] = tuple(sorted(bounds))
+        self.counts = [0] * (len(self.bounds) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """Linear interpolation inside the bucket holding rank q*count; NaN when empty."""
+        if not self.count:
+            return math.nan
+        rank = q * self.count
+        seen = 0
+        for i, c in enumerate(self.counts):
+            if c and seen + c >= rank:
+                if i == len(self.bounds):
+                    return self.bounds[-1] if self.bounds else math.nan
+                lo = self.bounds[i - 1] if i else 0.0
+                return lo + (self.bounds[i] - lo) * ((rank - seen) / c)
+            seen += c
+        return self.bounds[-1]
+
+
+@dataclass(slots=True)
+class CallStats:
+    latency: Histogram
+    parse: Histogram
+    response_bytes: int = 0
+    sanitize_seconds: float = 0.0
+    retries: int = 0
+    cached: int = 0
+    errors: Optional[Dict[str, int]] = None
+
+
+@dataclass(slots=True)
+class BuildStats:
+    seconds: Histogram
+    objects: int = 0
+
+
+SeriesKey = Tuple[str, str, str]  # (host, action, family)
+
+
+class MetricsAggregator:
+    """
+    Built-in metrics hook: keeps histograms per (host, action, family).
+
+        agg = MetricsAggregator()
+        session.metrics_hooks.append(agg)
+        ...
+        for row in agg.summary()[:10]:
+            print(row)
+        text = to_prometheus(agg)
+
+    Thread-safe; one instance may be shared by many sessions.
+    """
+
+    def __init__(self, *, latency_buckets: Sequence[float] = LATENCY_BUCKETS, parse_buckets: Sequence[float] = PARSE_BUCKETS):
+        self.latency_buckets = tuple(latency_buckets)
+        self.parse_buckets = tuple(parse_buckets)
+        self.calls: Dict[SeriesKey, CallStats] = {}
+        self.builds: Dict[str, BuildStats] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: MetricsEvent) -> None:
+        with self._lock:
+            if isinstance(event, BuildMetrics):
+                b = self.builds.get(event.family)
+                if b is None:
+                    b = self.builds[event.family] = BuildStats(seconds=Histogram(self.parse_buckets))
+                b.seconds.observe(event.seconds)
+                b.objects += event.count
+                return
+
+            key = (event.host, event.action, event.family)
+            s = self.calls.get(key)
+            if s is None:
+                s = self.calls[key] = CallStats(latency=Histogram(self.latency_buckets), parse=Histogram(self.parse_buckets))
+            s.latency.observe(event.latency)
+            if event.cached:
+                s.cached += 1
+            elif event.error is None:
+                s.parse.observe(event.parse_time)
+            s.response_bytes += event.response_bytes
+            s.sanitize_seconds += event.sanitize_time
+            s.retries += event.retries
+            if event.error is not None:
+                if s.errors is None:
+                    s.errors = {}
+                s.errors[event.error] = s.errors.get(event.error, 0) + 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls.clear()
+            self.builds.clear()
+
+    def percentile(self, key: SeriesKey, q: float) -> float:
+        """Latency quantile (0..1) for one series; NaN when unseen."""
+        with self._lock:
+            s = self.calls.get(key)
+            return s.latency.quantile(q) if s is not None else math.nan
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """One row per series, slowest p99 first."""
+        rows: List[Dict[str, Any]] = []
+        with self._lock:
+            for (host, action, family), s in self.calls.items():
+                n = s.latency.count
+                rows.append({
+                    "host": host,
+                    "action": action,
+                    "family": family,
+                    "count": n,
+                    "p50": s.latency.quantile(0.5),
+                    "p90": s.latency.quantile(0.9),
+                    "p99": s.latency.quantile(0.99),
+                    "mean": s.latency.sum / n if n else math.nan,
+                    "parse_seconds": s.parse.sum,
+                    "sanitize_seconds": s.sanitize_seconds,
+                    "response_bytes": s.response_bytes,
+                    "retries": s.retries,
+                    "cached": s.cached,
+                    "errors": dict(s.errors or {}),
+                })
+        rows.sort(key=lambda r: (-r["p99"], r["host"], r["action"], r["family"]))
+        return rows
+
+
+# ---------------------------
+# Prometheus text exposition
+# ---------------------------
+
+def _esc(v: str) -> str:
+    return v.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**kv: str) -> str:
+    return "{" + ",".join(f'{k}="{_esc(v)}"' for k, v in kv.items()) + "}"
+
+
+def _num(v: float) -> str:
+    if math.isinf(v):
+        return "+Inf"
+    return repr(float(v)) if isinstance(v, float) else str(v)
+
+
+def _histogram_lines(name: str, h: Histogram, labels: Dict[str, str]) -> List[str]:
+    lines: List[str] = []
+    cumulative = 0
+    for bound, c in zip(h.bounds + (math.inf,), h.counts):
+        cumulative += c
+        lines.append(f"{name}_bucket{_labels(**labels, le=_num(bound))} {cumulative}")
+    lines.append(f"{name}_sum{_labels(**labels)} {_num(h.sum)}")
+    lines.append(f"{name}_count{_labels(**labels)} {h.count}")
+    return lines
+
+
+def to_prometheus(agg: MetricsAggregator, *, prefix: str = "panos_api") -> str:
+    """Render agg in the Prometheus text format (version 0.0.4)."""
+    families: Dict[str, Tuple[str, str, List[str]]] = {}
+
+    def add(name: str, kind: str, help_: str, lines: List[str]) -> None:
+        families.setdefault(name, (kind, help_, []))[2].extend(lines)
+
+    with agg._lock:
+        for (host, action, family), s in sorted(agg.calls.items()):
+            lb = {"host": host, "action": action, "family": family}
+            add(f"{prefix}_request_duration_seconds", "histogram", "XML API call latency including retries.", _histogram_lines(f"{prefix}_request_duration_seconds", s.latency, lb))
+            add(f"{prefix}_parse_duration_seconds", "histogram", "XML parse time of successful uncached responses.", _histogram_lines(f"{prefix}_parse_duration_seconds", s.parse, lb))
+            add(f"{prefix}_sanitize_seconds_total", "counter", "Time spent redacting results.", [f"{prefix}_sanitize_seconds_total{_labels(**lb)} {_num(s.sanitize_seconds)}"])
+            add(f"{prefix}_response_bytes_total", "counter", "Response body bytes received.", [f"{prefix}_response_bytes_total{_labels(**lb)} {s.response_bytes}"])
+            add(f"{prefix}_retries_total", "counter", "Retried attempts.", [f"{prefix}_retries_total{_labels(**lb)} {s.retries}"])
+            add(f"{prefix}_cache_hits_total", "counter", "Calls served from the response cache.", [f"{prefix}_cache_hits_total{_labels(**lb)} {s.cached}"])
+            for err, n in sorted((s.errors or {}).items()):
+                add(f"{prefix}_errors_total", "counter", "Failed calls by exception class.", [f"{prefix}_errors_total{_labels(**lb, error=err)} {n}"])
+        for family, b in sorted(agg.builds.items()):
+            lb = {"family": family}
+            add(f"{prefix}_build_duration_seconds", "histogram", "Model building time (from_xml).", _histogram_lines(f"{prefix}_build_duration_seconds", b.seconds, lb))
+            add(f"{prefix}_build_objects_total", "counter", "Objects built.", [f"{prefix}_build_objects_total{_labels(**lb)} {b.objects}"])
+
+    out: List[str] = []
+    for name, (kind, help_, lines) in families.items():
+        out.append(f"# HELP {name} {help_}")
+        out.append(f"# TYPE {name} {kind}")
+        out.extend(lines)
+    return "\n".join(out) + "\n" if out else ""
@@ -1,13 +1,27 @@
 # src/optiv_pan_lib/providers/pan/ops.py
 from __future__ import annotations
 
-from time import sleep
-from typing import Any, Dict
+import xml.etree.ElementTree as ET
+from time import perf_counter, sleep
+from typing import Any, Callable, Dict, Iterable, Iterator
 
 import requests
 
-from optiv_pan_lib.base.session import PanoramaHTTPError, PanoramaSession, PanoramaTimeoutError
-from optiv_pan_lib.base.util import parse_xml, sanitize
+from optiv_pan_lib.base import metrics
+from optiv_pan_lib.base.metrics import CallTrace
+from optiv_pan_lib.base.retry import CircuitOpenError
+from optiv_pan_lib.base.session import (
+    PanoramaAPIError,
+    PanoramaAPIKeyError,
+    PanoramaCircuitOpenError,
+    PanoramaHTTPError,
+    PanoramaSession,
+    PanoramaTimeoutError,
+)
+from optiv_pan_lib.base.stream import Subtree, iter_subtrees
+from optiv_pan_lib.base.util import parse_xml, sanitize, sanitize_element
+
+STREAM_CHUNK_SIZE = 1 << 16
 
 
 def _check_status(doc: dict) -> None:
@@ -15,59 +29,305 @@ def _check_status(doc: dict) -> None:
     if resp.get("@status") == "success":
         return
     msg = (resp.get("msg", {}) or {}).get("#text") or resp.get("msg") or "PAN-OS XML API error"
-    raise PanoramaHTTPError(str(msg))
+    if resp.get("@code") == "403":
+        raise PanoramaAPIKeyError(str(msg))
+    raise PanoramaAPIError(str(msg))
+
+
+def _check_status_element(root: ET.Element) -> None:
+    if root.tag != "response" or root.get("status") == "success":
+        return
+    msg = " ".join(t.strip() for t in root.itertext() if t.strip()) or "PAN-OS XML API error"
+    if root.get("code") == "403":
+        raise PanoramaAPIKeyError(msg)
+    raise PanoramaAPIError(msg)
 
 
 def _result(doc: dict) -> dict:
     return (doc.get("response") or {}).get("result") or {}
 
 
-def _call(*, session: PanoramaSession, method: str, params: Dict[str, Any], retries: int = 3, backoff: float = 0.5) -> dict:
+def _retriable_status(status: int | None) -> bool:
+    return (status == 429) or (isinstance(status, int) and 500 <= status < 600)
+
+
+def _parse_result(text: str, *, sanitize_result: bool, trace: CallTrace | None = None) -> dict:
+    if trace is None:
+        doc = parse_xml(text)
+        _check_status(doc)
+        result = _result(doc)
+        if sanitize_result:
+            sanitize(result)
+        return result
+
+    trace.response_bytes = len(text.encode("utf-8"))
+    start = perf_counter()
+    doc = parse_xml(text)
+    trace.parse_time = perf_counter() - start
+    _check_status(doc)
+    result = _result(doc)
+    if sanitize_result:
+        start = perf_counter()
+        sanitize(result)
+        trace.sanitize_time = perf_counter() - start
+    return result
+
+
+def _parse_result_element(data: bytes, *, sanitize_result: bool, trace: CallTrace | None = None) -> ET.Element:
+    """_parse_result without xmltodict: the <result> Element (empty if absent)."""
+    start = perf_counter()
+    root = ET.fromstring(data)
+    if trace is not None:
+        trace.response_bytes = len(data)
+        trace.parse_time = perf_counter() - start
+    _check_status_element(root)
+    result = root.find("result")
+    if result is None:
+        return ET.Element("result")
+    if sanitize_result:
+        start = perf_counter()
+        sanitize_element(result)
+        if trace is not None:
+            trace.sanitize_time = perf_counter() - start
+    return result
+
+
+def _call(*, session: PanoramaSession, method: str, params: Dict[str, Any], retries: int | None = None, backoff: float | None = None, as_element: bool = False) -> Any:
+    """
+    Send one XML API call and return response.result: a dict, or the raw
+    <result> Element when `as_element` (uncached; no xmltodict pass).
+    retries/backoff override session.retry_policy for this call only.
+    Reports a CallMetrics to session.metrics_hooks, if any.
+    """
     m = method.strip().upper()
     if m not in {"GET", "POST"}:
         # Not a transport failure. Fail fast, no retry.
         raise NotImplementedError(f"Unsupported method: {method}")
 
-    for attempt in range(retries + 1):
+    hooks = session.metrics_hooks
+    if not hooks:
+        return _call_cached(session=session, method=m, params=params, retries=retries, backoff=backoff, trace=None, as_element=as_element)
+
+    trace = CallTrace()
+    start = perf_counter()
+    try:
+        result = _call_cached(session=session, method=m, params=params, retries=retries, backoff=backoff, trace=trace, as_element=as_element)
+    except Exception as e:
+        metrics.report(session, params, trace, perf_counter() - start, error=type(e).__name__)
+        raise
+    metrics.report(session, params, trace, perf_counter() - start)
+    return result
+
+
+def _call_cached(*, session: PanoramaSession, method: str, params: Dict[str, Any], retries: int | None, backoff: float | None, trace: CallTrace | None, as_element: bool = False) -> Any:
+    if as_element:
+        return _send_authed(session=session, method=method, params=params, retries=retries, backoff=backoff, trace=trace, as_element=True)
+
+    cache = session.cache
+    if cache is not None:
+        cached = cache.lookup(session.base_url, params, sanitized=session.sanitize)
+        if cached is not None:
+            if trace is not None:
+                trace.cached = True
+            return cached
+        if method == "POST":
+            try:
+                return _send_authed(session=session, method=method, params=params, retries=retries, backoff=backoff, trace=trace)
+            finally:
+                cache.observe_write(session.base_url, params)
+
+    generation = cache.generation(session.base_url) if cache is not None else None
+    result = _send_authed(session=session, method=method, params=params, retries=retries, backoff=backoff, trace=trace)
+    if cache is not None:
+        cache.store(session.base_url, params, result, sanitized=session.sanitize, generation=generation)
+    return result
+
+
+def _send_authed(*, session: PanoramaSession, method: str, params: Dict[str, Any], retries: int | None, backoff: float | None, trace: CallTrace | None = None, as_element: bool = False) -> Any:
+    """_send, refreshing the API key once if Panorama rejects it."""
+    stale = session.api_key
+    try:
+        return _send(session=session, method=method, params=params, retries=retries, backoff=backoff, trace=trace, as_element=as_element)
+    except PanoramaAPIKeyError:
+        session.refresh_api_key(stale)
+    if trace is not None:
+        trace.retries += 1
+    return _send(session=session, method=method, params=params, retries=retries, backoff=backoff, trace=trace, as_element=as_element)
+
+
+def _send(*, session: PanoramaSession, method: str, params: Dict[str, Any], retries: int | None, backoff: float | None, trace: CallTrace | None = None, as_element: bool = False) -> Any:
+    def send() -> requests.Response:
+        return session.get("", params=params) if method == "GET" else session.post("", data=params)
+
+    r = _request(session=session, send=send, params=params, retries=retries, backoff=backoff, trace=trace)
+    if as_element:
+        return _parse_result_element(r.content, sanitize_result=session.sanitize, trace=trace)
+    return _parse_result(r.text, sanitize_result=session.sanitize, trace=trace)
+
+
+def _request(*, session: PanoramaSession, send: Callable[[], requests.Response], params: Dict[str, Any], retries: int | None, backoff: float | None, trace: CallTrace | None = None) -> requests.Response:
+    """
+    Run send() under session.retry_policy until a 2xx response arrives.
+    Every attempt first takes a token from session.rate_limiter, if set.
+    Transport failures and 429/5xx feed the breaker and are retried with
+    backoff (honoring Retry-After); other HTTP errors are raised at once.
+    """
+    policy = session.retry_policy
+    attempt = 0
+    while True:
         try:
-            r = session.get("", params=params) if m == "GET" else session.post("", data=params)
+            probe = policy.admit(first=attempt == 0)
+        except CircuitOpenError as e:
+            raise PanoramaCircuitOpenError(str(e)) from None
+        try:
+            if session.rate_limiter is not None:
+                session.rate_limiter.acquire(session.hostname, params)
+
+            retry_after: str | None = None
+            try:
+                r = send()
+                try:
+                    r.raise_for_status()
+                except requests.HTTPError as e:
+                    r.close()
+                    status = r.status_code
+                    if not _retriable_status(status):
+                        policy.record_success()
+                        probe = False
+                        err = PanoramaAPIKeyError if status == 403 else PanoramaHTTPError
+                        raise err(f"HTTP {status}: {e}") from None
+                    policy.record_failure()
+                    reason, retry_after = f"HTTP {status}", r.headers.get("Retry-After")
+                    failure: PanoramaHTTPError = PanoramaHTTPError(f"HTTP {status}: {e}")
+                else:
+                    policy.record_success()
+                    return r
+
+            except (requests.Timeout, requests.ConnectTimeout, requests.ReadTimeout) as e:
+                # Timeouts: retry, then raise a distinct error
+                policy.record_failure()
+                reason, failure = "timeout", PanoramaTimeoutError(str(e))
+
+            except requests.ConnectionError as e:
+                # TCP resets / DNS / connection aborted: retry then surface
+                policy.record_failure()
+                reason, failure = "connection", PanoramaHTTPError(str(e))
+
+            except requests.RequestException as e:
+                # Other client-side errors: do not retry
+                policy.release(probe)
+                probe = False
+                raise PanoramaHTTPError(str(e)) from None
+        except BaseException:
+            # Anything not recorded above (cancellation, a raising rate limiter, ...)
+            # must not leave a half-open probe claimed.
+            policy.release(probe)
+            raise
+
+        delay = policy.next_delay(attempt, host=session.base_url, reason=reason, retry_after=retry_after, retries=retries, backoff=backoff)
+        if delay is None:
+            raise failure from None
+        sleep(delay)
+        attempt += 1
+        if trace is not None:
+            trace.retries += 1
+
+
+def _stream(*, session: PanoramaSession, params: Dict[str, Any], chunk_size: int = STREAM_CHUNK_SIZE, retries: int | None = None, backoff: float | None = None, trace: CallTrace | None = None) -> Iterator[bytes]:
+    """
+    GET with a streamed body. Retries apply until the response headers arrive;
+    once body chunks have been handed out, failures are raised, not retried.
+    With a trace, time spent waiting on the network is subtracted from
+    trace.parse_time (see _subtrees).
+    """
+    def send() -> requests.Response:
+        return session.get("", params=params, stream=True)
+
+    start = perf_counter()
+    stale = session.api_key
+    try:
+        r = _request(session=session, send=send, params=params, retries=retries, backoff=backoff, trace=trace)
+    except PanoramaAPIKeyError:
+        session.refresh_api_key(stale)
+        if trace is not None:
+            trace.retries += 1
+        r = _request(session=session, send=send, params=params, retries=retries, backoff=backoff, trace=trace)
+
+    try:
+        if trace is None:
+            yield from r.iter_content(chunk_size=chunk_size)
+            return
+        trace.parse_time -= perf_counter() - start
+        chunks = r.iter_content(chunk_size=chunk_size)
+        while True:
+            start = perf_counter()
+            chunk = next(chunks, None)
+            trace.parse_time -= perf_counter() - start
+            if chunk is None:
+                return
+            trace.response_bytes += len(chunk)
+            yield chunk
+    except requests.Timeout as e:
+        raise PanoramaTimeoutError(str(e)) from None
+    except requests.RequestException as e:
+        raise PanoramaHTTPError(str(e)) from None
+    finally:
+        r.close()
+
+
+def _subtrees_authed(*, session: PanoramaSession, params: Dict[str, Any], select: Iterable[str], trace: CallTrace | None) -> Iterator[Subtree]:
+    """
+    iter_subtrees over _stream. An in-body code 403 that arrives before any
+    subtree was handed out refreshes the API key and restarts the request once.
+    """
+    stale = session.api_key
+    started = False
+    try:
+        for item in iter_subtrees(_stream(session=session, params=params, trace=trace), select, redact=session.sanitize):
+            started = True
+            yield item
+        return
+    except PanoramaAPIKeyError:
+        if started:
+            raise
+    session.refresh_api_key(stale)
+    if trace is not None:
+        trace.retries += 1
+    yield from iter_subtrees(_stream(session=session, params=params, trace=trace), select, redact=session.sanitize)
 
+
+def _subtrees(*, session: PanoramaSession, params: Dict[str, Any], select: Iterable[str]) -> Iterator[Subtree]:
+    """
+    iter_subtrees over a streamed GET. Reports one CallMetrics when the
+    stream ends, fails or is closed early: latency is the time spent inside
+    this generator (not the consumer's time between items), parse_time the
+    part of it not spent waiting on the network (redaction included).
+    """
+    if not session.metrics_hooks:
+        yield from _subtrees_authed(session=session, params=params, select=select, trace=None)
+        return
+
+    trace = CallTrace()
+    items = _subtrees_authed(session=session, params=params, select=select, trace=trace)
+    busy = 0.0
+    error: str | None = None
+    try:
+        while True:
+            start = perf_counter()
             try:
-                r.raise_for_status()
-            except requests.HTTPError as e:
-                status = getattr(e.response, "status_code", None)
-                retriable = (status == 429) or (isinstance(status, int) and 500 <= status < 600)
-                if retriable and attempt < retries:
-                    sleep(backoff * (2 ** attempt))
-                    continue
-                raise PanoramaHTTPError(f"HTTP {status}: {e}") from None
-
-            doc = parse_xml(r.text)
-            _check_status(doc)
-            result = _result(doc)
-            if session.sanitize:
-                sanitize(result)
-            return result
-
-        except (requests.Timeout, requests.ConnectTimeout, requests.ReadTimeout) as e:
-            # Timeouts: retry, then raise a distinct error
-            if attempt < retries:
-                sleep(backoff * (2 ** attempt))
-                continue
-            raise PanoramaTimeoutError(str(e)) from None
-
-        except requests.ConnectionError as e:
-            # TCP resets / DNS / connection aborted: retry then surface
-            if attempt < retries:
-                sleep(backoff * (2 ** attempt))
-                continue
-            raise PanoramaHTTPError(str(e)) from None
-
-        except requests.RequestException as e:
-            # Other client-side errors: do not retry
-            raise PanoramaHTTPError(str(e)) from None
-
-    raise PanoramaHTTPError("Request failed after retries.")
+                item = next(items)
+            except StopIteration:
+                return
+            finally:
+                busy += perf_counter() - start
+            yield item
+    except Exception as e:
+        error = type(e).__name__
+        raise
+    finally:
+        items.close()
+        trace.parse_time += busy
+        metrics.report(session, params, trace, busy, error=error)
 
 
 # ---------------------------
@@ -82,6 +342,28 @@ def config_get(*, session: PanoramaSession, xpath: str) -> dict:
     return _call(session=session, method="GET", params={"type": "config", "action": "get", "xpath": xpath})
 
 
+def config_show_element(*, session: PanoramaSession, xpath: str) -> ET.Element:
+    """config_show returning the <result> Element (uncached, no xmltodict pass)."""
+    return _call(session=session, method="GET", params={"type": "config", "action": "show", "xpath": xpath}, as_element=True)
+
+
+def config_get_element(*, session: PanoramaSession, xpath: str) -> ET.Element:
+    """config_get returning the <result> Element (uncached, no xmltodict pass)."""
+    return _call(session=session, method="GET", params={"type": "config", "action": "get", "xpath": xpath}, as_element=True)
+
+
+def config_show_subtrees(*, session: PanoramaSession, xpath: str, select: Iterable[str]) -> Iterator[Subtree]:
+    """Streaming config_show: yield only the subtrees named by `select` as they arrive (uncached)."""
+    params: Dict[str, Any] = {"type": "config", "action": "show", "xpath": xpath}
+    return _subtrees(session=session, params=params, select=select)
+
+
+def config_get_subtrees(*, session: PanoramaSession, xpath: str, select: Iterable[str]) -> Iterator[Subtree]:
+    """Streaming config_get: yield only the subtrees named by `select` as they arrive (uncached)."""
+    params: Dict[str, Any] = {"type": "config", "action": "get", "xpath": xpath}
+    return _subtrees(session=session, params=params, select=select)
+
+
 def config_set(*, session: PanoramaSession, xpath: str, element: str) -> dict:
     return _call(session=session, method="POST", params={"type": "config", "action": "set", "xpath": xpath, "element": element}, )
 
@@ -102,6 +384,14 @@ def config_clone(*, session: PanoramaSession, xpath: str, newname: str) -> dict:
     return _call(session=session, method="POST", params={"type": "config", "action": "clone", "xpath": xpath, "newname": newname}, )
 
 
+def config_multi(*, session: PanoramaSession, element: str) -> dict:
+    """
+    Several config operations in one request.
+    element: "<multi-configure-request><edit id=.. xpath=..>...</edit>...</multi-configure-request>"
+    """
+    return _call(session=session, method="POST", params={"type": "config", "action": "multi-config", "element": element}, )
+
+
 def config_move(*, session: PanoramaSession, xpath: str, where: str, dst: str | None = None) -> dict:
     p: Dict[str, Any] = {"type": "config", "action": "move", "xpath": xpath, "where": where}
     if dst:
@@ -109,6 +399,19 @@ def config_move(*, session: PanoramaSession, xpath: str, where: str, dst: str |
     return _call(session=session, method="POST", params=p)
 
 
+def export_configuration_subtrees(*, session: PanoramaSession, select: Iterable[str], name: str | None = None) -> Iterator[Subtree]:
+    """
+    Download the whole configuration (type=export, category=configuration)
+    in one streamed request and yield only the subtrees named by `select`.
+    Running config by default; `name` exports a saved config file instead.
+    Uncached. The document has no <response> envelope, so paths start at /config.
+    """
+    params: Dict[str, Any] = {"type": "export", "category": "configuration"}
+    if name:
+        params["from"] = name
+    return _subtrees(session=session, params=params, select=select)
+
+
 # ---------------------------
 # Operational API (returns response.result)
 # ---------------------------
@@ -120,6 +423,31 @@ def op(*, session: PanoramaSession, cmd: str) -> dict:
     return _call(session=session, method="GET", params={"type": "op", "cmd": cmd})
 
 
+def op_subtrees(*, session: PanoramaSession, cmd: str, select: Iterable[str]) -> Iterator[Subtree]:
+    """
+    Streaming op: parse the response as it arrives and yield only the
+    subtrees named by `select` (see stream.SubtreeParser).
+    """
+    params: Dict[str, Any] = {"type": "op", "cmd": cmd}
+    return _subtrees(session=session, params=params, select=select)
+
+
+# ---------------------------
+# Commit API (returns response.result)
+# ---------------------------
+
+def commit(*, session: PanoramaSession, cmd: str, action: str | None = None) -> dict:
+    """
+    type=commit request; the result carries the enqueued <job> id, if any.
+    Example cmd: "<commit><description>x</description></commit>";
+    action="all" with "<commit-all>...</commit-all>" pushes to devices.
+    """
+    p: Dict[str, Any] = {"type": "commit", "cmd": cmd}
+    if action:
+        p["action"] = action
+    return _call(session=session, method="POST", params=p)
+
+
 # ---------------------------
 # Panorama → device proxy ops/config
 # ---------------------------
@@ -135,6 +463,17 @@ def op_on_device(*, session: "PanoramaSession", cmd: str, target: str, vsys: str
     return _call(session=session, method="GET", params=params)
 
 
+def op_on_device_subtrees(*, session: "PanoramaSession", cmd: str, target: str, select: Iterable[str], vsys: str | None = None, ) -> Iterator[Subtree]:
+    """
+    Streaming op_on_device: yields only the subtrees named by `select`
+    while the response body is still downloading.
+    """
+    params: Dict[str, Any] = {"type": "op", "cmd": cmd, "target": target}
+    if vsys:
+        params["vsys"] = vsys
+    return _subtrees(session=session, params=params, select=select)
+
+
 def config_show_on_device(*, session: "PanoramaSession", xpath: str, target: str, ) -> dict:
     """
     Fetch RUNNING config node from device via Panorama proxy.
@@ -0,0 +1,103 @@
+# src/optiv_pan_lib/base/ratelimit.py
+from __future__ import annotations
+
+import asyncio
+import threading
+from time import monotonic, sleep
+from typing import Any, Callable, Dict, Literal, Mapping, Optional, Tuple
+
+from optiv_pan_lib.base.cache import READ_ACTIONS, WRITE_ACTIONS
+
+Kind = Literal["read", "write"]
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at `rate` tokens/s up to `burst`.
+
+    Callers reserve tokens under a short lock and then wait outside it, so the
+    same bucket serves threads (acquire) and coroutines (acquire_async), and
+    waiters are served in arrival order.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None, *, clock: Callable[[], float] = monotonic):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self._clock = clock
+        self._tokens = self.burst
+        self._stamp = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, n: float = 1.0) -> float:
+        """Take n tokens (possibly going into debt); return seconds to wait before using them."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+            self._stamp = now
+            self._tokens -= n
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self, n: float = 1.0) -> None:
+        wait = self.reserve(n)
+        if wait > 0:
+            sleep(wait)
+
+    async def acquire_async(self, n: float = 1.0) -> None:
+        wait = self.reserve(n)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+def classify(params: Mapping[str, Any]) -> Optional[Kind]:
+    """read: config show/get and op; write: config writes and commit; None: not limited (keygen)."""
+    t = params.get("type")
+    if t == "config":
+        action = params.get("action")
+        if action in READ_ACTIONS:
+            return "read"
+        if action in WRITE_ACTIONS:
+            return "write"
+        return None
+    if t in ("op", "export", "log", "report"):
+        return "read"
+    if t in ("commit", "import"):
+        return "write"
+    return None
+
+
+class HostRateLimiter:
+    """
+    Token buckets per (hostname, read|write), created on first use.
+
+    Thread-safe and usable from asyncio. Assign one instance to every session
+    that talks to the same Panoramas (`session.rate_limiter = limiter`) so the
+    whole process stays under the management plane's limits.
+    """
+
+    def __init__(self, *, read_rate: float = 10.0, read_burst: Optional[float] = None, write_rate: float = 2.0, write_burst: Optional[float] = None):
+        self._limits: Dict[Kind, Tuple[float, Optional[float]]] = {"read": (read_rate, read_burst), "write": (write_rate, write_burst)}
+        self._buckets: Dict[Tuple[str, Kind], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, host: str, kind: Kind) -> TokenBucket:
+        key = (host.lower(), kind)
+        b = self._buckets.get(key)
+        if b is None:
+            with self._lock:
+                b = self._buckets.get(key)
+                if b is None:
+                    rate, burst = self._limits[kind]
+                    b = self._buckets[key] = TokenBucket(rate, burst)
+        return b
+
+    def acquire(self, host: str, params: Mapping[str, Any]) -> None:
+        kind = classify(params)
+        if kind is not None:
+            self.bucket(host, kind).acquire()
+
+    async def acquire_async(self, host: str, params: Mapping[str, Any]) -> None:
+        kind = classify(params)
+        if kind is not None:
+            await self.bucket(host, kind).acquire_async()
@@ -0,0 +1,216 @@
+# src/optiv_pan_lib/base/retry.py
+from __future__ import annotations
+
+import random
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from time import monotonic
+from typing import Callable, Literal, Optional
+
+BreakerState = Literal["closed", "open", "half-open"]
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised by CircuitBreaker.admit() while the host is considered unhealthy."""
+
+
+@dataclass(slots=True, frozen=True)
+class RetryEvent:
+    """Passed to RetryPolicy.on_retry before sleeping. attempt is 1-based."""
+    host: str
+    attempt: int
+    delay: float
+    reason: str
+
+
+def parse_retry_after(value: str | None, *, now: Callable[[], datetime] = lambda: datetime.now(timezone.utc)) -> Optional[float]:
+    """Retry-After header → seconds (delta-seconds or HTTP-date); None if absent/invalid."""
+    if not value:
+        return None
+    v = value.strip()
+    if v.isdigit():
+        return float(v)
+    try:
+        when = parsedate_to_datetime(v)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - now()).total_seconds())
+
+
+class RetryBudget:
+    """
+    Caps retries relative to traffic: every first attempt deposits `ratio`
+    tokens, every retry withdraws one. `min_per_second` tokens trickle in
+    regardless so low-traffic callers can still retry. Thread-safe.
+    """
+
+    def __init__(self, *, ratio: float = 0.2, min_per_second: float = 1.0, max_tokens: float = 20.0, clock: Callable[[], float] = monotonic):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self._clock = clock
+        self._tokens = max_tokens
+        self._stamp = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.max_tokens, self._tokens + (now - self._stamp) * self.min_per_second)
+        self._stamp = now
+
+    def record_request(self) -> None:
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            self._refill()
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+
+class CircuitBreaker:
+    """
+    closed → open after `failure_threshold` consecutive transport failures
+    (timeouts, connection errors, 429/5xx). While open, admit() raises
+    CircuitOpenError. After `reset_timeout` one probe is admitted (half-open);
+    its success closes the circuit, its failure re-opens it. A probe that
+    reports nothing within `probe_timeout` is presumed lost and the next
+    call becomes the probe. admit() returns True for the probe; only that
+    caller's release() frees the probe slot. Thread-safe.
+    """
+
+    def __init__(self, *, failure_threshold: int = 5, reset_timeout: float = 30.0, probe_timeout: float = 60.0, clock: Callable[[], float] = monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.probe_timeout = probe_timeout
+        self._clock = clock
+        self._state: BreakerState = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._probe_started = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> BreakerState:
+        return self._state
+
+    def admit(self) -> bool:
+        """True when the caller is the half-open probe; raises CircuitOpenError when failing fast."""
+        with self._lock:
+            if self._state == "closed":
+                return False
+            if self._state == "open" and self._clock() - self._opened_at >= self.reset_timeout:
+                self._state = "half-open"
+                self._probing = False
+            if self._state == "half-open" and (not self._probing or self._clock() - self._probe_started >= self.probe_timeout):
+                self._probing = True
+                self._probe_started = self._clock()
+                return True
+            wait = max(0.0, self.reset_timeout - (self._clock() - self._opened_at))
+            raise CircuitOpenError(f"circuit open; retry in {wait:.1f}s")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = "closed"
+            self._failures = 0
+            self._probing = False
+
+    def release(self, probe: bool) -> None:
+        """End an admitted call that says nothing about host health; probe is what admit() returned."""
+        if not probe:
+            return
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == "half-open" or self._failures >= self.failure_threshold:
+                self._state = "open"
+                self._opened_at = self._clock()
+                self._probing = False
+
+
+@dataclass(slots=True)
+class RetryPolicy:
+    """
+    Retry rules used by base.ops / base.async_ops.
+
+    Backoff is exponential (backoff * 2**attempt, capped at max_backoff) with
+    full jitter. A 429/503 Retry-After header wins over the computed delay.
+    Each session gets its own policy (and so its own budget and breaker);
+    assign one instance to several sessions to share them.
+    """
+    retries: int = 3
+    backoff: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    respect_retry_after: bool = True
+    max_retry_after: float = 120.0
+    budget: Optional[RetryBudget] = field(default_factory=RetryBudget)
+    breaker: Optional[CircuitBreaker] = field(default_factory=CircuitBreaker)
+    on_retry: Optional[Callable[[RetryEvent], None]] = None
+
+    def admit(self, *, first: bool) -> bool:
+        """
+        Call before every attempt; raises CircuitOpenError when failing fast.
+        Returns True when this attempt is the breaker's half-open probe.
+        """
+        probe = self.breaker.admit() if self.breaker is not None else False
+        if first and self.budget is not None:
+            self.budget.record_request()
+        return probe
+
+    def record_success(self) -> None:
+        if self.breaker is not None:
+            self.breaker.record_success()
+
+    def record_failure(self) -> None:
+        if self.breaker is not None:
+            self.breaker.record_failure()
+
+    def release(self, probe: bool) -> None:
+        """End an attempt without recording success or failure; probe is what admit() returned."""
+        if self.breaker is not None:
+            self.breaker.release(probe)
+
+    def next_delay(
+            self,
+            attempt: int,
+            *,
+            host: str,
+            reason: str,
+            retry_after: str | None = None,
+            retries: int | None = None,
+            backoff: float | None = None,
+            ) -> Optional[float]:
+        """
+        Seconds to sleep before retry number attempt+1, or None to give up
+        (attempts exhausted or budget spent). Fires on_retry when retrying.
+        """
+        if attempt >= (self.retries if retries is None else retries):
+            return None
+        if self.budget is not None and not self.budget.try_spend():
+            return None
+
+        base = self.backoff if backoff is None else backoff
+        delay = min(self.max_backoff, base * (2 ** attempt))
+        if self.jitter:
+            delay = random.uniform(0.0, delay)
+        if self.respect_retry_after:
+            hinted = parse_retry_after(retry_after)
+            if hinted is not None:
+                delay = min(hinted, self.max_retry_after)
+
+        if self.on_retry is not None:
+            self.on_retry(RetryEvent(host=host, attempt=attempt + 1, delay=delay, reason=reason))
+        return delay
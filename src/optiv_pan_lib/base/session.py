@@ -1,15 +1,23 @@
 # src/optiv_pan_lib/providers/pan/session.py
 from __future__ import annotations
 
+import socket
 import ssl
-from typing import Callable, Union, overload
+import threading
+from typing import Any, Callable, List, Optional, Tuple, Union, overload
 
 import requests
 import truststore
 import xmltodict
 from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 from urllib3.poolmanager import PoolManager
 
+from optiv_pan_lib.base.cache import ResponseCache
+from optiv_pan_lib.base.keystore import KeyStore
+from optiv_pan_lib.base.metrics import MetricsHook
+from optiv_pan_lib.base.ratelimit import HostRateLimiter
+from optiv_pan_lib.base.retry import RetryPolicy
 from optiv_pan_lib.config import AppConfig, PanoramaConfig
 
 try:
@@ -28,17 +36,58 @@ class PanoramaHTTPError(RuntimeError):
     """HTTP or API-layer error returned while talking to Panorama."""
 
 
+class PanoramaAPIError(PanoramaHTTPError):
+    """PAN-OS XML API answered with status != success (request was rejected)."""
+
+
+class PanoramaAPIKeyError(PanoramaAuthError, PanoramaAPIError):
+    """API key rejected by Panorama (HTTP 403 / code 403)."""
+
+
 class PanoramaTimeoutError(PanoramaHTTPError):
     """Request timed out (after retries) while communicating with Panorama."""
 
 
-class _NoVerifyAdapter(HTTPAdapter):
+class PanoramaCircuitOpenError(PanoramaHTTPError):
+    """Call refused without contacting Panorama: the circuit breaker is open."""
+
+
+SocketOptions = List[Tuple[int, int, int]]
+
+
+def _socket_options(pano: PanoramaConfig) -> Optional[SocketOptions]:
+    """TCP keep-alive options for pooled sockets; None keeps urllib3 defaults."""
+    if not pano.keepalive:
+        return None
+    opts: SocketOptions = list(HTTPConnection.default_socket_options)
+    opts.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    if pano.keepalive_idle is not None:
+        idle_opt = getattr(socket, "TCP_KEEPIDLE", None) or getattr(socket, "TCP_KEEPALIVE", None)  # Linux / macOS
+        if idle_opt is not None:
+            opts.append((socket.IPPROTO_TCP, idle_opt, max(1, int(pano.keepalive_idle))))
+    if pano.keepalive_interval is not None and hasattr(socket, "TCP_KEEPINTVL"):
+        opts.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, max(1, int(pano.keepalive_interval))))
+    return opts
+
+
+class _PooledAdapter(HTTPAdapter):
+    def __init__(self, *, socket_options: Optional[SocketOptions] = None, **kwargs: Any):
+        self._socket_options = socket_options  # read by init_poolmanager during super().__init__
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self._socket_options is not None:
+            pool_kwargs["socket_options"] = self._socket_options
+        self.poolmanager = PoolManager(num_pools=connections, maxsize=maxsize, block=block, **pool_kwargs)
+
+
+class _NoVerifyAdapter(_PooledAdapter):
     def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
         ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
         ctx.check_hostname = False
         ctx.verify_mode = ssl.CERT_NONE
         pool_kwargs["ssl_context"] = ctx
-        self.poolmanager = PoolManager(num_pools=connections, maxsize=maxsize, block=block, **pool_kwargs)
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
 
     def proxy_manager_for(self, proxy, **proxy_kwargs):
         ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
@@ -71,18 +120,23 @@ def _redact(text: str, secret: str) -> str:
         return "[REDACTED]"
 
 
-def _api_key(*, base_url: str, username: str, password_get: Callable[[], str], verify: VerifyType, timeout: float) -> str:
+def _api_key(*, http: requests.Session, base_url: str, username: str, password_get: Callable[[], str], verify: VerifyType, timeout: float) -> str:
     pwd = password_get()
     try:
-        r = requests.request("POST", base_url, params={"type": "keygen", "user": username, "password": pwd}, verify=verify, timeout=timeout, )
+        # Plain Session.request: shares http's pool without PanoramaSession's key injection.
+        r = requests.Session.request(http, "POST", base_url, params={"type": "keygen", "user": username, "password": pwd}, verify=verify, timeout=timeout, )
         r.raise_for_status()
     except requests.RequestException as e:
         raise PanoramaHTTPError(f"Panorama connection error: {_redact(str(e), pwd)}") from None
     finally:
         pwd = ""
 
+    return _parse_api_key(r.text)
+
+
+def _parse_api_key(text: str) -> str:
     try:
-        data = xmltodict.parse(r.text)
+        data = xmltodict.parse(text)
         key = data.get("response", {}).get("result", {}).get("key")
     except Exception as e:
         raise PanoramaAuthError("Keygen parse error.") from e
@@ -92,11 +146,13 @@ def _api_key(*, base_url: str, username: str, password_get: Callable[[], str], v
 
 
 def _require_pano_cfg(obj: PanoramaConfig | AppConfig) -> PanoramaConfig:
-    if isinstance(obj, PanoramaConfig):
-        return obj
     if isinstance(obj, AppConfig) and obj.panorama:
-        return obj.panorama
-    raise ValueError("PanoramaConfig is required. Pass a PanoramaConfig or an AppConfig with .panorama populated.")
+        obj = obj.panorama
+    if not isinstance(obj, PanoramaConfig):
+        raise ValueError("PanoramaConfig is required. Pass a PanoramaConfig or an AppConfig with .panorama populated.")
+    if obj.scheme not in ("https", "http"):
+        raise ValueError(f"Unsupported scheme: {obj.scheme!r} (expected 'https' or 'http')")
+    return obj
 
 
 class PanoramaSession(requests.Session):
@@ -108,36 +164,109 @@ class PanoramaSession(requests.Session):
       - AppConfig (must have .panorama)
 
     Raises ValueError if config is missing.
+
+    With a `key_store`, a stored API key for (hostname, username) is reused
+    instead of calling keygen; new keys are written back. A key rejected by
+    Panorama is refreshed once and the call retried (see base.ops).
     """
 
     @overload
-    def __init__(self, cfg: PanoramaConfig):
+    def __init__(self, cfg: PanoramaConfig, *, key_store: KeyStore | None = None):
         ...
 
     @overload
-    def __init__(self, cfg: AppConfig):
+    def __init__(self, cfg: AppConfig, *, key_store: KeyStore | None = None):
         ...
 
-    def __init__(self, cfg: PanoramaConfig | AppConfig):
+    def __init__(self, cfg: PanoramaConfig | AppConfig, *, key_store: KeyStore | None = None):
         super().__init__()
         pano = _require_pano_cfg(cfg)
 
-        self.base_url = f"https://{pano.hostname}/api/"
+        self.base_url = f"{pano.scheme}://{pano.hostname}/api/"
         self.timeout = pano.timeout
         self.verify = pano.verify
         self.sanitize = pano.sanitize
+        self.cache: ResponseCache | None = None  # opt-in; see base.cache
+        self.retry_policy = RetryPolicy()
+        self.rate_limiter: HostRateLimiter | None = None  # opt-in; share one across sessions
+        self.metrics_hooks: List[MetricsHook] = []  # see base.metrics
 
+        self._pool_maxsize = pano.pool_maxsize
+        adapter_cls = _PooledAdapter
         if pano.verify is False:
             _silence_verify_warnings()
-            adapter = _NoVerifyAdapter()
-            self.mount("https://", adapter)
-            self.mount("http://", adapter)
+            adapter_cls = _NoVerifyAdapter
+        adapter = adapter_cls(
+            socket_options=_socket_options(pano),
+            pool_connections=pano.pool_connections,
+            pool_maxsize=pano.pool_maxsize,
+            pool_block=pano.pool_block,
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+        self.hostname = pano.hostname
+        self.key_store = key_store
+        self._username = pano.username
+        self._password_get = pano.password.get
+        self._key_lock = threading.Lock()
+
+        if pano.prewarm > 0:
+            self.prewarm(pano.prewarm)
+
+        stored = key_store.get(pano.hostname, pano.username) if key_store is not None else None
+        self.api_key = stored or self._keygen()
+
+    def _keygen(self) -> str:
+        key = _api_key(http=self, base_url=self.base_url, username=self._username, password_get=self._password_get, verify=self.verify, timeout=self.timeout, )
+        if self.key_store is not None:
+            self.key_store.put(self.hostname, self._username, key)
+        return key
+
+    def prewarm(self, n: int) -> int:
+        """
+        Open up to n connections (TCP + TLS) to Panorama and park them in the
+        pool so the first concurrent calls skip the handshake. Best effort:
+        returns how many were opened; never exceeds pool_maxsize.
+        """
+        adapter = self.get_adapter(self.base_url)
+        if not isinstance(adapter, HTTPAdapter):
+            return 0
+        try:
+            pool = adapter.get_connection_with_tls_context(requests.Request("GET", self.base_url).prepare(), self.verify, proxies=self.proxies or None, )
+        except Exception:
+            return 0
 
-        self.api_key = _api_key(base_url=self.base_url, username=pano.username, password_get=pano.password.get, verify=self.verify, timeout=self.timeout, )
+        opened = []
+        try:
+            for _ in range(min(n, self._pool_maxsize)):
+                conn = pool._get_conn(timeout=0)
+                opened.append(conn)
+                if not conn.is_connected:
+                    conn.timeout = self.timeout
+                    conn.connect()
+        except Exception:
+            pass
+        finally:
+            for conn in opened:
+                pool._put_conn(conn)
+        return sum(1 for c in opened if c.is_connected)
+
+    def refresh_api_key(self, stale: str | None = None) -> str:
+        """
+        Replace a rejected key. Concurrent callers passing the same `stale`
+        key trigger a single keygen.
+        """
+        with self._key_lock:
+            if stale is None or stale == self.api_key:
+                if self.key_store is not None:
+                    self.key_store.discard(self.hostname, self._username)
+                self.api_key = self._keygen()
+            return self.api_key
 
     def request(self, method: str, url: str, **kwargs):
         full_url = url if url.startswith("http") else (self.base_url + url.lstrip("/"))
-        params = kwargs.pop("params", {}) or {}
+        params = dict(kwargs.pop("params", {}) or {})
         params.setdefault("key", self.api_key)
         kwargs["params"] = params
         kwargs.setdefault("timeout", self.timeout)
@@ -0,0 +1,183 @@
+# src/optiv_pan_lib/base/stream.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+from xml.parsers import expat
+
+from optiv_pan_lib.base.session import PanoramaAPIError, PanoramaAPIKeyError
+from optiv_pan_lib.base.util import DEFAULT_FORCE_LIST, sanitize
+
+# Envelope elements stripped from Subtree.path for XML API responses.
+_ENVELOPE = ("response", "result")
+
+
+@dataclass(slots=True, frozen=True)
+class Subtree:
+    """
+    One selected element, materialized in the same shape parse_xml() produces.
+
+    path: XPath-like location including @name predicates, e.g.
+          /config/devices/entry[@name='localhost.localdomain']/vsys/entry[@name='vsys1']/address
+    """
+    path: str
+    tag: str
+    node: Any
+
+
+class SubtreeParser:
+    """
+    Incremental (expat) parser that only materializes selected subtrees.
+
+    Selectors are tag names or '/'-joined tag paths matched against the end of
+    an element's path: "address" matches every <address>, "vsys/entry/address"
+    only vsys-level ones. Elements outside a selected subtree are never built,
+    so memory stays proportional to the largest selected subtree.
+
+    `redact` applies util.sanitize() to each subtree before it is returned.
+    For <response status="..."> documents the API status is checked when the
+    root closes; non-success raises PanoramaAPIError (PanoramaAPIKeyError for
+    code 403, as in ops._check_status).
+    """
+
+    def __init__(self, select: Iterable[str], *, force_list: Iterable[str] | None = None, redact: bool = False):
+        self._selectors: List[Tuple[str, ...]] = [tuple(p for p in s.strip("/").split("/") if p) for s in select]
+        self._selectors = [s for s in self._selectors if s]
+        if not self._selectors:
+            raise ValueError("at least one subtree selector is required")
+        self._force_list = frozenset(str(t) for t in (force_list or DEFAULT_FORCE_LIST))
+        self._redact = redact
+
+        self._tags: List[str] = []
+        self._steps: List[str] = []
+        self._depth_kept: Optional[int] = None
+        self._stack: List[Tuple[Optional[dict], List[str]]] = []
+        self._ready: List[Subtree] = []
+
+        self.status: Optional[str] = None
+        self.code: Optional[str] = None
+        self._error_text: List[str] = []
+
+        p = expat.ParserCreate()
+        p.buffer_text = True
+        p.StartElementHandler = self._start
+        p.EndElementHandler = self._end
+        p.CharacterDataHandler = self._chars
+        self._parser = p
+
+    # ---- feeding ----
+
+    def feed(self, chunk: bytes) -> List[Subtree]:
+        """Parse the next chunk; return subtrees completed by it."""
+        self._parser.Parse(chunk, False)
+        return self._drain()
+
+    def close(self) -> List[Subtree]:
+        """Finish the document; return any remaining subtrees."""
+        self._parser.Parse(b"", True)
+        return self._drain()
+
+    def _drain(self) -> List[Subtree]:
+        out, self._ready = self._ready, []
+        return out
+
+    # ---- expat callbacks ----
+
+    def _start(self, tag: str, attrs: dict) -> None:
+        self._tags.append(tag)
+        name = attrs.get("name")
+        self._steps.append(f"{tag}[@name='{name}']" if name is not None else tag)
+
+        if len(self._tags) == 1 and tag == "response":
+            self.status = attrs.get("status")
+            self.code = attrs.get("code")
+
+        if self._depth_kept is None and self._selected():
+            self._depth_kept = len(self._tags)
+
+        if self._depth_kept is not None:
+            self._stack.append(({f"@{k}": v for k, v in attrs.items()} or None, []))
+
+    def _chars(self, data: str) -> None:
+        if self._stack:
+            self._stack[-1][1].append(data)
+        elif self.status not in (None, "success"):
+            self._error_text.append(data)
+
+    def _end(self, tag: str) -> None:
+        depth = len(self._tags)
+        if self._depth_kept is not None:
+            item, parts = self._stack.pop()
+            text = "".join(parts).strip()
+            if item is None:
+                value: Any = text or None
+            else:
+                if text:
+                    item["#text"] = text
+                value = item
+
+            if depth == self._depth_kept:
+                node = {tag: value}
+                if self._redact:
+                    sanitize(node)
+                self._ready.append(Subtree(path=self._path(), tag=tag, node=node[tag]))
+                self._depth_kept = None
+            else:
+                self._push(tag, value)
+
+        if depth == 1 and self.status not in (None, "success"):
+            msg = " ".join(t.strip() for t in self._error_text if t.strip()) or "PAN-OS XML API error"
+            raise (PanoramaAPIKeyError if self.code == "403" else PanoramaAPIError)(msg)
+
+        self._tags.pop()
+        self._steps.pop()
+
+    # ---- helpers ----
+
+    def _push(self, tag: str, value: Any) -> None:
+        item, parts = self._stack[-1]
+        if item is None:
+            item = {}
+            self._stack[-1] = (item, parts)
+        if tag in item:
+            cur = item[tag]
+            if isinstance(cur, list):
+                cur.append(value)
+            else:
+                item[tag] = [cur, value]
+        else:
+            item[tag] = [value] if tag in self._force_list else value
+
+    def _selected(self) -> bool:
+        tags = self._tags
+        for sel in self._selectors:
+            n = len(sel)
+            if n <= len(tags) and tuple(tags[-n:]) == sel:
+                return True
+        return False
+
+    def _path(self) -> str:
+        steps = self._steps
+        if self._tags[:1] == [_ENVELOPE[0]]:
+            steps = steps[1:]
+            if self._tags[1:2] == [_ENVELOPE[1]]:
+                steps = steps[1:]
+        return "/" + "/".join(steps)
+
+
+def iter_subtrees(
+        chunks: Iterable[bytes],
+        select: Iterable[str],
+        *,
+        force_list: Iterable[str] | None = None,
+        redact: bool = False,
+        ) -> Iterator[Subtree]:
+    """
+    Stream-parse an XML document from byte chunks, yielding selected subtrees
+    as soon as each one closes.
+    """
+    parser = SubtreeParser(select, force_list=force_list, redact=redact)
+    for chunk in chunks:
+        if chunk:
+            yield from parser.feed(chunk)
+    yield from parser.close()
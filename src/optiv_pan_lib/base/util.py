@@ -1,6 +1,8 @@
 # src/optiv_lib/providers/pan/util.py
 from __future__ import annotations
 
+import xml.etree.ElementTree as ET
+from functools import lru_cache
 from typing import Any, Callable, Iterable
 
 import xmltodict
@@ -8,11 +10,16 @@ import xmltodict
 DEFAULT_FORCE_LIST: Iterable[str | Callable[..., bool]] = ("entry", "member", "line")
 SENSITIVE_KEYS = {"pre-shared-key", "private-key", "public-key", "key", "bind-password", "password", "secret", "auth-password", "priv-password", "phash"}
 
+@lru_cache(maxsize=1024)
+def _is_sensitive(name: str) -> bool:
+    n = name.lower()
+    return n in SENSITIVE_KEYS or any(token in n for token in SENSITIVE_KEYS)
+
+
 def sanitize(branch: dict) -> None:
     """Recursively remove sensitive fields from nested PAN-OS config dicts."""
     for k, v in list(branch.items()):
-        key_lower = k.lower()
-        if isinstance(v, str) and (any(token in key_lower for token in SENSITIVE_KEYS) or key_lower in SENSITIVE_KEYS):
+        if isinstance(v, str) and _is_sensitive(k):
             branch[k] = "<redacted>"
         elif isinstance(v, dict):
             sanitize(v)
@@ -27,6 +34,35 @@ def parse_xml(text: str, *, force_list: Iterable | None = None) -> dict:
     return xmltodict.parse(text, force_list=force_list or DEFAULT_FORCE_LIST)
 
 
+# ----------------------------
+# ElementTree helpers (fast path: no intermediate dicts)
+# ----------------------------
+
+def sanitize_element(root: ET.Element) -> None:
+    """sanitize() for an Element tree: redact text of sensitive leaf tags and sensitive attributes."""
+    for el in root.iter():
+        if _is_sensitive(el.tag) and len(el) == 0 and el.text is not None:
+            el.text = "<redacted>"
+        if el.attrib:
+            for a in el.attrib:
+                if _is_sensitive(a):
+                    el.attrib[a] = "<redacted>"
+
+
+def element_text(el: ET.Element | None) -> str | None:
+    """node_text() for an Element."""
+    if el is None or el.text is None:
+        return None
+    return el.text.strip() or None
+
+
+def element_members(el: ET.Element | None) -> list[str]:
+    """collect_members() for an Element."""
+    if el is None:
+        return []
+    return [v for v in (element_text(m) for m in el.iterfind("member")) if v]
+
+
 def node_text(node: Any) -> str | None:
     if node is None:
         return None
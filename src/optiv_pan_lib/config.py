@@ -33,6 +33,25 @@ def _as_float(v: Any, default: float) -> float:
     return default if v is None else float(v)
 
 
+def _as_opt_float(v: Any) -> Optional[float]:
+    v = _resolve(v)
+    return None if v is None else float(v)
+
+
+def _as_int(v: Any, default: int) -> int:
+    v = _resolve(v)
+    return default if v is None else int(v)
+
+
+def _as_bool(v: Any, default: bool) -> bool:
+    v = _resolve(v)
+    if v is None:
+        return default
+    if isinstance(v, bool):
+        return v
+    return str(v).strip().lower() in {"1", "true", "yes", "y", "on"}
+
+
 @dataclass(slots=True, frozen=True)
 class Secret:
     """Callable-backed secret; masked in str/repr."""
@@ -64,6 +83,16 @@ class PanoramaConfig:
     verify: VerifyType = True
     timeout: float = 15.0
     sanitize: bool = True
+    scheme: str = "https"  # "http" only for local stand-ins (optiv_pan_lib.testing)
+
+    # Connection pooling (requests/urllib3 HTTPAdapter)
+    pool_connections: int = 10  # host pools kept by the adapter
+    pool_maxsize: int = 10  # max connections kept per host
+    pool_block: bool = False  # wait for a free connection instead of opening extras
+    keepalive: bool = True  # TCP keep-alive on pooled sockets
+    keepalive_idle: Optional[float] = None  # seconds idle before first probe (OS default if None)
+    keepalive_interval: Optional[float] = None  # seconds between probes (OS default if None)
+    prewarm: int = 0  # connections opened at session start
 
 
 @dataclass(slots=True, frozen=True)
@@ -111,6 +140,14 @@ class AppConfig:
                     password=pw,
                     verify=_as_verify(pano_src.get("verify")),
                     timeout=_as_float(pano_src.get("timeout"), 15.0),
+                    scheme=str(_resolve(pano_src.get("scheme")) or "https").strip().lower(),
+                    pool_connections=_as_int(pano_src.get("pool_connections"), 10),
+                    pool_maxsize=_as_int(pano_src.get("pool_maxsize"), 10),
+                    pool_block=_as_bool(pano_src.get("pool_block"), False),
+                    keepalive=_as_bool(pano_src.get("keepalive"), True),
+                    keepalive_idle=_as_opt_float(pano_src.get("keepalive_idle")),
+                    keepalive_interval=_as_opt_float(pano_src.get("keepalive_interval")),
+                    prewarm=_as_int(pano_src.get("prewarm"), 0),
                 )
 
         extras_raw = data.get("app", {}) or {}
@@ -1,8 +1,11 @@
 # src/optiv_pan_lib/providers/pan/device/config/api.py
 from __future__ import annotations
 
-from optiv_pan_lib.base.ops import config_get_on_device, config_show_on_device, op_on_device
+from typing import Iterable, Iterator
+
+from optiv_pan_lib.base.ops import config_get_on_device, config_show_on_device, op_on_device, op_on_device_subtrees
 from optiv_pan_lib.base.session import PanoramaSession
+from optiv_pan_lib.base.stream import Subtree
 
 
 def get_effective_running_config(*, session: PanoramaSession, device_serial: str, ) -> dict:
@@ -15,6 +18,18 @@ def get_effective_running_config(*, session: PanoramaSession, device_serial: str
     return op_on_device(session=session, cmd=cmd, target=device_serial)
 
 
+def iter_effective_running_config(*, session: PanoramaSession, device_serial: str, select: Iterable[str], ) -> Iterator[Subtree]:
+    """
+    Streaming variant of get_effective_running_config.
+
+    Parses the body incrementally and yields only the subtrees named in
+    `select` (e.g. ("address", "address-group", "rulebase")); everything
+    else is discarded without being built.
+    """
+    cmd = "<show><config><running/></config></show>"
+    return op_on_device_subtrees(session=session, cmd=cmd, target=device_serial, select=select)
+
+
 def get_running_node(*, session: PanoramaSession, device_serial: str, xpath: str, ) -> dict:
     """
     Running config subtree at XPath on the device via Panorama proxy.
@@ -0,0 +1,142 @@
+# src/optiv_pan_lib/device/fleet/api.py
+from __future__ import annotations
+
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from optiv_pan_lib.base import ops
+from optiv_pan_lib.base.session import PanoramaSession
+
+DeviceCall = Callable[..., dict]  # fn(session=..., target=<serial>, **kwargs) -> inner 'result'
+
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_PER_PANORAMA = 8
+
+_SLOTS: Dict[str, Tuple[int, threading.BoundedSemaphore]] = {}  # base_url → (cap, semaphore)
+_SLOTS_LOCK = threading.Lock()
+
+
+@dataclass(slots=True, frozen=True)
+class DeviceResult:
+    """Outcome of one proxied call; exactly one of result/error is set."""
+    serial: str
+    result: Optional[dict] = None
+    error: Optional[BaseException] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def serials_from(targets: Iterable[Any]) -> List[str]:
+    """
+    Normalize targets to unique serials, preserving order.
+
+    Accepts serial strings, list_connected() entries (dicts with 'serial')
+    or any object with a .serial attribute.
+    """
+    seen: set[str] = set()
+    out: List[str] = []
+    for t in targets:
+        if isinstance(t, str):
+            serial = t
+        elif isinstance(t, Mapping):
+            serial = t.get("serial")
+        else:
+            serial = getattr(t, "serial", None)
+        s = ("" if serial is None else str(serial)).strip()
+        if s and s not in seen:
+            seen.add(s)
+            out.append(s)
+    return out
+
+
+def set_panorama_limit(session: PanoramaSession, cap: int) -> None:
+    """
+    Set the process-wide in-flight cap for session's Panorama. Calls already
+    running keep the old limit; later fan-outs use the new one.
+    """
+    cap = max(1, cap)
+    with _SLOTS_LOCK:
+        _SLOTS[session.base_url] = (cap, threading.BoundedSemaphore(cap))
+
+
+def _panorama_slot(session: PanoramaSession, cap: Optional[int]) -> threading.BoundedSemaphore:
+    """
+    Process-wide in-flight cap per Panorama, created on first use (cap or
+    DEFAULT_PER_PANORAMA). An explicit cap that differs from the registered
+    one raises; change it with set_panorama_limit().
+    """
+    with _SLOTS_LOCK:
+        entry = _SLOTS.get(session.base_url)
+        if entry is None:
+            n = max(1, DEFAULT_PER_PANORAMA if cap is None else cap)
+            entry = _SLOTS[session.base_url] = (n, threading.BoundedSemaphore(n))
+        elif cap is not None and max(1, cap) != entry[0]:
+            raise ValueError(f"per_panorama={cap} conflicts with the registered limit {entry[0]} for {session.base_url}; use set_panorama_limit()")
+        return entry[1]
+
+
+def _run_one(fn: DeviceCall, session: PanoramaSession, serial: str, slot: threading.BoundedSemaphore, kwargs: Dict[str, Any]) -> DeviceResult:
+    with slot:
+        start = perf_counter()
+        try:
+            result = fn(session=session, target=serial, **kwargs)
+        except Exception as exc:
+            return DeviceResult(serial=serial, error=exc, elapsed=perf_counter() - start)
+    return DeviceResult(serial=serial, result=result, elapsed=perf_counter() - start)
+
+
+def iter_on_devices(
+        fn: DeviceCall,
+        *,
+        session: PanoramaSession,
+        targets: Iterable[Any],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        per_panorama: Optional[int] = None,
+        **kwargs: Any,
+        ) -> Iterator[DeviceResult]:
+    """
+    Run fn(session=..., target=serial, **kwargs) for every target with bounded concurrency.
+
+    Results are yielded as they complete. Errors are captured per device and
+    never abort the fan-out. Closing the generator early cancels queued calls.
+    per_panorama sets the shared per-Panorama cap on first use and must match
+    it afterwards (see set_panorama_limit).
+    """
+    serials = serials_from(targets)
+    if not serials:
+        return
+    slot = _panorama_slot(session, per_panorama)
+    pool = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(serials))), thread_name_prefix="pan-fleet")
+    try:
+        pending: set[Future[DeviceResult]] = {pool.submit(_run_one, fn, session, s, slot, kwargs) for s in serials}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                yield fut.result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+# ---------------------------
+# Convenience wrappers over base.ops proxy calls
+# ---------------------------
+
+def iter_op_on_devices(*, session: PanoramaSession, targets: Iterable[Any], cmd: str, vsys: str | None = None, max_workers: int = DEFAULT_MAX_WORKERS, per_panorama: Optional[int] = None, ) -> Iterator[DeviceResult]:
+    """Operational command on many firewalls via Panorama proxy."""
+    return iter_on_devices(ops.op_on_device, session=session, targets=targets, max_workers=max_workers, per_panorama=per_panorama, cmd=cmd, vsys=vsys)
+
+
+def iter_running_node_on_devices(*, session: PanoramaSession, targets: Iterable[Any], xpath: str, max_workers: int = DEFAULT_MAX_WORKERS, per_panorama: Optional[int] = None, ) -> Iterator[DeviceResult]:
+    """RUNNING config subtree at XPath on many firewalls via Panorama proxy."""
+    return iter_on_devices(ops.config_show_on_device, session=session, targets=targets, max_workers=max_workers, per_panorama=per_panorama, xpath=xpath)
+
+
+def iter_candidate_node_on_devices(*, session: PanoramaSession, targets: Iterable[Any], xpath: str, max_workers: int = DEFAULT_MAX_WORKERS, per_panorama: Optional[int] = None, ) -> Iterator[DeviceResult]:
+    """CANDIDATE config subtree at XPath on many firewalls via Panorama proxy."""
+    return iter_on_devices(ops.config_get_on_device, session=session, targets=targets, max_workers=max_workers, per_panorama=per_panorama, xpath=xpath)
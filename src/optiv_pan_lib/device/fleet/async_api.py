@@ -0,0 +1,104 @@
+# src/optiv_pan_lib/device/fleet/async_api.py
+from __future__ import annotations
+
+import asyncio
+import weakref
+from time import perf_counter
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+from optiv_pan_lib.base import async_ops
+from optiv_pan_lib.base.async_session import AsyncPanoramaSession
+from optiv_pan_lib.device.fleet.api import DEFAULT_PER_PANORAMA, DeviceResult, serials_from
+
+AsyncDeviceCall = Callable[..., Awaitable[dict]]  # fn(session=..., target=<serial>, **kwargs) -> inner 'result'
+
+DEFAULT_CONCURRENCY = 64
+
+# asyncio primitives are bound to one event loop; keep per-loop slots.
+_SLOTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Tuple[int, asyncio.Semaphore]]]" = weakref.WeakKeyDictionary()
+
+
+def set_panorama_limit(session: AsyncPanoramaSession, cap: int) -> None:
+    """
+    Set the running loop's in-flight cap for session's Panorama. Calls already
+    running keep the old limit; later fan-outs use the new one.
+    """
+    cap = max(1, cap)
+    _SLOTS.setdefault(asyncio.get_running_loop(), {})[session.base_url] = (cap, asyncio.Semaphore(cap))
+
+
+def _panorama_slot(session: AsyncPanoramaSession, cap: Optional[int]) -> asyncio.Semaphore:
+    """
+    Per-loop in-flight cap per Panorama, created on first use (cap or
+    DEFAULT_PER_PANORAMA). An explicit cap that differs from the registered
+    one raises; change it with set_panorama_limit().
+    """
+    slots = _SLOTS.setdefault(asyncio.get_running_loop(), {})
+    entry = slots.get(session.base_url)
+    if entry is None:
+        n = max(1, DEFAULT_PER_PANORAMA if cap is None else cap)
+        entry = slots[session.base_url] = (n, asyncio.Semaphore(n))
+    elif cap is not None and max(1, cap) != entry[0]:
+        raise ValueError(f"per_panorama={cap} conflicts with the registered limit {entry[0]} for {session.base_url}; use set_panorama_limit()")
+    return entry[1]
+
+
+async def aiter_on_devices(
+        fn: AsyncDeviceCall,
+        *,
+        session: AsyncPanoramaSession,
+        targets: Iterable[Any],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        per_panorama: Optional[int] = None,
+        **kwargs: Any,
+        ) -> AsyncIterator[DeviceResult]:
+    """
+    Await fn(session=..., target=serial, **kwargs) for every target with bounded concurrency.
+
+    Results are yielded as they complete. Errors are captured per device and
+    never abort the fan-out. Closing the generator early cancels in-flight calls.
+    per_panorama sets the shared per-Panorama cap on first use and must match
+    it afterwards (see set_panorama_limit).
+    """
+    serials = serials_from(targets)
+    if not serials:
+        return
+    slot = _panorama_slot(session, per_panorama)
+    gate = asyncio.Semaphore(max(1, concurrency))
+
+    async def run_one(serial: str) -> DeviceResult:
+        async with gate, slot:
+            start = perf_counter()
+            try:
+                result = await fn(session=session, target=serial, **kwargs)
+            except Exception as exc:
+                return DeviceResult(serial=serial, error=exc, elapsed=perf_counter() - start)
+            return DeviceResult(serial=serial, result=result, elapsed=perf_counter() - start)
+
+    tasks = [asyncio.create_task(run_one(s)) for s in serials]
+    try:
+        for fut in asyncio.as_completed(tasks):
+            yield await fut
+    finally:
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+# ---------------------------
+# Convenience wrappers over base.async_ops proxy calls
+# ---------------------------
+
+def aiter_op_on_devices(*, session: AsyncPanoramaSession, targets: Iterable[Any], cmd: str, vsys: str | None = None, concurrency: int = DEFAULT_CONCURRENCY, per_panorama: Optional[int] = None, ) -> AsyncIterator[DeviceResult]:
+    """Operational command on many firewalls via Panorama proxy."""
+    return aiter_on_devices(async_ops.op_on_device, session=session, targets=targets, concurrency=concurrency, per_panorama=per_panorama, cmd=cmd, vsys=vsys)
+
+
+def aiter_running_node_on_devices(*, session: AsyncPanoramaSession, targets: Iterable[Any], xpath: str, concurrency: int = DEFAULT_CONCURRENCY, per_panorama: Optional[int] = None, ) -> AsyncIterator[DeviceResult]:
+    """RUNNING config subtree at XPath on many firewalls via Panorama proxy."""
+    return aiter_on_devices(async_ops.config_show_on_device, session=session, targets=targets, concurrency=concurrency, per_panorama=per_panorama, xpath=xpath)
+
+
+def aiter_candidate_node_on_devices(*, session: AsyncPanoramaSession, targets: Iterable[Any], xpath: str, concurrency: int = DEFAULT_CONCURRENCY, per_panorama: Optional[int] = None, ) -> AsyncIterator[DeviceResult]:
+    """CANDIDATE config subtree at XPath on many firewalls via Panorama proxy."""
+    return aiter_on_devices(async_ops.config_get_on_device, session=session, targets=targets, concurrency=concurrency, per_panorama=per_panorama, xpath=xpath)
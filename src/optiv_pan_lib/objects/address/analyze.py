@@ -0,0 +1,188 @@
+# src/optiv_pan_lib/objects/address/analyze.py
+from __future__ import annotations
+
+import ipaddress
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, Iterator, List, Mapping, Set, Tuple
+
+from .index import MAX_WILDCARD_BLOCKS, IndexedAddress, Scope, Span, spans_of
+from .model import AddressObject
+
+
+@dataclass(slots=True, frozen=True)
+class Containment:
+    """Every address of `inner` is also in `outer` (and the sets differ)."""
+    inner: IndexedAddress
+    outer: IndexedAddress
+
+
+@dataclass(slots=True, frozen=True)
+class Overlap:
+    """a and b share addresses but neither contains the other."""
+    a: IndexedAddress
+    b: IndexedAddress
+
+
+@dataclass(slots=True, frozen=True)
+class Aggregate:
+    """ip-netmask objects of one scope that collapse into a single, not yet existing, prefix."""
+    scope: Scope
+    prefix: str
+    members: tuple[IndexedAddress, ...]
+
+
+@dataclass(slots=True, frozen=True)
+class AddressAnalysis:
+    """
+    duplicates: groups (size >= 2) matching exactly the same addresses (fqdn: same name).
+    contained / overlapping: relations between distinct address sets; every
+    member of a duplicate group is reported.
+    skipped: wildcards too wide to expand (see index.MAX_WILDCARD_BLOCKS).
+    """
+    duplicates: tuple[tuple[IndexedAddress, ...], ...] = ()
+    contained: tuple[Containment, ...] = ()
+    overlapping: tuple[Overlap, ...] = ()
+    aggregates: tuple[Aggregate, ...] = ()
+    skipped: tuple[IndexedAddress, ...] = ()
+
+
+def _sort_key(r: IndexedAddress) -> Tuple[str, str]:
+    return r.scope or "", r.address.name
+
+
+def _sweep(groups: List[Tuple[Span, ...]]) -> Tuple[Dict[Tuple[int, int], int], Set[Tuple[int, int]]]:
+    """
+    One pass over all intervals sorted by (version, lo, -hi).
+
+    Returns (inside, touching): inside[(g, h)] counts intervals of group g lying
+    inside an interval of group h; touching holds every unordered (g, h) pair
+    with at least one overlapping interval. Active intervals all contain the
+    sweep point, so the work is O(n log n + pairs reported).
+    """
+    intervals = sorted(((v, lo, -hi, gid) for gid, spans in enumerate(groups) for v, lo, hi in spans))
+    inside: Dict[Tuple[int, int], int] = {}
+    touching: Set[Tuple[int, int]] = set()
+    active: List[Tuple[int, int, int]] = []  # (hi, lo, gid)
+    version = 0
+    for v, lo, neg_hi, gid in intervals:
+        hi = -neg_hi
+        if v != version:
+            version, active = v, []
+        active = [a for a in active if a[0] >= lo]
+        for a_hi, a_lo, a_gid in active:
+            if a_gid == gid:
+                continue
+            touching.add((a_gid, gid) if a_gid < gid else (gid, a_gid))
+            if a_hi >= hi:
+                inside[(gid, a_gid)] = inside.get((gid, a_gid), 0) + 1
+                if a_lo == lo and a_hi == hi:
+                    inside[(a_gid, gid)] = inside.get((a_gid, gid), 0) + 1
+        active.append((hi, lo, gid))
+    return inside, touching
+
+
+def _cidr_blocks(lo: int, hi: int, bits: int) -> Iterator[Tuple[int, int, int]]:
+    """Minimal CIDR cover of [lo, hi] as (lo, hi, prefixlen), ascending."""
+    while lo <= hi:
+        size = lo & -lo if lo else 1 << bits
+        while size > hi - lo + 1:
+            size >>= 1
+        yield lo, lo + size - 1, bits - size.bit_length() + 1
+        lo += size
+
+
+def _aggregates(scope: Scope, nets: Dict[Span, List[IndexedAddress]]) -> List[Aggregate]:
+    """
+    Integer equivalent of ipaddress.collapse_addresses: merge touching blocks
+    into runs, re-cut each run into CIDRs, and report the CIDRs that absorb
+    two or more existing prefixes without being one themselves.
+    """
+    out: List[Aggregate] = []
+    blocks = sorted(nets)
+    i = 0
+    while i < len(blocks):
+        v, run_lo, run_hi = blocks[i]
+        j = i + 1
+        while j < len(blocks) and blocks[j][0] == v and blocks[j][1] <= run_hi + 1:
+            run_hi = max(run_hi, blocks[j][2])
+            j += 1
+        if j - i >= 2:
+            bits = 32 if v == 4 else 128
+            k = i
+            for lo, hi, plen in _cidr_blocks(run_lo, run_hi, bits):
+                members: List[Span] = []
+                while k < j and blocks[k][1] <= hi:
+                    members.append(blocks[k])
+                    k += 1
+                if len(members) >= 2 and (v, lo, hi) not in nets:
+                    net = ipaddress.IPv4Network((lo, plen)) if v == 4 else ipaddress.IPv6Network((lo, plen))
+                    refs = sorted((r for m in members for r in nets[m]), key=_sort_key)
+                    out.append(Aggregate(scope=scope, prefix=str(net), members=tuple(refs)))
+        i = j
+    return out
+
+
+def analyze(scoped: Mapping[Scope, Iterable[AddressObject]], *, aggregate: bool = True, max_wildcard_blocks: int = MAX_WILDCARD_BLOCKS) -> AddressAnalysis:
+    """
+    Find duplicate, contained and partially overlapping address objects across
+    scopes (device group name, None = shared) in near-linear time, plus CIDR
+    aggregates for adjacent ip-netmask objects within each scope.
+
+    Objects are reduced to integer intervals (see index.spans_of), grouped by
+    identical interval sets, and the groups are swept once in address order.
+    Multi-block wildcards take part block by block: A is inside B when each of
+    A's blocks lies inside one of B's intervals.
+    """
+    by_key: Dict[Hashable, List[IndexedAddress]] = {}
+    skipped: List[IndexedAddress] = []
+    nets_by_scope: Dict[Scope, Dict[Span, List[IndexedAddress]]] = {}
+
+    for scope, objs in scoped.items():
+        for obj in objs:
+            ref = IndexedAddress(scope=scope, address=obj)
+            try:
+                spans = spans_of(obj, max_wildcard_blocks=max_wildcard_blocks)
+            except OverflowError:
+                skipped.append(ref)
+                continue
+            if spans is None:
+                key: Hashable = ("fqdn", obj.value)
+            else:
+                key = (spans[0],) if len(spans) == 1 else tuple(sorted(spans))
+                if aggregate and obj.kind == "ip-netmask":
+                    nets_by_scope.setdefault(scope, {}).setdefault(spans[0], []).append(ref)
+            by_key.setdefault(key, []).append(ref)
+
+    duplicates = tuple(sorted((tuple(sorted(refs, key=_sort_key)) for refs in by_key.values() if len(refs) > 1), key=lambda g: _sort_key(g[0])))
+
+    keys = [k for k in by_key if not (isinstance(k, tuple) and k and k[0] == "fqdn")]
+    groups: List[Tuple[Span, ...]] = keys  # type: ignore[assignment]
+    inside, touching = _sweep(groups)
+
+    contained: List[Containment] = []
+    overlapping: List[Overlap] = []
+    for g, h in touching:
+        g_in_h = inside.get((g, h), 0) == len(groups[g])
+        h_in_g = inside.get((h, g), 0) == len(groups[h])
+        gm, hm = by_key[keys[g]], by_key[keys[h]]
+        if g_in_h:
+            contained.extend(Containment(inner=a, outer=b) for a in gm for b in hm)
+        elif h_in_g:
+            contained.extend(Containment(inner=b, outer=a) for a in gm for b in hm)
+        else:
+            overlapping.extend(Overlap(a=a, b=b) if _sort_key(a) <= _sort_key(b) else Overlap(a=b, b=a) for a in gm for b in hm)
+    contained.sort(key=lambda c: (_sort_key(c.inner), _sort_key(c.outer)))
+    overlapping.sort(key=lambda o: (_sort_key(o.a), _sort_key(o.b)))
+
+    aggregates: List[Aggregate] = []
+    for scope, nets in nets_by_scope.items():
+        aggregates.extend(_aggregates(scope, nets))
+    aggregates.sort(key=lambda a: (a.scope or "", a.prefix))
+
+    return AddressAnalysis(
+        duplicates=duplicates,
+        contained=tuple(contained),
+        overlapping=tuple(overlapping),
+        aggregates=tuple(aggregates),
+        skipped=tuple(sorted(skipped, key=_sort_key)),
+        )
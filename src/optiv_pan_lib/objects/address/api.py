@@ -1,11 +1,16 @@
 # src/optiv_lib/providers/pan/objects/address/api.py
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Collection, Iterable, Iterator, List, Optional
 
-from optiv_pan_lib.base import ops
-from optiv_pan_lib.objects.address.model import AddressObject
-from optiv_pan_lib.objects.address.parser import from_xml
+from optiv_pan_lib.base import bulk, chunked, metrics, ops
+from optiv_pan_lib.base.bulk import BulkResult
+from optiv_pan_lib.objects import reconcile
+from optiv_pan_lib.objects.reconcile import ReconcileResult
+from optiv_pan_lib.objects.address.analyze import AddressAnalysis, analyze
+from optiv_pan_lib.objects.address.index import AddressIndex
+from optiv_pan_lib.objects.address.model import AddressKind, AddressObject
+from optiv_pan_lib.objects.address.parser import from_element, from_xml, iter_element, iter_entries
 from optiv_pan_lib.objects.address.serializer import entry_xpath, parent_xpath, to_xml
 from optiv_pan_lib.base.session import PanoramaSession
 
@@ -13,8 +18,55 @@ from optiv_pan_lib.base.session import PanoramaSession
 def list_addresses(*, session: PanoramaSession, candidate: bool = True, device_group: Optional[str] = None) -> List[AddressObject]:
     """List address objects from candidate or running config."""
     xpath = parent_xpath(device_group)
+    if session.cache is None:
+        # Fast path: model straight from the ElementTree, no xmltodict/sanitize dict passes.
+        root = ops.config_get_element(session=session, xpath=xpath) if candidate else ops.config_show_element(session=session, xpath=xpath)
+        return metrics.build(session, "address", from_element, root, strict=True)
     result = ops.config_get(session=session, xpath=xpath) if candidate else ops.config_show(session=session, xpath=xpath)
-    return from_xml(result, strict=True)
+    return metrics.build(session, "address", from_xml, result, strict=True)
+
+
+def iter_addresses(*, session: PanoramaSession, candidate: bool = True, device_group: Optional[str] = None, kinds: Optional[Collection[AddressKind]] = None, tags: Optional[Collection[str]] = None, name_prefix: Optional[str] = None, ) -> Iterator[AddressObject]:
+    """
+    Lazy list_addresses: the response is stream-parsed one <entry> at a
+    time and each AddressObject is built only when consumed, after the
+    kinds / tags / name_prefix filters (parser.iter_entries). Uncached.
+    """
+    xpath = parent_xpath(device_group)
+    fetch = ops.config_get_subtrees if candidate else ops.config_show_subtrees
+    subtrees = fetch(session=session, xpath=xpath, select=("address/entry",))
+    return iter_entries((st.node for st in subtrees), strict=True, kinds=kinds, tags=tags, name_prefix=name_prefix)
+
+
+def iter_addresses_chunked(*, session: PanoramaSession, candidate: bool = True, device_group: Optional[str] = None, chunk_size: int = chunked.DEFAULT_CHUNK_SIZE, max_workers: int = 1, kinds: Optional[Collection[AddressKind]] = None, tags: Optional[Collection[str]] = None, name_prefix: Optional[str] = None, ) -> Iterator[AddressObject]:
+    """
+    list_addresses for very large containers: names first, then entries in batches of
+    chunk_size (max_workers fetched ahead), yielded as each batch arrives.
+    name_prefix narrows the name list before any entry is fetched.
+    See base.chunked.iter_batches for the consistency caveat.
+    """
+    xpath = parent_xpath(device_group)
+    names = chunked.entry_names(session=session, xpath=xpath, candidate=candidate)
+    if name_prefix is not None:
+        names = [n for n in names if n.startswith(name_prefix)]
+    for root in chunked.iter_batches(session=session, xpath=xpath, candidate=candidate, names=names, chunk_size=chunk_size, max_workers=max_workers):
+        yield from metrics.build(session, "address", lambda r: list(iter_element(r, strict=True, kinds=kinds, tags=tags)), root)
+
+
+def index_addresses(*, session: PanoramaSession, device_groups: Iterable[Optional[str]] = (None,), candidate: bool = True) -> AddressIndex:
+    """
+    AddressIndex over the address objects of each scope (None = shared).
+    Keep it current with index.add()/remove() as objects change.
+    """
+    idx = AddressIndex()
+    for dg in device_groups:
+        idx.extend(list_addresses(session=session, candidate=candidate, device_group=dg), scope=dg)
+    return idx
+
+
+def analyze_addresses(*, session: PanoramaSession, device_groups: Iterable[Optional[str]] = (None,), candidate: bool = True) -> AddressAnalysis:
+    """Duplicate / contained / overlapping objects and CIDR aggregates across the given scopes (None = shared)."""
+    return analyze({dg: list_addresses(session=session, candidate=candidate, device_group=dg) for dg in device_groups})
 
 
 def create_address(address_object: AddressObject, *, device_group: Optional[str], session: PanoramaSession) -> dict:
@@ -31,6 +83,19 @@ def update_address(address_object: AddressObject, *, device_group: Optional[str]
     return ops.config_edit(session=session, xpath=xpath, element=element)
 
 
+def create_addresses(address_objects: Iterable[AddressObject], *, device_group: Optional[str], session: PanoramaSession, max_bytes: int = bulk.DEFAULT_MAX_BYTES, max_entries: int = bulk.DEFAULT_MAX_ENTRIES, ) -> BulkResult:
+    """Create (or merge) many address entries; one set per size-bounded chunk."""
+    xpath = parent_xpath(device_group)
+    items = [(o.key(), to_xml(o)) for o in address_objects]
+    return bulk.set_entries(session=session, xpath=xpath, items=items, max_bytes=max_bytes, max_entries=max_entries)
+
+
+def update_addresses(address_objects: Iterable[AddressObject], *, device_group: Optional[str], session: PanoramaSession, max_bytes: int = bulk.DEFAULT_MAX_BYTES, max_entries: int = bulk.DEFAULT_MAX_ENTRIES, ) -> BulkResult:
+    """Replace many existing address entries in place; one multi-config request per chunk."""
+    items = [(o.key(), entry_xpath(o.name, device_group), to_xml(o)) for o in address_objects]
+    return bulk.edit_entries(session=session, items=items, max_bytes=max_bytes, max_entries=max_entries)
+
+
 def rename_address(*, old_name: str, new_name: str, device_group: Optional[str], session: PanoramaSession) -> dict:
     """Rename an existing address entry."""
     xpath = entry_xpath(old_name, device_group)
@@ -41,3 +106,28 @@ def delete_address(*, name: str, device_group: Optional[str], session: PanoramaS
     """Delete an address entry."""
     xpath = entry_xpath(name, device_group)
     return ops.config_delete(session=session, xpath=xpath)
+
+
+def delete_addresses(*, names: Iterable[str], device_group: Optional[str], session: PanoramaSession, max_bytes: int = bulk.DEFAULT_MAX_BYTES, max_entries: int = bulk.DEFAULT_MAX_ENTRIES, ) -> BulkResult:
+    """Delete many address entries; one multi-config request per chunk."""
+    items = [(n, entry_xpath(n, device_group)) for n in names]
+    return bulk.delete_entries(session=session, items=items, max_bytes=max_bytes, max_entries=max_entries)
+
+
+def reconcile_addresses(desired: Iterable[AddressObject], *, device_group: Optional[str], session: PanoramaSession, prune: bool = False, dry_run: bool = False, ) -> ReconcileResult[AddressObject]:
+    """
+    Ensure the candidate container matches `desired` with the fewest writes.
+
+    Reads the container once, diffs by key() and content, then applies the
+    change set as batched writes. prune=True also deletes entries absent from
+    `desired`; dry_run=True only returns the plan.
+    """
+    current = list_addresses(session=session, candidate=True, device_group=device_group)
+    plan = reconcile.plan(current, desired, prune=prune)
+    return reconcile.apply(
+        plan,
+        create=lambda objs: create_addresses(objs, device_group=device_group, session=session),
+        update=lambda objs: update_addresses(objs, device_group=device_group, session=session),
+        delete=lambda names: delete_addresses(names=names, device_group=device_group, session=session),
+        dry_run=dry_run,
+    )
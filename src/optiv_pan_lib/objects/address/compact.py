@@ -0,0 +1,239 @@
+# src/optiv_pan_lib/objects/address/compact.py
+from __future__ import annotations
+
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, get_args, overload
+
+from .model import AddressKind, AddressObject
+from .parser import AddressParseError, from_json_dict
+from .serializer import to_json_list, to_xml_list
+
+KINDS: Tuple[AddressKind, ...] = get_args(AddressKind)
+_KIND_CODE = {k: i for i, k in enumerate(KINDS)}
+
+# _meta byte: bits 0-1 kind, bit 2 disable-override, bits 3-4 value encoding
+_DISABLE = 1 << 2
+_ENC_SHIFT = 3
+_ENC_STR = 0    # value kept as a string
+_ENC_CIDR = 1   # 'a.b.c.d/len'  -> _a = address, _b = len
+_ENC_HOST = 2   # 'a.b.c.d'      -> _a = address
+_ENC_RANGE = 3  # 'a.b.c.d-e.f.g.h' -> _a, _b = endpoints
+
+
+def _v4_int(s: str) -> Optional[int]:
+    """Canonical dotted quad → int; None for anything that would not print back identically."""
+    parts = s.split(".")
+    if len(parts) != 4:
+        return None
+    n = 0
+    for p in parts:
+        if not (p.isascii() and p.isdigit()) or len(p) > 3 or (len(p) > 1 and p[0] == "0"):
+            return None
+        o = int(p)
+        if o > 255:
+            return None
+        n = n << 8 | o
+    return n
+
+
+def _v4_str(n: int) -> str:
+    return f"{n >> 24}.{n >> 16 & 255}.{n >> 8 & 255}.{n & 255}"
+
+
+def _pack(kind: str, value: str) -> Tuple[int, int, int]:
+    """(encoding, a, b) for value; _ENC_STR when it does not pack losslessly."""
+    if kind == "ip-netmask":
+        addr, sep, plen = value.partition("/")
+        n = _v4_int(addr)
+        if n is not None:
+            if not sep:
+                return _ENC_HOST, n, 0
+            if plen.isascii() and plen.isdigit() and str(int(plen)) == plen and int(plen) <= 32:
+                return _ENC_CIDR, n, int(plen)
+    elif kind == "ip-range":
+        lo, sep, hi = value.partition("-")
+        a, b = _v4_int(lo), _v4_int(hi)
+        if sep and a is not None and b is not None:
+            return _ENC_RANGE, a, b
+    return _ENC_STR, 0, 0
+
+
+class CompactAddressSet(Sequence[AddressObject]):
+    """
+    Column-oriented, append-only store for large address object collections.
+
+    Names are packed back to back in one utf-8 buffer with an offset column;
+    kind, disable-override and value encoding share one byte per object;
+    canonical IPv4 netmask/host/range values live in two packed uint32
+    arrays; everything else (IPv6, fqdn, wildcards, non-canonical spellings)
+    stays as the original string. Descriptions and tag tuples are interned
+    into shared tables, so the common "same tags, same description" estate
+    costs two uint32 ids per object. Indexing returns a fresh AddressObject
+    built from the columns with AddressObject.trusted; values were validated
+    when the source objects were created.
+
+    Iterates like a list of AddressObject, so serializer.to_json_list /
+    to_xml_list work on it directly and `CompactAddressSet(objs)` round-trips.
+    """
+
+    __slots__ = ("_name_buf", "_name_end", "_meta", "_a", "_b", "_strs", "_desc", "_desc_table", "_desc_ids", "_tags", "_tag_table", "_tag_ids", "_by_name")
+
+    def __init__(self, objects: Iterable[AddressObject] = ()) -> None:
+        self._name_buf = bytearray()  # utf-8 names back to back
+        self._name_end = array("I")
+        self._meta = array("B")
+        self._a = array("I")
+        self._b = array("I")
+        self._strs: Dict[int, str] = {}          # row → value, for _ENC_STR rows
+        self._desc = array("I")
+        self._desc_table: List[Optional[str]] = [None]  # id 0 = no description
+        self._desc_ids: Dict[str, int] = {}
+        self._tags = array("I")
+        self._tag_table: List[Tuple[str, ...]] = [()]  # id 0 = no tags
+        self._tag_ids: Dict[Tuple[str, ...], int] = {(): 0}
+        self._by_name: Optional[Dict[str, int]] = None
+        self.extend(objects)
+
+    # ---- building ----
+
+    def append(self, obj: AddressObject) -> None:
+        row = len(self._meta)
+        enc, a, b = _pack(obj.kind, obj.value)
+        if enc == _ENC_STR:
+            self._strs[row] = obj.value
+        self._name_buf += obj.name.encode("utf-8")
+        self._name_end.append(len(self._name_buf))
+        self._meta.append(_KIND_CODE[obj.kind] | (_DISABLE if obj.disable_override else 0) | enc << _ENC_SHIFT)
+        self._a.append(a)
+        self._b.append(b)
+        did = 0
+        if obj.description:
+            did = self._desc_ids.get(obj.description, 0)
+            if not did:
+                did = self._desc_ids[obj.description] = len(self._desc_table)
+                self._desc_table.append(obj.description)
+        self._desc.append(did)
+        tid = self._tag_ids.get(obj.tags)
+        if tid is None:
+            tid = self._tag_ids[obj.tags] = len(self._tag_table)
+            self._tag_table.append(obj.tags)
+        self._tags.append(tid)
+        if self._by_name is not None:
+            self._by_name[obj.name] = row
+
+    def extend(self, objects: Iterable[AddressObject]) -> None:
+        for obj in objects:
+            self.append(obj)
+
+    @classmethod
+    def from_json_list(cls, items: Iterable[Dict[str, Any]], *, strict: bool = True) -> "CompactAddressSet":
+        """parser.from_json_list straight into a compact set (no intermediate list)."""
+        out = cls()
+        for it in items:
+            try:
+                out.append(from_json_dict(it))
+            except Exception as exc:
+                if strict:
+                    raise AddressParseError(f"failed to parse address json: {exc}") from exc
+        return out
+
+    def to_columns(self) -> Tuple[Any, ...]:
+        """The raw columns as bytes/str containers (marshal-able), for snapshot persistence."""
+        return (
+            bytes(self._name_buf), self._name_end.tobytes(), self._meta.tobytes(), self._a.tobytes(), self._b.tobytes(),
+            self._strs, self._desc.tobytes(), self._desc_table, self._tags.tobytes(), self._tag_table,
+            )
+
+    @classmethod
+    def from_columns(cls, columns: Sequence[Any]) -> "CompactAddressSet":
+        """Inverse of to_columns() (same byte order and array item sizes)."""
+        name_buf, name_end, meta, a, b, strs, desc, desc_table, tags, tag_table = columns
+        out = cls()
+        out._name_buf = bytearray(name_buf)
+        out._name_end.frombytes(name_end)
+        out._meta.frombytes(meta)
+        out._a.frombytes(a)
+        out._b.frombytes(b)
+        out._strs = dict(strs)
+        out._desc.frombytes(desc)
+        out._desc_table = list(desc_table)
+        out._desc_ids = {d: i for i, d in enumerate(out._desc_table) if d}
+        out._tags.frombytes(tags)
+        out._tag_table = [tuple(t) for t in tag_table]
+        out._tag_ids = {t: i for i, t in enumerate(out._tag_table)}
+        if not len(out._meta) == len(out._name_end) == len(out._a) == len(out._b) == len(out._desc) == len(out._tags):
+            raise ValueError("inconsistent CompactAddressSet columns")
+        return out
+
+    def to_json_list(self) -> List[Dict[str, Any]]:
+        return to_json_list(self)
+
+    def to_xml_list(self) -> List[str]:
+        return to_xml_list(self)
+
+    # ---- access ----
+
+    def _name(self, i: int) -> str:
+        return self._name_buf[self._name_end[i - 1] if i else 0:self._name_end[i]].decode("utf-8")
+
+    def _row(self, i: int) -> AddressObject:
+        meta = self._meta[i]
+        kind = KINDS[meta & 3]
+        enc = meta >> _ENC_SHIFT
+        if enc == _ENC_STR:
+            value = self._strs[i]
+        elif enc == _ENC_CIDR:
+            value = f"{_v4_str(self._a[i])}/{self._b[i]}"
+        elif enc == _ENC_HOST:
+            value = _v4_str(self._a[i])
+        else:
+            value = f"{_v4_str(self._a[i])}-{_v4_str(self._b[i])}"
+        return AddressObject.trusted(self._name(i), kind, value, self._desc_table[self._desc[i]], self._tag_table[self._tags[i]], bool(meta & _DISABLE))
+
+    def __len__(self) -> int:
+        return len(self._meta)
+
+    @overload
+    def __getitem__(self, i: int) -> AddressObject: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> List[AddressObject]: ...
+
+    def __getitem__(self, i: int | slice) -> AddressObject | List[AddressObject]:
+        if isinstance(i, slice):
+            return [self._row(j) for j in range(*i.indices(len(self._meta)))]
+        n = len(self._meta)
+        if not -n <= i < n:
+            raise IndexError("CompactAddressSet index out of range")
+        return self._row(i % n)
+
+    def __iter__(self) -> Iterator[AddressObject]:
+        row = self._row
+        for i in range(len(self._meta)):
+            yield row(i)
+
+    def __contains__(self, item: object) -> bool:
+        """Membership by name (str) or by equal AddressObject."""
+        if isinstance(item, str):
+            return item in self._index()
+        if isinstance(item, AddressObject):
+            i = self._index().get(item.name)
+            return i is not None and self._row(i) == item
+        return False
+
+    def _index(self) -> Dict[str, int]:
+        if self._by_name is None:
+            self._by_name = {self._name(i): i for i in range(len(self._meta))}
+        return self._by_name
+
+    def get(self, name: str) -> Optional[AddressObject]:
+        """Object by name (the last one appended wins); name index built on first use."""
+        i = self._index().get(name)
+        return None if i is None else self._row(i)
+
+    def names(self) -> Sequence[str]:
+        return tuple(self._name(i) for i in range(len(self._meta)))
+
+    def tag_sets(self) -> Sequence[Tuple[str, ...]]:
+        """Distinct tag tuples held (shared by every object that uses them)."""
+        return tuple(self._tag_table[1:])
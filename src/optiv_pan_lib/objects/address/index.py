@@ -0,0 +1,445 @@
+# src/optiv_pan_lib/objects/address/index.py
+from __future__ import annotations
+
+import ipaddress
+import random
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .model import AddressObject
+
+Scope = Optional[str]  # device group name; None = shared
+Query = Union[str, ipaddress.IPv4Address, ipaddress.IPv6Address, ipaddress.IPv4Network, ipaddress.IPv6Network]
+Span = Tuple[int, int, int]  # (version, lo, hi), inclusive
+
+MAX_WILDCARD_BLOCKS = 4096
+
+
+@dataclass(slots=True, frozen=True)
+class IndexedAddress:
+    """An address object and the scope (device group, None = shared) it came from."""
+    scope: Scope
+    address: AddressObject
+
+
+# ----------------------------
+# value → integer intervals
+# ----------------------------
+
+def query_span(q: Query) -> Span:
+    """'10.0.0.1', '10.0.0.0/8', '10.0.0.1-10.0.0.9', ipaddress objects → (version, lo, hi)."""
+    if isinstance(q, (ipaddress.IPv4Address, ipaddress.IPv6Address)):
+        return q.version, int(q), int(q)
+    if isinstance(q, (ipaddress.IPv4Network, ipaddress.IPv6Network)):
+        return q.version, int(q.network_address), int(q.broadcast_address)
+    s = q.strip()
+    if "-" in s:
+        a, b = (ipaddress.ip_address(p.strip()) for p in s.split("-", 1))
+        if a.version != b.version or int(a) > int(b):
+            raise ValueError(f"invalid range: {q!r}")
+        return a.version, int(a), int(b)
+    if "/" in s:
+        net = ipaddress.ip_network(s, strict=False)
+        return net.version, int(net.network_address), int(net.broadcast_address)
+    ip = ipaddress.ip_address(s)
+    return ip.version, int(ip), int(ip)
+
+
+def _v4_cidr(value: str) -> Optional[Span]:
+    """Dotted-quad[/len] without ipaddress object churn; None when not plain IPv4."""
+    addr, _, plen = value.partition("/")
+    parts = addr.split(".")
+    if len(parts) != 4 or not all(p.isascii() and p.isdigit() and len(p) <= 3 for p in parts) or (plen and not (plen.isascii() and plen.isdigit())):
+        return None
+    a, b, c, d = (int(p) for p in parts)
+    n = int(plen) if plen else 32
+    if a > 255 or b > 255 or c > 255 or d > 255 or n > 32:
+        return None
+    host = (1 << (32 - n)) - 1
+    ip = a << 24 | b << 16 | c << 8 | d
+    return 4, ip & ~host, ip | host
+
+
+def _wildcard_blocks(value: str) -> Tuple[int, int, int]:
+    """'10.0.1.0/0.0.254.255' → (base, high_free_mask, low_block_size); IPv4 only."""
+    ip_str, _, mask = value.partition("/")
+    wild = int(ipaddress.IPv4Address(mask.strip()))
+    base = int(ipaddress.IPv4Address(ip_str.strip())) & ~wild & 0xFFFFFFFF
+    low = 0
+    while low < 32 and wild >> low & 1:
+        low += 1
+    return base, wild & ~((1 << low) - 1), 1 << low
+
+
+def _subsets(mask: int) -> Iterator[int]:
+    s = 0
+    while True:
+        yield s
+        s = (s - mask) & mask
+        if s == 0:
+            return
+
+
+def spans_of(obj: AddressObject, *, max_wildcard_blocks: int = MAX_WILDCARD_BLOCKS) -> Optional[List[Span]]:
+    """
+    Integer intervals covered by an address object; None for fqdn.
+    A non-contiguous ip-wildcard expands into one interval per block; past
+    max_wildcard_blocks it raises OverflowError (the index then falls back to
+    a bitmask test for that object).
+    """
+    if obj.kind == "ip-netmask":
+        fast = _v4_cidr(obj.value)
+        return [fast] if fast is not None else [query_span(ipaddress.ip_network(obj.value, strict=False))]
+    if obj.kind == "ip-range":
+        return [query_span(obj.value)]
+    if obj.kind == "ip-wildcard":
+        base, high, size = _wildcard_blocks(obj.value)
+        if 1 << bin(high).count("1") > max_wildcard_blocks:
+            raise OverflowError(obj.value)
+        return [(4, base | s, (base | s) + size - 1) for s in _subsets(high)]
+    return None
+
+
+def _wildcard_next(base: int, wild: int, lo: int, bits: int = 32) -> Optional[int]:
+    """Smallest x >= lo with x & ~wild == base, or None."""
+    prefix = 0
+    last_up: Optional[int] = None  # bit where x may exceed lo by taking a free 1
+    up_prefix = 0
+    for i in range(bits - 1, -1, -1):
+        bit = 1 << i
+        l = lo & bit
+        if wild & bit:
+            if not l:
+                last_up, up_prefix = i, prefix
+            prefix |= l
+            continue
+        v = base & bit
+        if v == l:
+            prefix |= v
+            continue
+        if v > l:
+            return prefix | v | (base & (bit - 1))
+        if last_up is None:
+            return None
+        return up_prefix | (1 << last_up) | (base & ((1 << last_up) - 1))
+    return prefix
+
+
+# ----------------------------
+# interval treap (augmented with subtree max hi)
+# ----------------------------
+
+class _Node:
+    __slots__ = ("key", "hi", "ref", "prio", "left", "right", "max_hi")
+
+    def __init__(self, key: Tuple[int, int], hi: int, ref: IndexedAddress, prio: float):
+        self.key = key  # (lo, uid): unique, ordered by lo
+        self.hi = hi
+        self.ref = ref
+        self.prio = prio
+        self.left: Optional[_Node] = None
+        self.right: Optional[_Node] = None
+        self.max_hi = hi
+
+
+def _fix(n: _Node) -> None:
+    m = n.hi
+    if n.left is not None and n.left.max_hi > m:
+        m = n.left.max_hi
+    if n.right is not None and n.right.max_hi > m:
+        m = n.right.max_hi
+    n.max_hi = m
+
+
+def _split(n: Optional[_Node], key: Tuple[int, int]) -> Tuple[Optional[_Node], Optional[_Node]]:
+    """(keys < key, keys >= key)"""
+    if n is None:
+        return None, None
+    if n.key < key:
+        a, b = _split(n.right, key)
+        n.right = a
+        _fix(n)
+        return n, b
+    a, b = _split(n.left, key)
+    n.left = b
+    _fix(n)
+    return a, n
+
+
+def _merge(a: Optional[_Node], b: Optional[_Node]) -> Optional[_Node]:
+    """All keys in a < all keys in b."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a.prio > b.prio:
+        a.right = _merge(a.right, b)
+        _fix(a)
+        return a
+    b.left = _merge(a, b.left)
+    _fix(b)
+    return b
+
+
+def _build(nodes: List[_Node]) -> Optional[_Node]:
+    """Treap from nodes sorted by key in O(n) (Cartesian tree on prio)."""
+    stack: List[_Node] = []
+    for n in nodes:
+        n.left = n.right = None
+        last: Optional[_Node] = None
+        while stack and stack[-1].prio < n.prio:
+            last = stack.pop()
+        n.left = last
+        if stack:
+            stack[-1].right = n
+        stack.append(n)
+    root = stack[0] if stack else None
+    _fix_all(root)
+    return root
+
+
+def _fix_all(root: Optional[_Node]) -> None:
+    order: List[_Node] = []
+    todo = [root] if root is not None else []
+    while todo:
+        n = todo.pop()
+        order.append(n)
+        if n.left is not None:
+            todo.append(n.left)
+        if n.right is not None:
+            todo.append(n.right)
+    for n in reversed(order):
+        _fix(n)
+
+
+def _overlapping(n: Optional[_Node], lo: int, hi: int, out: List[IndexedAddress]) -> None:
+    while n is not None and n.max_hi >= lo:
+        _overlapping(n.left, lo, hi, out)
+        if n.key[0] > hi:
+            return
+        if n.hi >= lo:
+            out.append(n.ref)
+        n = n.right
+
+
+def _stabbing(n: Optional[_Node], p: int, out: List[_Node]) -> None:
+    while n is not None and n.max_hi >= p:
+        _stabbing(n.left, p, out)
+        if n.key[0] > p:
+            return
+        if n.hi >= p:
+            out.append(n)
+        n = n.right
+
+
+def _starting_in(n: Optional[_Node], lo: int, hi: int, out: List[_Node]) -> None:
+    while n is not None:
+        start = n.key[0]
+        if start < lo:
+            n = n.right
+            continue
+        _starting_in(n.left, lo, hi, out)
+        if start > hi:
+            return
+        out.append(n)
+        n = n.right
+
+
+def _inorder(n: Optional[_Node], out: List[_Node]) -> None:
+    stack: List[_Node] = []
+    while stack or n is not None:
+        while n is not None:
+            stack.append(n)
+            n = n.left
+        n = stack.pop()
+        out.append(n)
+        n = n.right
+
+
+class AddressIndex:
+    """
+    IP containment index over address objects from any number of scopes.
+
+    ip-netmask, ip-range and ip-wildcard objects (IPv4 and IPv6) are stored as
+    integer intervals in one interval treap per IP version, so point, overlap,
+    "within" and "covering" queries cost O(log n + matches). Non-contiguous
+    wildcards expand into up to max_wildcard_blocks intervals; wider ones are
+    tested by bitmask. fqdn objects are ignored.
+
+        idx = AddressIndex()
+        idx.extend(list_addresses(session=pano, device_group="DG1"), scope="DG1")
+        idx.containing("10.4.7.22")          # objects whose set holds the IP
+        idx.overlapping("10.4.0.0/16")
+        idx.add(changed, scope="DG1"); idx.remove("old", scope="DG1")
+
+    Re-adding (scope, name) replaces the previous object. Not thread-safe.
+    """
+
+    def __init__(self, objects: Iterable[AddressObject] = (), *, scope: Scope = None, max_wildcard_blocks: int = MAX_WILDCARD_BLOCKS, seed: Optional[int] = None):
+        self.max_wildcard_blocks = max_wildcard_blocks
+        self._rng = random.Random(seed)
+        self._roots: Dict[int, Optional[_Node]] = {4: None, 6: None}
+        self._entries: Dict[Tuple[Scope, str], Tuple[IndexedAddress, List[Tuple[int, Tuple[int, int]]]]] = {}
+        self._wide: Dict[Tuple[Scope, str], Tuple[IndexedAddress, int, int]] = {}  # key → (ref, base, wild)
+        self._uid = 0
+        self.extend(objects, scope=scope)
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._wide)
+
+    def __contains__(self, key: Tuple[Scope, str]) -> bool:
+        return key in self._entries or key in self._wide
+
+    def __iter__(self) -> Iterator[IndexedAddress]:
+        for ref, _ in self._entries.values():
+            yield ref
+        for ref, _, _ in self._wide.values():
+            yield ref
+
+    # ---- updates ----
+
+    def _nodes_for(self, obj: AddressObject, scope: Scope) -> Tuple[IndexedAddress, Optional[List[Tuple[int, _Node]]]]:
+        ref = IndexedAddress(scope=scope, address=obj)
+        try:
+            spans = spans_of(obj, max_wildcard_blocks=self.max_wildcard_blocks)
+        except OverflowError:
+            return ref, None
+        if spans is None:
+            return ref, []
+        nodes = []
+        for version, lo, hi in spans:
+            self._uid += 1
+            nodes.append((version, _Node((lo, self._uid), hi, ref, self._rng.random())))
+        return ref, nodes
+
+    def _store(self, key: Tuple[Scope, str], obj: AddressObject, ref: IndexedAddress, nodes: Optional[List[Tuple[int, _Node]]]) -> bool:
+        if nodes is None:
+            base, high, size = _wildcard_blocks(obj.value)
+            self._wide[key] = (ref, base, high | (size - 1))
+            return True
+        if not nodes:
+            return False
+        self._entries[key] = (ref, [(v, n.key) for v, n in nodes])
+        return True
+
+    def add(self, obj: AddressObject, *, scope: Scope = None) -> bool:
+        """Index (or re-index) obj; False when it has no IP form (fqdn)."""
+        key = (scope, obj.name)
+        self.remove(obj.name, scope=scope)
+        ref, nodes = self._nodes_for(obj, scope)
+        for version, node in nodes or ():
+            left, right = _split(self._roots[version], node.key)
+            self._roots[version] = _merge(_merge(left, node), right)
+        return self._store(key, obj, ref, nodes)
+
+    def extend(self, objs: Iterable[AddressObject], *, scope: Scope = None) -> int:
+        """add() many; rebuilds the trees in O(n log n) when the batch is large. Returns how many were indexed."""
+        objs = list({o.name: o for o in objs}.values())
+        if len(objs) < max(64, len(self) // 4):
+            return sum(self.add(o, scope=scope) for o in objs)
+
+        for o in objs:
+            self.remove(o.name, scope=scope)
+        fresh: Dict[int, List[_Node]] = {4: [], 6: []}
+        indexed = 0
+        for o in objs:
+            ref, nodes = self._nodes_for(o, scope)
+            for version, node in nodes or ():
+                fresh[version].append(node)
+            indexed += self._store((scope, o.name), o, ref, nodes)
+        for version, new in fresh.items():
+            if not new:
+                continue
+            existing: List[_Node] = []
+            _inorder(self._roots[version], existing)
+            merged = sorted(existing + new, key=lambda n: n.key)
+            self._roots[version] = _build(merged)
+        return indexed
+
+    def remove(self, name: str, *, scope: Scope = None) -> bool:
+        key = (scope, name)
+        if self._wide.pop(key, None) is not None:
+            return True
+        hit = self._entries.pop(key, None)
+        if hit is None:
+            return False
+        for version, node_key in hit[1]:
+            left, rest = _split(self._roots[version], node_key)
+            _, right = _split(rest, (node_key[0], node_key[1] + 1))
+            self._roots[version] = _merge(left, right)
+        return True
+
+    def clear(self) -> None:
+        self._roots = {4: None, 6: None}
+        self._entries.clear()
+        self._wide.clear()
+
+    # ---- queries ----
+
+    def _wide_hits(self, version: int, lo: int, hi: int) -> List[IndexedAddress]:
+        if version != 4 or not self._wide:
+            return []
+        out = []
+        for ref, base, wild in self._wide.values():
+            x = _wildcard_next(base, wild, lo)
+            if x is not None and x <= hi:
+                out.append(ref)
+        return out
+
+    @staticmethod
+    def _unique(refs: Iterable[IndexedAddress]) -> List[IndexedAddress]:
+        seen = set()
+        out = []
+        for r in refs:
+            k = (r.scope, r.address.name)
+            if k not in seen:
+                seen.add(k)
+                out.append(r)
+        out.sort(key=lambda r: (r.scope or "", r.address.name))
+        return out
+
+    def overlapping(self, q: Query) -> List[IndexedAddress]:
+        """Objects sharing at least one address with q (IP, prefix or range)."""
+        version, lo, hi = query_span(q)
+        out: List[IndexedAddress] = []
+        _overlapping(self._roots[version], lo, hi, out)
+        return self._unique(out + self._wide_hits(version, lo, hi))
+
+    def containing(self, q: Query) -> List[IndexedAddress]:
+        """Objects that contain the IP q ('which objects cover 10.4.7.22?')."""
+        version, lo, hi = query_span(q)
+        if lo != hi:
+            return self.covering(q)
+        return self.overlapping(q)
+
+    def covering(self, q: Query) -> List[IndexedAddress]:
+        """Objects containing every address of q."""
+        version, lo, hi = query_span(q)
+        stab: List[_Node] = []
+        _stabbing(self._roots[version], lo, stab)
+        out = [n.ref for n in stab if n.hi >= hi]  # wildcard blocks are never adjacent
+        if version == 4:
+            for ref, base, wild in self._wide.values():
+                block = wild & ~(wild + 1)  # trailing free bits: span of one block
+                if (lo & ~wild & 0xFFFFFFFF) == base and lo | block == hi | block:
+                    out.append(ref)
+        return self._unique(out)
+
+    def within(self, q: Query) -> List[IndexedAddress]:
+        """Objects entirely inside q (e.g. every object in 10.0.0.0/8)."""
+        version, lo, hi = query_span(q)
+        nodes: List[_Node] = []
+        _starting_in(self._roots[version], lo, hi, nodes)
+        inside: Dict[Tuple[Scope, str], int] = {}
+        refs: Dict[Tuple[Scope, str], IndexedAddress] = {}
+        for n in nodes:
+            if n.hi <= hi:
+                k = (n.ref.scope, n.ref.address.name)
+                inside[k] = inside.get(k, 0) + 1
+                refs[k] = n.ref
+        out = [refs[k] for k, c in inside.items() if c == len(self._entries[k][1])]
+        if version == 4:
+            for ref, base, wild in self._wide.values():
+                if lo <= base and (base | wild) <= hi:
+                    out.append(ref)
+        return self._unique(out)
@@ -4,7 +4,7 @@ from __future__ import annotations
 import ipaddress
 import re
 from dataclasses import dataclass, field
-from typing import Literal, Optional, Sequence
+from typing import Dict, Iterable, List, Literal, Optional, Sequence, Tuple
 
 AddressKind = Literal["ip-netmask", "ip-range", "ip-wildcard", "fqdn"]
 
@@ -33,12 +33,30 @@ def _normalize_tags(tags: Sequence[str]) -> tuple[str, ...]:
     return tuple(out)
 
 
+def _is_plain_v4(value: str) -> bool:
+    """
+    Canonical ASCII 'a.b.c.d' or 'a.b.c.d/len' (no leading zeros). A strict subset
+    of what ipaddress.ip_network accepts; everything else takes the full check.
+    """
+    addr, sep, plen = value.partition("/")
+    if sep and not (plen.isascii() and plen.isdigit() and len(plen) <= 2 and int(plen) <= 32 and (len(plen) == 1 or plen[0] != "0")):
+        return False
+    parts = addr.split(".")
+    if len(parts) != 4:
+        return False
+    for p in parts:
+        if not (p.isascii() and p.isdigit()) or len(p) > 3 or (len(p) > 1 and p[0] == "0") or int(p) > 255:
+            return False
+    return True
+
+
 def _validate_value(kind: AddressKind, value: str) -> None:
     if not value:
         raise ValueError("value required")
 
     if kind == "ip-netmask":
-        ipaddress.ip_network(value, strict=False)
+        if not _is_plain_v4(value):
+            ipaddress.ip_network(value, strict=False)
 
     elif kind == "ip-range":
         a, sep, b = value.partition("-")
@@ -68,6 +86,47 @@ def _validate_value(kind: AddressKind, value: str) -> None:
         raise ValueError(f"invalid kind: {kind}")
 
 
+class ValueValidator:
+    """
+    Memoized _validate_value for batches with repeated values (the same
+    hosts and ranges across device groups). Raises the same ValueError; at
+    most `maxsize` (kind, value) outcomes are remembered.
+    """
+
+    __slots__ = ("_seen", "maxsize")
+
+    def __init__(self, maxsize: int = 1 << 18) -> None:
+        self._seen: Dict[Tuple[str, str], Optional[str]] = {}
+        self.maxsize = maxsize
+
+    def __call__(self, kind: AddressKind, value: str) -> None:
+        key = (kind, value)
+        try:
+            err = self._seen[key]
+        except KeyError:
+            try:
+                _validate_value(kind, value)
+                err = None
+            except ValueError as exc:
+                err = str(exc) or "invalid value"
+            if len(self._seen) >= self.maxsize:
+                self._seen.clear()
+            self._seen[key] = err
+        if err is not None:
+            raise ValueError(err)
+
+    def batch(self, items: Iterable[Tuple[AddressKind, str]]) -> List[Optional[str]]:
+        """Error message (None = valid) for each (kind, value), in order."""
+        out: List[Optional[str]] = []
+        for kind, value in items:
+            try:
+                self(kind, value)
+                out.append(None)
+            except ValueError as exc:
+                out.append(str(exc))
+        return out
+
+
 @dataclass(slots=True, frozen=True)
 class AddressObject:
     name: str
@@ -89,5 +148,30 @@ class AddressObject:
 
         object.__setattr__(self, "tags", _normalize_tags(self.tags))
 
+    @classmethod
+    def trusted(
+            cls,
+            name: str,
+            kind: AddressKind,
+            value: str,
+            description: Optional[str] = None,
+            tags: tuple[str, ...] = (),
+            disable_override: bool = False,
+            ) -> "AddressObject":
+        """
+        Construct without value validation, for data Panorama already accepted
+        (parser output, snapshots). fqdn case and tag normalization still apply.
+        User-supplied data should go through the normal constructor.
+        """
+        obj = object.__new__(cls)
+        setattr_ = object.__setattr__
+        setattr_(obj, "name", name)
+        setattr_(obj, "kind", kind)
+        setattr_(obj, "value", _canon_fqdn(value) if kind == "fqdn" else value)
+        setattr_(obj, "description", description)
+        setattr_(obj, "tags", _normalize_tags(tags) if tags else ())
+        setattr_(obj, "disable_override", disable_override)
+        return obj
+
     def key(self) -> str:
         return self.name
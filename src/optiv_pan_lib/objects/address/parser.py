@@ -1,10 +1,11 @@
 # src/optiv_lib/providers/pan/objects/address/parser.py
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Tuple
+import xml.etree.ElementTree as ET
+from typing import Any, Collection, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from .model import AddressKind, AddressObject
-from optiv_pan_lib.base.util import as_list, collect_members, node_text, yn_bool
+from .model import AddressKind, AddressObject, ValueValidator
+from optiv_pan_lib.base.util import as_list, collect_members, element_members, element_text, node_text, yn_bool
 
 
 class AddressParseError(ValueError):
@@ -18,19 +19,47 @@ KIND_FIELDS: Tuple[AddressKind, ...] = ("ip-netmask", "ip-range", "ip-wildcard",
 # XML → model
 # ----------------------------
 
-def from_xml(result: Dict[str, Any], *, strict: bool = True) -> List[AddressObject]:
+def from_xml(result: Dict[str, Any], *, strict: bool = True, validate: bool = False) -> List[AddressObject]:
     """
     Convert ops.config_show/get result (inner 'result') into AddressObject items.
+
+    Values Panorama returns were validated by PAN-OS, so models are built
+    with AddressObject.trusted; validate=True re-checks them through a
+    memoized ValueValidator first.
+    """
+    return list(iter_entries(_pick_entries(result), strict=strict, validate=validate))
+
+
+def iter_xml(result: Dict[str, Any], *, strict: bool = True, validate: bool = False, kinds: Optional[Collection[AddressKind]] = None, tags: Optional[Collection[str]] = None, name_prefix: Optional[str] = None, ) -> Iterator[AddressObject]:
+    """Lazy from_xml; see iter_entries for the filters."""
+    return iter_entries(_pick_entries(result), strict=strict, validate=validate, kinds=kinds, tags=tags, name_prefix=name_prefix)
+
+
+def iter_entries(entries: Iterable[Dict[str, Any]], *, strict: bool = True, validate: bool = False, kinds: Optional[Collection[AddressKind]] = None, tags: Optional[Collection[str]] = None, name_prefix: Optional[str] = None, ) -> Iterator[AddressObject]:
     """
-    entries = _pick_entries(result)
-    objs: List[AddressObject] = []
+    Build AddressObject items from xmltodict-shaped <entry> dicts one at a
+    time, as they are consumed.
+
+    Filters run on the raw entry, before any model is built or validated:
+    kinds keeps entries holding one of those kind fields, tags keeps entries
+    carrying any of those tags, name_prefix keeps names starting with it.
+    Skipped entries are never validated, so they never raise.
+    """
+    check = ValueValidator() if validate else None
     for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        if name_prefix is not None and not (entry.get("@name") or "").strip().startswith(name_prefix):
+            continue
+        if kinds is not None and not any(k in entry for k in kinds):
+            continue
+        if tags is not None and not any(t in tags for t in collect_members(entry.get("tag"))):
+            continue
         try:
-            objs.append(_xml_entry_to_model(entry))
+            yield _xml_entry_to_model(entry, check)
         except Exception as exc:
             if strict:
                 raise AddressParseError(f"failed to parse address entry: {exc}") from exc
-    return objs
 
 
 def _pick_entries(result: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -43,7 +72,7 @@ def _pick_entries(result: Dict[str, Any]) -> List[Dict[str, Any]]:
     return [e for e in as_list(raw) if isinstance(e, dict)]
 
 
-def _xml_entry_to_model(entry: Dict[str, Any]) -> AddressObject:
+def _xml_entry_to_model(entry: Dict[str, Any], check: Optional[ValueValidator] = None) -> AddressObject:
     name = (entry.get("@name") or "").strip()
     if not name:
         raise ValueError("missing @name")
@@ -53,14 +82,9 @@ def _xml_entry_to_model(entry: Dict[str, Any]) -> AddressObject:
     disable_override = yn_bool(node_text(entry.get("disable-override")))
     tags = tuple(collect_members(entry.get("tag")))
 
-    return AddressObject(
-        name=name,
-        kind=kind,
-        value=value,
-        description=description,
-        tags=tags,
-        disable_override=disable_override,
-    )
+    if check is not None:
+        check(kind, value)
+    return AddressObject.trusted(name, kind, value, description, tags, disable_override)
 
 
 def _detect_kind_value(entry: Dict[str, Any]) -> Tuple[AddressKind, str]:
@@ -75,6 +99,73 @@ def _detect_kind_value(entry: Dict[str, Any]) -> Tuple[AddressKind, str]:
     return k, v or ""
 
 
+# ----------------------------
+# Element → model (fast path)
+# ----------------------------
+
+def from_element(result: ET.Element, *, strict: bool = True, validate: bool = False) -> List[AddressObject]:
+    """
+    from_xml for the <result> Element of ops.config_get_element/config_show_element.
+    Reads entries straight off the tree; same results and errors as from_xml.
+    """
+    return list(iter_element(result, strict=strict, validate=validate))
+
+
+def iter_element(result: ET.Element, *, strict: bool = True, validate: bool = False, kinds: Optional[Collection[AddressKind]] = None, tags: Optional[Collection[str]] = None, name_prefix: Optional[str] = None, ) -> Iterator[AddressObject]:
+    """Lazy from_element, with the same pre-construction filters as iter_entries."""
+    address_node = result.find("address")
+    entries = address_node.findall("entry") if address_node is not None and address_node.find("entry") is not None else result.findall("entry")
+    check = ValueValidator() if validate else None
+    for entry in entries:
+        if name_prefix is not None and not (entry.get("name") or "").strip().startswith(name_prefix):
+            continue
+        if kinds is not None and not any(entry.find(k) is not None for k in kinds):
+            continue
+        if tags is not None and not any(t in tags for t in element_members(entry.find("tag"))):
+            continue
+        try:
+            yield _element_entry_to_model(entry, check)
+        except Exception as exc:
+            if strict:
+                raise AddressParseError(f"failed to parse address entry: {exc}") from exc
+
+
+_KIND_SET = frozenset(KIND_FIELDS)
+
+
+def _element_entry_to_model(entry: ET.Element, check: Optional[ValueValidator] = None) -> AddressObject:
+    name = (entry.get("name") or "").strip()
+    if not name:
+        raise ValueError("missing @name")
+
+    hits: List[Tuple[AddressKind, str]] = []
+    description = None
+    disable_override = False
+    tags: Tuple[str, ...] = ()
+    for child in entry:
+        tag = child.tag
+        if tag in _KIND_SET:
+            v = element_text(child)
+            if v:
+                hits.append((tag, v))  # type: ignore[arg-type]
+        elif tag == "description":
+            description = element_text(child)
+        elif tag == "tag":
+            tags = tuple(element_members(child))
+        elif tag == "disable-override":
+            disable_override = yn_bool(element_text(child))
+
+    if len(hits) != 1:
+        raise ValueError(
+            "entry must contain exactly one of ip-netmask/ip-range/ip-wildcard/fqdn; got " + repr(sorted(k for k, _ in hits))
+        )
+    kind, value = hits[0]
+
+    if check is not None:
+        check(kind, value)
+    return AddressObject.trusted(name, kind, value, description, tags, disable_override)
+
+
 # ----------------------------
 # JSON → model
 # ----------------------------
@@ -1,26 +1,8 @@
 # src/optiv_lib/providers/pan/objects/managed_devices/api.py
 from __future__ import annotations
 
-from optiv_pan_lib.base import ops
-from optiv_pan_lib.base.session import PanoramaSession
+# Kept for existing imports; the calls live in panorama.managed_devices.api.
+from optiv_pan_lib.panorama.managed_devices.api import list_all_devices as list_managed_devices_all
+from optiv_pan_lib.panorama.managed_devices.api import list_connected_devices as list_managed_devices_connected
 
-
-def list_managed_devices_connected(*, session: PanoramaSession) -> dict:
-    """
-    Panorama → show devices connected
-
-    Returns the inner 'result' dict from the XML API.
-    Callers handle normalization as needed.
-    """
-    cmd = "<show><devices><connected/></devices></show>"
-    return ops.op(session=session, cmd=cmd)
-
-
-def list_managed_devices_all(*, session: PanoramaSession) -> dict:
-    """
-    Panorama → show devices all
-
-    Returns the inner 'result' dict from the XML API.
-    """
-    cmd = "<show><devices><all/></devices></show>"
-    return ops.op(session=session, cmd=cmd)
+__all__ = ["list_managed_devices_all", "list_managed_devices_connected"]
@@ -0,0 +1,109 @@
+# src/optiv_pan_lib/objects/reconcile.py
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Generic, Iterable, List, Protocol, Sequence, Tuple, TypeVar
+
+from optiv_pan_lib.base.bulk import BulkAborted, BulkResult
+from optiv_pan_lib.base.session import PanoramaAuthError
+
+
+class Keyed(Protocol):
+    def key(self) -> str:
+        ...
+
+
+M = TypeVar("M", bound=Keyed)
+
+
+@dataclass(slots=True, frozen=True)
+class ReconcilePlan(Generic[M]):
+    """Minimal change set turning the current container into the desired one."""
+    create: tuple[M, ...] = ()
+    update: tuple[M, ...] = ()
+    delete: tuple[str, ...] = ()
+    unchanged: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.create or self.update or self.delete)
+
+
+@dataclass(slots=True, frozen=True)
+class ReconcileResult(Generic[M]):
+    """Plan plus per-phase bulk outcomes; results stay empty on dry runs."""
+    plan: ReconcilePlan[M]
+    dry_run: bool = False
+    created: BulkResult = field(default_factory=BulkResult)
+    updated: BulkResult = field(default_factory=BulkResult)
+    deleted: BulkResult = field(default_factory=BulkResult)
+
+    @property
+    def ok(self) -> bool:
+        return self.created.ok and self.updated.ok and self.deleted.ok
+
+
+class ReconcileAborted(PanoramaAuthError):
+    """
+    A phase of apply() hit BulkAborted (chained as the cause). `result`
+    holds the finished phases plus the partial outcome of the aborted one;
+    later phases did not run.
+    """
+
+    def __init__(self, message: str, result: ReconcileResult[Any]) -> None:
+        super().__init__(message)
+        self.result = result
+
+
+def plan(current: Iterable[M], desired: Iterable[M], *, prune: bool = False) -> ReconcilePlan[M]:
+    """
+    Diff by key() then by value equality (models are normalized frozen dataclasses).
+    Entries only present in `current` are deleted when prune=True, otherwise left alone.
+    """
+    have: Dict[str, M] = {o.key(): o for o in current}
+    want: Dict[str, M] = {}
+    for o in desired:
+        k = o.key()
+        if k in want:
+            raise ValueError(f"duplicate desired object: {k!r}")
+        want[k] = o
+
+    create: List[M] = []
+    update: List[M] = []
+    unchanged = 0
+    for k, o in want.items():
+        cur = have.get(k)
+        if cur is None:
+            create.append(o)
+        elif cur != o:
+            update.append(o)
+        else:
+            unchanged += 1
+
+    delete = tuple(k for k in have if k not in want) if prune else ()
+    return ReconcilePlan(create=tuple(create), update=tuple(update), delete=delete, unchanged=unchanged)
+
+
+def apply(
+        p: ReconcilePlan[M],
+        *,
+        create: Callable[[Sequence[M]], BulkResult],
+        update: Callable[[Sequence[M]], BulkResult],
+        delete: Callable[[Sequence[str]], BulkResult],
+        dry_run: bool = False,
+        ) -> ReconcileResult[M]:
+    """
+    Run a plan through batched writers: updates, then creates, then deletes.
+    Raises ReconcileAborted with what already landed if a writer aborts.
+    """
+    if dry_run or not p.changed:
+        return ReconcileResult(plan=p, dry_run=dry_run)
+    done: Dict[str, BulkResult] = {}
+    phases: List[Tuple[str, Callable[[Any], BulkResult], Sequence[Any]]] = [("updated", update, p.update), ("created", create, p.create), ("deleted", delete, p.delete)]
+    for name, writer, todo in phases:
+        try:
+            done[name] = writer(todo) if todo else BulkResult()
+        except BulkAborted as exc:
+            done[name] = exc.result
+            raise ReconcileAborted(f"reconcile stopped while applying {name}: {exc}", ReconcileResult(plan=p, **done)) from exc
+    return ReconcileResult(plan=p, **done)
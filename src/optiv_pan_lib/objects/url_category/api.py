@@ -1,11 +1,14 @@
 # src/optiv_lib/providers/pan/objects/url_category/api.py
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Collection, Iterable, Iterator, List, Optional
 
-from optiv_pan_lib.base import ops
-from optiv_pan_lib.objects.url_category.model import UrlCategoryObject
-from optiv_pan_lib.objects.url_category.parser import from_xml
+from optiv_pan_lib.base import bulk, chunked, metrics, ops
+from optiv_pan_lib.base.bulk import BulkResult
+from optiv_pan_lib.objects import reconcile
+from optiv_pan_lib.objects.reconcile import ReconcileResult
+from optiv_pan_lib.objects.url_category.model import UrlCategoryObject, UrlCategoryType
+from optiv_pan_lib.objects.url_category.parser import from_element, from_xml, iter_element, iter_entries
 from optiv_pan_lib.objects.url_category.serializer import entry_xpath, parent_xpath, to_xml
 from optiv_pan_lib.base.session import PanoramaSession
 
@@ -21,8 +24,39 @@ def list_predefined_url_categories(*, session: PanoramaSession) -> List[str]:
 def list_url_categories(*, session: PanoramaSession, candidate: bool = True, device_group: Optional[str] = None, ) -> List[UrlCategoryObject]:
     """List custom URL categories from candidate or running config."""
     xpath = parent_xpath(device_group)
+    if session.cache is None:
+        # Fast path: model straight from the ElementTree, no xmltodict/sanitize dict passes.
+        root = ops.config_get_element(session=session, xpath=xpath) if candidate else ops.config_show_element(session=session, xpath=xpath)
+        return metrics.build(session, "url_category", from_element, root, strict=True)
     result = ops.config_get(session=session, xpath=xpath) if candidate else ops.config_show(session=session, xpath=xpath)
-    return from_xml(result, strict=True)
+    return metrics.build(session, "url_category", from_xml, result, strict=True)
+
+
+def iter_url_categories(*, session: PanoramaSession, candidate: bool = True, device_group: Optional[str] = None, types: Optional[Collection[UrlCategoryType]] = None, name_prefix: Optional[str] = None, ) -> Iterator[UrlCategoryObject]:
+    """
+    Lazy list_url_categories: the response is stream-parsed one <entry> at a
+    time and each model is built only when consumed, after the types /
+    name_prefix filters (parser.iter_entries). Uncached.
+    """
+    xpath = parent_xpath(device_group)
+    fetch = ops.config_get_subtrees if candidate else ops.config_show_subtrees
+    subtrees = fetch(session=session, xpath=xpath, select=("custom-url-category/entry",))
+    return iter_entries((st.node for st in subtrees), strict=True, types=types, name_prefix=name_prefix)
+
+
+def iter_url_categories_chunked(*, session: PanoramaSession, candidate: bool = True, device_group: Optional[str] = None, chunk_size: int = chunked.DEFAULT_CHUNK_SIZE, max_workers: int = 1, types: Optional[Collection[UrlCategoryType]] = None, name_prefix: Optional[str] = None, ) -> Iterator[UrlCategoryObject]:
+    """
+    list_url_categories for very large containers: names first, then entries in batches of
+    chunk_size (max_workers fetched ahead), yielded as each batch arrives.
+    name_prefix narrows the name list before any entry is fetched.
+    See base.chunked.iter_batches for the consistency caveat.
+    """
+    xpath = parent_xpath(device_group)
+    names = chunked.entry_names(session=session, xpath=xpath, candidate=candidate)
+    if name_prefix is not None:
+        names = [n for n in names if n.startswith(name_prefix)]
+    for root in chunked.iter_batches(session=session, xpath=xpath, candidate=candidate, names=names, chunk_size=chunk_size, max_workers=max_workers):
+        yield from metrics.build(session, "url_category", lambda r: list(iter_element(r, strict=True, types=types)), root)
 
 
 def create_url_category(url_category: UrlCategoryObject, *, device_group: Optional[str], session: PanoramaSession, ) -> dict:
@@ -39,6 +73,19 @@ def update_url_category(url_category: UrlCategoryObject, *, device_group: Option
     return ops.config_edit(session=session, xpath=xpath, element=element)
 
 
+def create_url_categories(url_categories: Iterable[UrlCategoryObject], *, device_group: Optional[str], session: PanoramaSession, max_bytes: int = bulk.DEFAULT_MAX_BYTES, max_entries: int = bulk.DEFAULT_MAX_ENTRIES, ) -> BulkResult:
+    """Create (or merge) many custom URL category entries; one set per size-bounded chunk."""
+    xpath = parent_xpath(device_group)
+    items = [(o.key(), to_xml(o)) for o in url_categories]
+    return bulk.set_entries(session=session, xpath=xpath, items=items, max_bytes=max_bytes, max_entries=max_entries)
+
+
+def update_url_categories(url_categories: Iterable[UrlCategoryObject], *, device_group: Optional[str], session: PanoramaSession, max_bytes: int = bulk.DEFAULT_MAX_BYTES, max_entries: int = bulk.DEFAULT_MAX_ENTRIES, ) -> BulkResult:
+    """Replace many existing custom URL category entries in place; one multi-config request per chunk."""
+    items = [(o.key(), entry_xpath(o.name, device_group), to_xml(o)) for o in url_categories]
+    return bulk.edit_entries(session=session, items=items, max_bytes=max_bytes, max_entries=max_entries)
+
+
 def rename_url_category(*, old_name: str, new_name: str, device_group: Optional[str], session: PanoramaSession, ) -> dict:
     """Rename an existing custom URL category entry."""
     xpath = entry_xpath(old_name, device_group)
@@ -49,3 +96,28 @@ def delete_url_category(*, name: str, device_group: Optional[str], session: Pano
     """Delete a custom URL category entry."""
     xpath = entry_xpath(name, device_group)
     return ops.config_delete(session=session, xpath=xpath)
+
+
+def delete_url_categories(*, names: Iterable[str], device_group: Optional[str], session: PanoramaSession, max_bytes: int = bulk.DEFAULT_MAX_BYTES, max_entries: int = bulk.DEFAULT_MAX_ENTRIES, ) -> BulkResult:
+    """Delete many custom URL category entries; one multi-config request per chunk."""
+    items = [(n, entry_xpath(n, device_group)) for n in names]
+    return bulk.delete_entries(session=session, items=items, max_bytes=max_bytes, max_entries=max_entries)
+
+
+def reconcile_url_categories(desired: Iterable[UrlCategoryObject], *, device_group: Optional[str], session: PanoramaSession, prune: bool = False, dry_run: bool = False, ) -> ReconcileResult[UrlCategoryObject]:
+    """
+    Ensure the candidate container matches `desired` with the fewest writes.
+
+    Reads the container once, diffs by key() and content, then applies the
+    change set as batched writes. prune=True also deletes entries absent from
+    `desired`; dry_run=True only returns the plan.
+    """
+    current = list_url_categories(session=session, candidate=True, device_group=device_group)
+    plan = reconcile.plan(current, desired, prune=prune)
+    return reconcile.apply(
+        plan,
+        create=lambda objs: create_url_categories(objs, device_group=device_group, session=session),
+        update=lambda objs: update_url_categories(objs, device_group=device_group, session=session),
+        delete=lambda names: delete_url_categories(names=names, device_group=device_group, session=session),
+        dry_run=dry_run,
+    )
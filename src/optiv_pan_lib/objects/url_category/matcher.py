@@ -0,0 +1,184 @@
+# src/optiv_pan_lib/objects/url_category/matcher.py
+from __future__ import annotations
+
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .model import UrlCategoryObject
+
+# PAN-OS token separators; '*' and '^' are wildcards only as whole tokens.
+_TOKEN_RE = re.compile(r"[./?&=;+]|[^./?&=;+]+")
+_SEPARATORS = frozenset("./?&=;+")
+
+
+class _Node:
+    __slots__ = ("children", "star", "caret", "hits", "paths")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _Node] = {}
+        self.star: Optional[_Node] = None   # '*': one or more tokens
+        self.caret: Optional[_Node] = None  # '^': exactly one token
+        self.hits: List[int] = []           # path trie: category indexes ending here
+        self.paths: Optional[Dict[Optional[str], _Node]] = None  # host trie: port -> path trie
+
+    def step(self, token: str) -> _Node:
+        if token == "*":
+            self.star = self.star or _Node()
+            return self.star
+        if token == "^":
+            self.caret = self.caret or _Node()
+            return self.caret
+        return self.children.setdefault(token, _Node())
+
+
+def _split(url: str) -> Tuple[str, Optional[str], str]:
+    """'[scheme://][user@]host[:port][/path][?query]' -> (host, port, path); lowercased, fragment dropped."""
+    s = url.strip().lower()
+    i = s.find("://")
+    if i >= 0:
+        s = s[i + 3:]
+    s = s.lstrip("/")
+    s = s.partition("#")[0]
+    cut = len(s)
+    for sep in "/?":
+        j = s.find(sep)
+        if 0 <= j < cut:
+            cut = j
+    host, path = s[:cut], s[cut:]
+    host = host.rpartition("@")[2]
+    port: Optional[str] = None
+    if host.startswith("["):  # [v6]:port
+        end = host.find("]")
+        if host[end + 1:end + 2] == ":":
+            port = host[end + 2:] or None
+        host = host[:end + 1]
+    elif ":" in host:
+        host, _, port = host.partition(":")
+        port = port or None
+    if not path.startswith("/"):
+        path = "/" + path
+    return host.rstrip("."), port, path
+
+
+def _walk_host(node: _Node, labels: List[str], i: int, out: List[Dict[Optional[str], _Node]]) -> None:
+    if i == len(labels):
+        if node.paths is not None:
+            out.append(node.paths)
+        return
+    child = node.children.get(labels[i])
+    if child is not None:
+        _walk_host(child, labels, i + 1, out)
+    if node.caret is not None:
+        _walk_host(node.caret, labels, i + 1, out)
+    if node.star is not None:
+        for j in range(i + 1, len(labels) + 1):
+            _walk_host(node.star, labels, j, out)
+
+
+def _walk_path(node: _Node, tokens: List[str], i: int, out: set) -> None:
+    # Entries match as token prefixes: reaching a node with hits is a match.
+    if node.hits:
+        out.update(node.hits)
+    n = len(tokens)
+    if i == n:
+        return
+    child = node.children.get(tokens[i])
+    if child is not None:
+        _walk_path(child, tokens, i + 1, out)
+    if tokens[i] in _SEPARATORS:
+        return
+    if node.caret is not None:
+        _walk_path(node.caret, tokens, i + 1, out)
+    if node.star is not None:
+        for j in range(i + 1, n + 1):  # one or more tokens, ending on a word token
+            if tokens[j - 1] not in _SEPARATORS:
+                _walk_path(node.star, tokens, j, out)
+
+
+class UrlMatcher:
+    """
+    Offline matcher for custom "URL List" categories.
+
+    Entries follow the model's normalization (`host[:port]/path`): the host is
+    matched label by label, the path as a token prefix ('example.com/docs'
+    hits /docs, /docs/x and /docs.html but not /docsx). '*' stands for one or
+    more tokens, '^' for exactly one ('*.example.com' hits a.b.example.com,
+    '^.example.com' only a.example.com; neither hits example.com). Hosts and
+    paths compare case-insensitively, schemes are ignored, and an entry
+    without a port matches any port.
+
+    Hosts are kept in a trie of reversed labels (so leading wildcards sit at
+    the leaves) whose terminals hold forward path tries; host lookups are
+    memoized, which is what keeps proxy-log sized inputs fast. "Category
+    Match" categories reference PAN-OS predefined categories and are skipped.
+    """
+
+    def __init__(self, categories: Iterable[UrlCategoryObject], *, cache_size: int = 65536) -> None:
+        self._names: List[str] = []
+        self._root = _Node()
+        self._cache: Dict[Tuple[str, Optional[str]], List[_Node]] = {}
+        self._cache_size = cache_size
+        for cat in categories:
+            if cat.type != "URL List":
+                continue
+            idx = len(self._names)
+            self._names.append(cat.name)
+            for entry in cat.urls:
+                self._add(entry, idx)
+
+    @property
+    def categories(self) -> Tuple[str, ...]:
+        return tuple(self._names)
+
+    def _add(self, entry: str, idx: int) -> None:
+        host, port, path = _split(entry)
+        if not host:
+            return
+        node = self._root
+        for label in reversed(host.split(".")):
+            node = node.step(label)
+        if node.paths is None:
+            node.paths = {}
+        node = node.paths.setdefault(port, _Node())
+        for token in _TOKEN_RE.findall(path):
+            node = node.step(token)
+        if idx not in node.hits:
+            node.hits.append(idx)
+        self._cache.clear()
+
+    def _path_roots(self, host: str, port: Optional[str]) -> List[_Node]:
+        key = (host, port)
+        roots = self._cache.get(key)
+        if roots is None:
+            found: List[Dict[Optional[str], _Node]] = []
+            _walk_host(self._root, host.split(".")[::-1], 0, found)
+            roots = []
+            for by_port in found:
+                any_port = by_port.get(None)
+                if any_port is not None:
+                    roots.append(any_port)
+                if port is not None and port in by_port:
+                    roots.append(by_port[port])
+            if len(self._cache) >= self._cache_size:
+                self._cache.clear()
+            self._cache[key] = roots
+        return roots
+
+    def match(self, url: str) -> Tuple[str, ...]:
+        """Every category with an entry matching url, in category order."""
+        host, port, path = _split(url)
+        roots = self._path_roots(host, port)
+        if not roots:
+            return ()
+        tokens = _TOKEN_RE.findall(path)
+        hits: set = set()
+        for root in roots:
+            _walk_path(root, tokens, 0, hits)
+        names = self._names
+        return tuple(names[i] for i in sorted(hits))
+
+    def match_many(self, urls: Iterable[str]) -> Iterator[Tuple[str, Tuple[str, ...]]]:
+        """(url, categories) for each url, lazily."""
+        match = self.match
+        for url in urls:
+            yield url, match(url)
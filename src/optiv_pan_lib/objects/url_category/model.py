@@ -79,5 +79,27 @@ class UrlCategoryObject:
         else:
             raise ValueError(f"invalid type: {self.type}")
 
+    @classmethod
+    def trusted(
+            cls,
+            name: str,
+            type: UrlCategoryType,
+            urls: tuple[str, ...] = (),
+            categories: tuple[str, ...] = (),
+            description: str | None = None,
+            ) -> "UrlCategoryObject":
+        """
+        Construct from already-normalized fields (e.g. a snapshot of built
+        models), skipping normalization and validation.
+        """
+        obj = object.__new__(cls)
+        setattr_ = object.__setattr__
+        setattr_(obj, "name", name)
+        setattr_(obj, "type", type)
+        setattr_(obj, "urls", urls)
+        setattr_(obj, "categories", categories)
+        setattr_(obj, "description", description)
+        return obj
+
     def key(self) -> str:
         return self.name
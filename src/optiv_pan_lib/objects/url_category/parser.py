@@ -1,10 +1,11 @@
 # src/optiv_lib/providers/pan/objects/url_category/parser.py
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List
+import xml.etree.ElementTree as ET
+from typing import Any, Collection, Dict, Iterable, Iterator, List, Optional
 
 from .model import UrlCategoryObject, UrlCategoryType
-from optiv_pan_lib.base.util import as_list, collect_members, node_text
+from optiv_pan_lib.base.util import as_list, collect_members, element_members, element_text, node_text
 
 
 class UrlCategoryParseError(ValueError):
@@ -19,15 +20,36 @@ def from_xml(result: Dict[str, Any], *, strict: bool = True) -> List[UrlCategory
     """
     Convert ops.config_show/get result (inner 'result') into UrlCategoryObject items.
     """
-    entries = _pick_entries(result)
-    objs: List[UrlCategoryObject] = []
+    return list(iter_entries(_pick_entries(result), strict=strict))
+
+
+def iter_xml(result: Dict[str, Any], *, strict: bool = True, types: Optional[Collection[UrlCategoryType]] = None, name_prefix: Optional[str] = None, ) -> Iterator[UrlCategoryObject]:
+    """Lazy from_xml; see iter_entries for the filters."""
+    return iter_entries(_pick_entries(result), strict=strict, types=types, name_prefix=name_prefix)
+
+
+def iter_entries(entries: Iterable[Dict[str, Any]], *, strict: bool = True, types: Optional[Collection[UrlCategoryType]] = None, name_prefix: Optional[str] = None, ) -> Iterator[UrlCategoryObject]:
+    """
+    Build UrlCategoryObject items from xmltodict-shaped <entry> dicts one at
+    a time, as they are consumed. types / name_prefix filter the raw entry
+    before any model is built; skipped entries never raise.
+    """
     for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        if name_prefix is not None and not (entry.get("@name") or "").strip().startswith(name_prefix):
+            continue
+        if types is not None and _entry_type(node_text(entry.get("type"))) not in types:
+            continue
         try:
-            objs.append(_xml_entry_to_model(entry))
+            yield _xml_entry_to_model(entry)
         except Exception as exc:
             if strict:
                 raise UrlCategoryParseError(f"failed to parse url-category entry: {exc}") from exc
-    return objs
+
+
+def _entry_type(type_text: Optional[str]) -> UrlCategoryType:
+    return "Category Match" if (type_text or "").strip() == "Category Match" else "URL List"
 
 
 def _pick_entries(result: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -45,8 +67,7 @@ def _xml_entry_to_model(entry: Dict[str, Any]) -> UrlCategoryObject:
     if not name:
         raise ValueError("missing @name")
 
-    type_text = node_text(entry.get("type")) or "URL List"
-    type_val: UrlCategoryType = "Category Match" if type_text.strip() == "Category Match" else "URL List"
+    type_val = _entry_type(node_text(entry.get("type")))
 
     description = node_text(entry.get("description"))
     members = collect_members(entry.get("list"))
@@ -56,6 +77,49 @@ def _xml_entry_to_model(entry: Dict[str, Any]) -> UrlCategoryObject:
         return UrlCategoryObject(name=name, type=type_val, categories=tuple(members), description=description)
 
 
+# ----------------------------
+# Element → model (fast path)
+# ----------------------------
+
+def from_element(result: ET.Element, *, strict: bool = True) -> List[UrlCategoryObject]:
+    """
+    from_xml for the <result> Element of ops.config_get_element/config_show_element.
+    Reads entries straight off the tree; same results and errors as from_xml.
+    """
+    return list(iter_element(result, strict=strict))
+
+
+def iter_element(result: ET.Element, *, strict: bool = True, types: Optional[Collection[UrlCategoryType]] = None, name_prefix: Optional[str] = None, ) -> Iterator[UrlCategoryObject]:
+    """Lazy from_element, with the same pre-construction filters as iter_entries."""
+    cuc = result.find("custom-url-category")
+    entries = cuc.findall("entry") if cuc is not None and cuc.find("entry") is not None else result.findall("entry")
+    for entry in entries:
+        if name_prefix is not None and not (entry.get("name") or "").strip().startswith(name_prefix):
+            continue
+        if types is not None and _entry_type(element_text(entry.find("type"))) not in types:
+            continue
+        try:
+            yield _element_entry_to_model(entry)
+        except Exception as exc:
+            if strict:
+                raise UrlCategoryParseError(f"failed to parse url-category entry: {exc}") from exc
+
+
+def _element_entry_to_model(entry: ET.Element) -> UrlCategoryObject:
+    name = (entry.get("name") or "").strip()
+    if not name:
+        raise ValueError("missing @name")
+
+    type_val = _entry_type(element_text(entry.find("type")))
+
+    description = element_text(entry.find("description"))
+    members = element_members(entry.find("list"))
+    if type_val == "URL List":
+        return UrlCategoryObject(name=name, type=type_val, urls=tuple(members), description=description)
+    else:
+        return UrlCategoryObject(name=name, type=type_val, categories=tuple(members), description=description)
+
+
 # ----------------------------
 # JSON → model
 # ----------------------------
@@ -0,0 +1,145 @@
+# src/optiv_pan_lib/panorama/device_groups/api.py
+from __future__ import annotations
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from optiv_pan_lib.base import ops
+from optiv_pan_lib.base.session import PanoramaSession
+from optiv_pan_lib.base.stream import Subtree
+from optiv_pan_lib.base.util import as_list, node_text
+from optiv_pan_lib.objects.address import parser as address_parser
+from optiv_pan_lib.objects.address.api import list_addresses
+from optiv_pan_lib.objects.address.model import AddressObject
+from optiv_pan_lib.objects.url_category import parser as url_category_parser
+from optiv_pan_lib.objects.url_category.api import list_url_categories
+from optiv_pan_lib.objects.url_category.model import UrlCategoryObject
+from optiv_pan_lib.panorama.device_groups.model import ConfigObjects, DeviceGroupHierarchy, EffectiveObjects, Scope
+
+T = TypeVar("T")
+
+ScopeFetch = Callable[..., List[T]]  # fn(session=..., candidate=..., device_group=<scope>) -> objects
+
+DEFAULT_MAX_WORKERS = 8
+
+
+def _walk(nodes: Any, parent: Optional[str], out: Dict[str, Optional[str]]) -> None:
+    for node in as_list(nodes):
+        if not isinstance(node, dict):
+            continue
+        name = node.get("@name")
+        if not name:
+            continue
+        out[name] = parent
+        _walk(node.get("dg"), name, out)
+
+
+def get_hierarchy(*, session: PanoramaSession) -> DeviceGroupHierarchy:
+    """
+    Panorama → show dg-hierarchy
+    Returns the device-group tree.
+    """
+    cmd = "<show><dg-hierarchy></dg-hierarchy></show>"
+    result = ops.op(session=session, cmd=cmd)
+    parents: Dict[str, Optional[str]] = {}
+    _walk((result.get("dg-hierarchy") or {}).get("dg"), None, parents)
+    return DeviceGroupHierarchy(parents)
+
+
+def collect(
+        fetch: ScopeFetch[T],
+        *,
+        session: PanoramaSession,
+        hierarchy: Optional[DeviceGroupHierarchy] = None,
+        candidate: bool = True,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        ) -> EffectiveObjects[T]:
+    """
+    Fetch shared and every device group's container concurrently and return
+    the merged, inheritance-aware view. The hierarchy is discovered with
+    get_hierarchy() unless given. Any failing scope raises.
+    """
+    if hierarchy is None:
+        hierarchy = get_hierarchy(session=session)
+    scopes: List[Scope] = [None, *hierarchy]
+
+    def one(scope: Scope) -> List[T]:
+        return fetch(session=session, candidate=candidate, device_group=scope)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(scopes))), thread_name_prefix="pan-dg") as pool:
+        objects = dict(zip(scopes, pool.map(one, scopes)))
+    return EffectiveObjects(hierarchy, objects)
+
+
+def collect_addresses(*, session: PanoramaSession, hierarchy: Optional[DeviceGroupHierarchy] = None, candidate: bool = True, max_workers: int = DEFAULT_MAX_WORKERS, ) -> EffectiveObjects[AddressObject]:
+    """Address objects of shared and all device groups, see collect()."""
+    return collect(list_addresses, session=session, hierarchy=hierarchy, candidate=candidate, max_workers=max_workers)
+
+
+def collect_url_categories(*, session: PanoramaSession, hierarchy: Optional[DeviceGroupHierarchy] = None, candidate: bool = True, max_workers: int = DEFAULT_MAX_WORKERS, ) -> EffectiveObjects[UrlCategoryObject]:
+    """Custom URL categories of shared and all device groups, see collect()."""
+    return collect(list_url_categories, session=session, hierarchy=hierarchy, candidate=candidate, max_workers=max_workers)
+
+
+# ----------------------------
+# Whole-config export
+# ----------------------------
+
+_EXPORT_SELECT = (
+    "shared/address/entry",
+    "shared/profiles/custom-url-category/entry",
+    "device-group/entry/address/entry",
+    "device-group/entry/profiles/custom-url-category/entry",
+    "readonly/devices/entry/device-group/entry",
+    )
+_EXPORT_PATH_RE = re.compile(
+    r"^/config/(?:shared|devices/entry\[@name='[^']*'\]/device-group/entry\[@name='(?P<dg>.*?)'\])"
+    r"/(?P<kind>address|profiles/custom-url-category)/entry\["
+    )
+_READONLY_DG_RE = re.compile(r"^/config/readonly/devices/entry\[@name='[^']*'\]/device-group/entry\[")
+
+_ExportKey = Tuple[str, Scope]  # (kind, scope); kind "" = not an object entry
+
+
+def _export_key(st: Subtree) -> _ExportKey:
+    m = _EXPORT_PATH_RE.match(st.path)
+    if m is None:
+        return ("readonly" if _READONLY_DG_RE.match(st.path) else ""), None
+    return m.group("kind"), m.group("dg")
+
+
+def export_objects(*, session: PanoramaSession, name: Optional[str] = None, strict: bool = True) -> ConfigObjects:
+    """
+    Address objects and custom URL categories of shared and every device
+    group from a single configuration export (ops.export_configuration_subtrees)
+    instead of one config_get per scope. Reads the running config, or the
+    saved config `name`. Entries are parsed as the download streams in; the
+    hierarchy comes from the export's readonly section (parent-dg), with
+    device groups missing there treated as top-level.
+
+    Other selected paths (template 'shared' sections and the like) are ignored.
+    """
+    subtrees = ops.export_configuration_subtrees(session=session, select=_EXPORT_SELECT, name=name)
+    addresses: Dict[Scope, List[AddressObject]] = {}
+    url_categories: Dict[Scope, List[UrlCategoryObject]] = {}
+    parents: Dict[str, Optional[str]] = {}
+
+    # Entries of one container arrive back to back, so each run is parsed in one pass.
+    for (kind, scope), run in groupby(subtrees, key=_export_key):
+        entries = (st.node for st in run)
+        if kind == "address":
+            addresses.setdefault(scope, []).extend(address_parser.iter_entries(entries, strict=strict))
+        elif kind == "profiles/custom-url-category":
+            url_categories.setdefault(scope, []).extend(url_category_parser.iter_entries(entries, strict=strict))
+        elif kind == "readonly":
+            for e in entries:
+                if isinstance(e, dict) and e.get("@name"):
+                    parents[e["@name"]] = node_text(e.get("parent-dg"))
+
+    for scope in (*addresses, *url_categories):
+        if scope is not None:
+            parents.setdefault(scope, None)
+    hierarchy = DeviceGroupHierarchy(parents)
+    return ConfigObjects(hierarchy, EffectiveObjects(hierarchy, addresses), EffectiveObjects(hierarchy, url_categories))
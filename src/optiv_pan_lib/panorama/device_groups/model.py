@@ -0,0 +1,134 @@
+# src/optiv_pan_lib/panorama/device_groups/model.py
+from __future__ import annotations
+
+from collections import ChainMap
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, Dict, Generic, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, TypeVar
+
+from optiv_pan_lib.objects.address.model import AddressObject
+from optiv_pan_lib.objects.url_category.model import UrlCategoryObject
+
+Scope = Optional[str]  # device group name; None = shared
+
+T = TypeVar("T")
+
+
+class DeviceGroupHierarchy:
+    """
+    Device-group tree under shared. `parents` maps each device group to its
+    parent (None = directly under shared). Ancestor chains are computed once.
+    """
+
+    __slots__ = ("_parents", "_chains", "_children")
+
+    def __init__(self, parents: Mapping[str, Optional[str]]) -> None:
+        self._parents: Dict[str, Optional[str]] = dict(parents)
+        self._children: Dict[Scope, List[str]] = {None: []}
+        for dg in self._parents:
+            self._children.setdefault(dg, [])
+        for dg, parent in self._parents.items():
+            if parent is not None and parent not in self._parents:
+                raise ValueError(f"device group {dg!r}: unknown parent {parent!r}")
+            self._children[parent].append(dg)
+        self._chains: Dict[str, Tuple[str, ...]] = {}
+        for dg in self._parents:
+            self._chain(dg)
+
+    def _chain(self, dg: str) -> Tuple[str, ...]:
+        chain = self._chains.get(dg)
+        if chain is not None:
+            return chain
+        seen: List[str] = []
+        node: Optional[str] = dg
+        while node is not None and node not in self._chains:
+            if node in seen:
+                raise ValueError(f"device group cycle through {node!r}")
+            seen.append(node)
+            node = self._parents[node]
+        tail = self._chains[node] if node is not None else ()
+        for n in reversed(seen):
+            tail = (n, *tail)
+            self._chains[n] = tail
+        return self._chains[dg]
+
+    def __contains__(self, dg: object) -> bool:
+        return dg in self._parents
+
+    def __iter__(self) -> Iterator[str]:
+        """Device groups, parents before children."""
+        stack = list(reversed(self._children[None]))
+        while stack:
+            dg = stack.pop()
+            yield dg
+            stack.extend(reversed(self._children[dg]))
+
+    def __len__(self) -> int:
+        return len(self._parents)
+
+    def parent(self, dg: str) -> Optional[str]:
+        return self._parents[dg]
+
+    def children(self, dg: Scope = None) -> Tuple[str, ...]:
+        return tuple(self._children[dg])
+
+    def ancestors(self, dg: str) -> Tuple[str, ...]:
+        """Parent first, up to the top-level device group (shared not included)."""
+        return self._chains[dg][1:]
+
+    def scopes(self, dg: Scope) -> Tuple[Scope, ...]:
+        """Lookup order for objects visible in dg: dg, its ancestors, then shared."""
+        return (None,) if dg is None else (*self._chains[dg], None)
+
+
+class EffectiveObjects(Generic[T]):
+    """
+    Objects per scope plus the hierarchy they live in.
+
+    effective(dg) is what dg sees: its own objects, then each ancestor's,
+    then shared, a name defined closer to dg hiding the same name further
+    up. Views are ChainMaps over the per-scope dicts, built once per device
+    group and shared by every later query.
+    """
+
+    __slots__ = ("hierarchy", "_own", "_views")
+
+    def __init__(self, hierarchy: DeviceGroupHierarchy, objects: Mapping[Scope, Iterable[T]], *, key: Callable[[T], str] = lambda o: o.name) -> None:  # type: ignore[attr-defined]
+        self.hierarchy = hierarchy
+        self._own: Dict[Scope, Dict[str, T]] = {scope: {key(o): o for o in objs} for scope, objs in objects.items()}
+        self._views: Dict[Scope, Mapping[str, T]] = {}
+
+    def own(self, dg: Scope) -> Mapping[str, T]:
+        """Objects defined directly in dg (None = shared)."""
+        return MappingProxyType(self._own.get(dg, {}))
+
+    def effective(self, dg: Scope) -> Mapping[str, T]:
+        """Read-only name → object view of everything visible in dg."""
+        view = self._views.get(dg)
+        if view is None:
+            if dg is not None and dg not in self.hierarchy:
+                raise KeyError(f"unknown device group: {dg!r}")
+            view = self._views[dg] = MappingProxyType(ChainMap(*(self._own.get(s, {}) for s in self.hierarchy.scopes(dg))))
+        return view
+
+    def resolve(self, dg: Scope, name: str) -> Optional[Tuple[Scope, T]]:
+        """(defining scope, object) for name as seen from dg, or None."""
+        for scope in self.hierarchy.scopes(dg):
+            obj = self._own.get(scope, {}).get(name)
+            if obj is not None:
+                return scope, obj
+        return None
+
+    def overridden(self, dg: str) -> Sequence[str]:
+        """Names defined in dg that hide an object of the same name further up."""
+        own = self._own.get(dg, {})
+        above = self.effective(self.hierarchy.parent(dg))
+        return sorted(n for n in own if n in above)
+
+
+@dataclass(slots=True, frozen=True)
+class ConfigObjects:
+    """Objects of every scope read from one configuration export."""
+    hierarchy: DeviceGroupHierarchy
+    addresses: EffectiveObjects[AddressObject]
+    url_categories: EffectiveObjects[UrlCategoryObject]
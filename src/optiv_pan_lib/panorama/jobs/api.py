@@ -0,0 +1,381 @@
+# src/optiv_pan_lib/panorama/jobs/api.py
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, InvalidStateError, wait
+from time import monotonic
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+from optiv_pan_lib.base import ops
+from optiv_pan_lib.base.session import PanoramaAPIError, PanoramaAuthError, PanoramaSession
+from optiv_pan_lib.base.util import as_list, node_text
+from optiv_pan_lib.panorama.jobs.model import Job, job_from_dict
+
+DEFAULT_MIN_INTERVAL = 1.0
+DEFAULT_MAX_INTERVAL = 15.0
+DEFAULT_BACKOFF = 1.5
+DEFAULT_BATCH_THRESHOLD = 3  # outstanding jobs at which one `show jobs all` replaces per-id polls
+DEFAULT_MAX_ERRORS = 5
+
+_POLLERS: Dict[str, "JobPoller"] = {}
+_POLLERS_LOCK = threading.Lock()
+
+
+class JobTimeoutError(TimeoutError):
+    """Set on a job's future when it is still unfinished at its deadline."""
+
+
+# ---------------------------
+# show jobs
+# ---------------------------
+
+def show_job(*, session: PanoramaSession, job_id: int) -> Job:
+    """Panorama → show jobs id <job_id>"""
+    result = ops.op(session=session, cmd=f"<show><jobs><id>{int(job_id)}</id></jobs></show>")
+    for j in as_list(result.get("job")):
+        if isinstance(j, dict):
+            return job_from_dict(j)
+    raise LookupError(f"job {job_id} not found")
+
+
+def show_jobs(*, session: PanoramaSession) -> List[Job]:
+    """Panorama → show jobs all (every job Panorama still remembers)."""
+    result = ops.op(session=session, cmd="<show><jobs><all></all></jobs></show>")
+    return [job_from_dict(j) for j in as_list(result.get("job")) if isinstance(j, dict)]
+
+
+# ---------------------------
+# Poller
+# ---------------------------
+
+class JobPoller:
+    """
+    Tracks many outstanding jobs of one Panorama from a single background
+    thread. Each job is polled with the session it was tracked with
+    (`session` is only the default), so credentials, sanitize, rate limiter
+    and metrics hooks stay the caller's; the poller lets go of a session
+    once its jobs are settled.
+
+    Each round polls every tracked job at once: one `show jobs all` when at
+    least `batch_threshold` jobs are outstanding (jobs missing from the
+    listing are asked for by id), otherwise `show jobs id` per job; jobs
+    tracked with different sessions are polled per session. The
+    interval starts at `min_interval`, grows by `backoff` up to
+    `max_interval` while nothing changes, and drops back to `min_interval`
+    whenever a job moves or a new one is tracked.
+
+    track() returns a Future resolved with the finished Job (failed jobs
+    included; see Job.raise_for_status). A job Panorama cannot report on
+    (`show jobs id` error) fails only its own future. Transport errors are
+    retried on the next round; after `max_errors` failed rounds in a row
+    the futures whose poll failed get the error. Cancelling a future stops
+    tracking that job (the job itself keeps running). The thread exits
+    when nothing is outstanding.
+    """
+
+    def __init__(
+            self,
+            *,
+            session: Optional[PanoramaSession] = None,
+            min_interval: float = DEFAULT_MIN_INTERVAL,
+            max_interval: float = DEFAULT_MAX_INTERVAL,
+            backoff: float = DEFAULT_BACKOFF,
+            batch_threshold: int = DEFAULT_BATCH_THRESHOLD,
+            max_errors: int = DEFAULT_MAX_ERRORS,
+            ):
+        if min_interval <= 0 or max_interval < min_interval or backoff < 1:
+            raise ValueError("need 0 < min_interval <= max_interval and backoff >= 1")
+        self.session = session
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.batch_threshold = max(1, batch_threshold)
+        self.max_errors = max(1, max_errors)
+        self.requests = 0
+
+        self._jobs: Dict[int, Tuple[Future[Job], Optional[float], PanoramaSession]] = {}  # id → (future, deadline, session to poll with)
+        self._seen: Dict[int, Tuple[Optional[str], int]] = {}  # id → (status, progress) last round
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._kick = False
+
+    def __len__(self) -> int:
+        with self._cond:
+            return len(self._jobs)
+
+    def track(
+            self,
+            job_id: int,
+            *,
+            session: Optional[PanoramaSession] = None,
+            callback: Optional[Callable[[Future[Job]], None]] = None,
+            timeout: Optional[float] = None,
+            ) -> Future[Job]:
+        """
+        Future for job_id (the same one when it is already tracked).
+        session polls this job (default: the poller's); callback(future)
+        runs on completion; timeout is in seconds from now.
+        """
+        job_id = int(job_id)
+        session = session or self.session
+        if session is None:
+            raise ValueError("no session to poll with: pass session= here or to JobPoller()")
+        with self._cond:
+            entry = self._jobs.get(job_id)
+            if entry is None or entry[0].cancelled():
+                # Left PENDING (never set_running) so Future.cancel() and cancel_all() take effect.
+                entry = self._jobs[job_id] = (Future(), None if timeout is None else monotonic() + timeout, session)
+                self._kick = True
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="pan-jobs", daemon=True)
+                    self._thread.start()
+                self._cond.notify()
+        if callback is not None:
+            entry[0].add_done_callback(callback)
+        return entry[0]
+
+    def cancel_all(self) -> int:
+        """Stop tracking everything; outstanding futures are cancelled (the jobs keep running)."""
+        with self._cond:
+            jobs, self._jobs = self._jobs, {}
+            self._cond.notify()
+        for fut, _, _ in jobs.values():
+            fut.cancel()
+        return len(jobs)
+
+    # ---- background thread ----
+
+    def _run(self) -> None:
+        interval = self.min_interval
+        next_poll = monotonic() + interval
+        errors = 0
+        while True:
+            with self._cond:
+                if not self._jobs:
+                    self._thread = None
+                    return
+                if self._kick:  # new job: poll again soon even if the interval had grown
+                    self._kick = False
+                    interval = self.min_interval
+                    next_poll = min(next_poll, monotonic() + interval)
+                delay = next_poll - monotonic()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                groups: Dict[PanoramaSession, List[int]] = {}
+                for job_id, (_, _, session) in self._jobs.items():
+                    groups.setdefault(session, []).append(job_id)
+
+            jobs: Dict[int, Job | Exception] = {}
+            failed: List[int] = []
+            error: Optional[Exception] = None
+            for session, ids in groups.items():
+                try:
+                    jobs.update(self._poll(session, ids))
+                except Exception as exc:
+                    failed.extend(ids)
+                    error = exc
+            changed = self._settle(jobs)
+            if error is not None:
+                errors += 1
+                if errors >= self.max_errors:
+                    self._fail(failed, error)
+                    errors = 0
+                interval = self.max_interval
+            else:
+                errors = 0
+                interval = self.min_interval if changed else min(self.max_interval, interval * self.backoff)
+            next_poll = monotonic() + interval
+
+    def _poll(self, session: PanoramaSession, ids: List[int]) -> Dict[int, Job | Exception]:
+        """
+        Job (or the error asking for it) per id. A failing `show jobs all`
+        fails the round; a failing `show jobs id` only that job.
+        """
+        found: Dict[int, Job | Exception] = {}
+        if len(ids) >= self.batch_threshold:
+            self.requests += 1
+            wanted = set(ids)
+            found = {j.id: j for j in show_jobs(session=session) if j.id in wanted}
+        for job_id in ids:
+            if job_id not in found:
+                self.requests += 1
+                try:
+                    found[job_id] = show_job(session=session, job_id=job_id)
+                except PanoramaAuthError:
+                    raise
+                except (LookupError, PanoramaAPIError) as exc:  # Panorama answered: this id is the problem
+                    found[job_id] = exc
+        return found
+
+    def _settle(self, jobs: Dict[int, Job | Exception]) -> bool:
+        """Resolve finished, failed-to-poll and expired jobs; True when any job moved since the last round."""
+        changed = False
+        now = monotonic()
+        resolved: List[Tuple[Future[Job], Job | BaseException]] = []
+        with self._cond:
+            for job_id, job in jobs.items():
+                entry = self._jobs.get(job_id)
+                if entry is None:  # cancelled meanwhile
+                    continue
+                if entry[0].cancelled() or isinstance(job, Exception):
+                    outcome: Optional[Job | BaseException] = None if entry[0].cancelled() else job
+                else:
+                    state = (job.status, job.progress)
+                    if self._seen.get(job_id) != state:
+                        self._seen[job_id] = state
+                        changed = True
+                    if job.done:
+                        outcome = job
+                    elif entry[1] is not None and now >= entry[1]:
+                        outcome = JobTimeoutError(f"job {job_id} not finished in time")
+                    else:
+                        continue
+                del self._jobs[job_id]
+                self._seen.pop(job_id, None)
+                if outcome is not None:
+                    resolved.append((entry[0], outcome))
+
+        for fut, outcome in resolved:
+            _resolve(fut, outcome)
+        return changed
+
+    def _fail(self, ids: List[int], exc: BaseException) -> None:
+        futures: List[Future[Job]] = []
+        with self._cond:
+            for job_id in ids:
+                entry = self._jobs.pop(job_id, None)
+                self._seen.pop(job_id, None)
+                if entry is not None:
+                    futures.append(entry[0])
+        for fut in futures:
+            _resolve(fut, exc)
+
+
+def _resolve(fut: Future[Job], outcome: Job | BaseException) -> None:
+    try:
+        if isinstance(outcome, BaseException):
+            fut.set_exception(outcome)
+        else:
+            fut.set_result(outcome)
+    except InvalidStateError:  # cancelled by the caller in the meantime
+        pass
+
+
+def poller_for(session: PanoramaSession, **kwargs: Any) -> JobPoller:
+    """
+    Process-wide JobPoller per Panorama (keyed by base_url). It holds no
+    session of its own: pass session= to track() (JobHandle does), and each
+    job is polled with the session that tracked it. Settings passed once it
+    exists must match.
+    """
+    with _POLLERS_LOCK:
+        poller = _POLLERS.get(session.base_url)
+        if poller is None:
+            return _POLLERS.setdefault(session.base_url, JobPoller(**kwargs))
+    differs = {k: v for k, v in kwargs.items() if getattr(poller, k) != v}
+    if differs:
+        raise ValueError(f"job poller for {session.base_url} already exists with different settings: {sorted(differs)}")
+    return poller
+
+
+# ---------------------------
+# Handles
+# ---------------------------
+
+class JobHandle:
+    """An enqueued commit/push job. Completion is tracked by the (shared) JobPoller."""
+
+    __slots__ = ("id", "session", "poller", "_future")
+
+    def __init__(self, job_id: int, *, session: PanoramaSession, poller: Optional[JobPoller] = None) -> None:
+        self.id = int(job_id)
+        self.session = session
+        self.poller = poller
+        self._future: Optional[Future[Job]] = None
+
+    def __repr__(self) -> str:
+        return f"JobHandle(id={self.id})"
+
+    @property
+    def future(self) -> Future[Job]:
+        if self._future is None:
+            if self.poller is None:
+                self.poller = poller_for(self.session)
+            self._future = self.poller.track(self.id, session=self.session)
+        return self._future
+
+    def status(self) -> Job:
+        """Current state from one `show jobs id` call (not through the poller)."""
+        return show_job(session=self.session, job_id=self.id)
+
+    def result(self, timeout: Optional[float] = None) -> Job:
+        """Block until the job finishes and return it (failed jobs included)."""
+        return self.future.result(timeout)
+
+    def add_done_callback(self, fn: Callable[[Future[Job]], None]) -> None:
+        self.future.add_done_callback(fn)
+
+    def done(self) -> bool:
+        return self.future.done()
+
+
+def wait_all(handles: Iterable[JobHandle], *, timeout: Optional[float] = None) -> List[Job]:
+    """Finished Jobs for handles, in order. Raises TimeoutError if any is still running at timeout."""
+    handles = list(handles)
+    done, pending = wait([h.future for h in handles], timeout=timeout)
+    if pending:
+        raise TimeoutError(f"{len(pending)} of {len(handles)} jobs still running")
+    return [h.future.result() for h in handles]
+
+
+# ---------------------------
+# Commit / push
+# ---------------------------
+
+def _enqueued(result: dict, *, session: PanoramaSession, poller: Optional[JobPoller]) -> Optional[JobHandle]:
+    job_id = node_text(result.get("job"))
+    return JobHandle(int(job_id), session=session, poller=poller) if job_id and job_id.isdigit() else None
+
+
+def _description(description: Optional[str]) -> str:
+    return f"<description>{escape(description)}</description>" if description else ""
+
+
+def commit(*, session: PanoramaSession, description: Optional[str] = None, poller: Optional[JobPoller] = None) -> Optional[JobHandle]:
+    """
+    Commit the Panorama candidate config.
+    Returns the job handle, or None when there was nothing to commit.
+    """
+    result = ops.commit(session=session, cmd=f"<commit>{_description(description)}</commit>")
+    return _enqueued(result, session=session, poller=poller)
+
+
+def push_device_groups(
+        *,
+        session: PanoramaSession,
+        device_groups: Iterable[str],
+        description: Optional[str] = None,
+        include_template: bool = False,
+        merge_with_candidate: bool = False,
+        poller: Optional[JobPoller] = None,
+        ) -> Optional[JobHandle]:
+    """
+    Commit-all (push) shared policy to the devices of device_groups as one job.
+    For independent per-group jobs call it once per device group; the shared
+    poller still polls them together.
+    """
+    entries = "".join(f"<entry name={quoteattr(dg)}/>" for dg in device_groups)
+    if not entries:
+        raise ValueError("at least one device group is required")
+    opts = ("<include-template>yes</include-template>" if include_template else "") + (
+        "<merge-with-candidate-cfg>yes</merge-with-candidate-cfg>" if merge_with_candidate else "")
+    cmd = f"<commit-all><shared-policy><device-group>{entries}</device-group>{opts}{_description(description)}</shared-policy></commit-all>"
+    return _enqueued(ops.commit(session=session, cmd=cmd, action="all"), session=session, poller=poller)
+
+
+def push_template(*, session: PanoramaSession, template: str, description: Optional[str] = None, poller: Optional[JobPoller] = None) -> Optional[JobHandle]:
+    """Commit-all (push) one template (or template stack) to its devices."""
+    cmd = f"<commit-all><template><name>{escape(template)}</name>{_description(description)}</template></commit-all>"
+    return _enqueued(ops.commit(session=session, cmd=cmd, action="all"), session=session, poller=poller)
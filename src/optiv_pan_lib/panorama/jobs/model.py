@@ -0,0 +1,94 @@
+# src/optiv_pan_lib/panorama/jobs/model.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from optiv_pan_lib.base.session import PanoramaAPIError
+from optiv_pan_lib.base.util import as_list, node_text
+
+
+class JobFailedError(PanoramaAPIError):
+    """Raised by Job.raise_for_status() for a finished job whose result is not OK."""
+
+    def __init__(self, job: "Job") -> None:
+        detail = "; ".join(job.details) or "no details"
+        super().__init__(f"{job.type or 'job'} {job.id} {job.result or job.status}: {detail}")
+        self.job = job
+
+
+@dataclass(slots=True, frozen=True)
+class JobDevice:
+    """Per-device outcome of a commit-all (push) job."""
+    serial: str
+    name: Optional[str] = None
+    status: Optional[str] = None
+    result: Optional[str] = None
+    details: Tuple[str, ...] = ()
+
+    @property
+    def ok(self) -> bool:
+        return self.result == "OK"
+
+
+@dataclass(slots=True, frozen=True)
+class Job:
+    """
+    One `show jobs` entry. status is ACT / PEND / FIN; result is OK / FAIL
+    (PEND until finished); progress is a percentage.
+    """
+    id: int
+    type: Optional[str] = None
+    status: Optional[str] = None
+    result: Optional[str] = None
+    progress: int = 0
+    description: Optional[str] = None
+    details: Tuple[str, ...] = ()
+    warnings: Tuple[str, ...] = ()
+    devices: Tuple[JobDevice, ...] = ()
+
+    @property
+    def done(self) -> bool:
+        return self.status == "FIN"
+
+    @property
+    def ok(self) -> bool:
+        return self.done and self.result == "OK" and all(d.ok for d in self.devices)
+
+    def raise_for_status(self) -> "Job":
+        if self.done and not self.ok:
+            raise JobFailedError(self)
+        return self
+
+
+def _lines(node: Any) -> Tuple[str, ...]:
+    """<details>/<warnings> text: plain text or nested <line> elements."""
+    if isinstance(node, dict) and "line" in node:
+        node = node["line"]
+    return tuple(v for v in (node_text(n) for n in as_list(node)) if v)
+
+
+def job_from_dict(d: Dict[str, Any]) -> Job:
+    """Job from an xmltodict-shaped <job> node of `show jobs`."""
+    progress = node_text(d.get("progress")) or "0"
+    devices = (d.get("devices") or {}) if isinstance(d.get("devices"), dict) else {}
+    return Job(
+        id=int(node_text(d.get("id")) or 0),
+        type=node_text(d.get("type")),
+        status=node_text(d.get("status")),
+        result=node_text(d.get("result")),
+        progress=int(progress) if progress.isdigit() else 0,
+        description=node_text(d.get("description")),
+        details=_lines(d.get("details")),
+        warnings=_lines(d.get("warnings")),
+        devices=tuple(
+            JobDevice(
+                serial=node_text(e.get("serial-no")) or node_text(e.get("serial")) or "",
+                name=node_text(e.get("devicename")),
+                status=node_text(e.get("status")),
+                result=node_text(e.get("result")),
+                details=_lines(e.get("details")),
+                )
+            for e in as_list(devices.get("entry")) if isinstance(e, dict)
+            ),
+        )
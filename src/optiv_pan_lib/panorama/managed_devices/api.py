@@ -1,8 +1,13 @@
 # src/optiv_lib/providers/pan/panorama/managed_devices/api.py
 from __future__ import annotations
 
+from dataclasses import replace
+from typing import Dict, List
+
 from optiv_pan_lib.base import ops
 from optiv_pan_lib.base.session import PanoramaSession
+from optiv_pan_lib.panorama.managed_devices.model import ManagedDevice
+from optiv_pan_lib.panorama.managed_devices.parser import device_group_members, from_xml, pick_entries
 
 
 def list_connected_devices(*, session: PanoramaSession) -> dict:
@@ -26,18 +31,36 @@ def list_all_devices(*, session: PanoramaSession) -> dict:
 def list_connected(*, session: PanoramaSession) -> list:
     """
     Panorama → show devices connected
-    Returns inner 'result'.
+    Returns the raw <entry> dicts.
     """
-    cmd = "<show><devices><connected/></devices></show>"
-    result = ops.op(session=session, cmd=cmd)
-    return result.get('devices', {}).get('entry', [])
+    return pick_entries(list_connected_devices(session=session))
 
 
 def list_all(*, session: PanoramaSession) -> list:
     """
     Panorama → show devices all
-    Returns inner 'result'.
+    Returns the raw <entry> dicts.
     """
-    cmd = "<show><devices><all/></devices></show>"
-    result = ops.op(session=session, cmd=cmd)
-    return result.get('devices', {}).get('entry', [])
+    return pick_entries(list_all_devices(session=session))
+
+
+def list_device_group_members(*, session: PanoramaSession) -> Dict[str, str]:
+    """
+    Panorama → show devicegroups
+    Returns serial → device group.
+    """
+    cmd = "<show><devicegroups/></show>"
+    return device_group_members(ops.op(session=session, cmd=cmd))
+
+
+def list_devices(*, session: PanoramaSession, connected_only: bool = False) -> List[ManagedDevice]:
+    """
+    Typed list_all / list_connected. device_group comes from the entry when
+    present, else from one extra `show devicegroups` call.
+    """
+    result = list_connected_devices(session=session) if connected_only else list_all_devices(session=session)
+    devices = from_xml(result)
+    if any(d.device_group is None for d in devices):
+        groups = list_device_group_members(session=session)
+        devices = [replace(d, device_group=groups.get(d.serial)) if d.device_group is None else d for d in devices]
+    return devices
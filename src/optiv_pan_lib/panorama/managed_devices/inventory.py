@@ -0,0 +1,200 @@
+# src/optiv_pan_lib/panorama/managed_devices/inventory.py
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from optiv_pan_lib.base.session import PanoramaSession
+from optiv_pan_lib.panorama.managed_devices.api import list_all_devices, list_connected_devices, list_device_group_members
+from optiv_pan_lib.panorama.managed_devices.model import ManagedDevice
+from optiv_pan_lib.panorama.managed_devices.parser import fingerprint, from_entry, pick_entries
+
+DEFAULT_TTL = 60.0
+
+# index name → ManagedDevice attribute it is keyed on
+_INDEXED: Tuple[str, ...] = ("hostname", "ip_address", "model", "sw_version", "sw_train", "device_group", "connected")
+
+
+@dataclass(slots=True, frozen=True)
+class RefreshStats:
+    """What one refresh changed. skipped: 'serial: error' for entries that could not be parsed."""
+    added: int = 0
+    changed: int = 0
+    removed: int = 0
+    unchanged: int = 0
+    skipped: Tuple[str, ...] = ()
+
+
+class DeviceInventory:
+    """
+    Managed devices of one Panorama, indexed by serial, hostname, IP, model,
+    software version (exact and major.minor train), device group and
+    connected state.
+
+    Reads refresh from `show devices all` (or `connected` with
+    connected_only) once the data is older than `ttl` seconds. Only entries
+    whose relevant fields changed are re-parsed and re-indexed; unchanged
+    devices keep their ManagedDevice instance. The listing is parsed in full
+    before the inventory changes; malformed entries are left out and listed
+    in RefreshStats.skipped. Device groups come from the
+    entries, or from one `show devicegroups` call when an entry lacks them.
+
+        inv = DeviceInventory(session=pano)
+        inv.find(model="PA-5450", sw_train="10.2", connected=True)
+
+    Thread-safe; queries are set intersections over the indexes. Only one
+    refresh runs at a time and it fetches and parses without holding the
+    query lock; queries keep answering from the current data meanwhile,
+    and only wait when there is no data yet.
+    """
+
+    def __init__(self, *, session: PanoramaSession, ttl: float = DEFAULT_TTL, connected_only: bool = False, clock: Callable[[], float] = monotonic) -> None:
+        self.session = session
+        self.ttl = ttl
+        self.connected_only = connected_only
+        self._clock = clock
+        self._lock = threading.RLock()  # guards the devices, prints and indexes
+        self._refreshing = threading.Lock()  # single flight for refresh()
+        self._fetched_at: Optional[float] = None
+        self._devices: Dict[str, ManagedDevice] = {}
+        self._prints: Dict[str, Tuple[Any, ...]] = {}
+        self._index: Dict[str, Dict[Any, Set[str]]] = {name: {} for name in _INDEXED}
+
+    # ---- refresh ----
+
+    @property
+    def age(self) -> Optional[float]:
+        """Seconds since the last refresh; None before the first."""
+        return None if self._fetched_at is None else self._clock() - self._fetched_at
+
+    def refresh(self, *, force: bool = True) -> RefreshStats:
+        """Re-read the device list (only when stale unless force)."""
+        with self._refreshing:
+            if not force and self._fetched_at is not None and self._clock() - self._fetched_at < self.ttl:
+                return RefreshStats(unchanged=len(self._devices))
+            fetch = list_connected_devices if self.connected_only else list_all_devices
+            entries = pick_entries(fetch(session=self.session))
+            # Entries without <device-group> take it from `show devicegroups`; it is part of the fingerprint.
+            groups = list_device_group_members(session=self.session) if any(e.get("device-group") is None for e in entries) else {}
+
+            # Parse everything first; the inventory is only touched once the whole listing is in.
+            # _prints only changes under _refreshing, so it can be read here without _lock.
+            parsed: Dict[str, Tuple[Tuple[Any, ...], Optional[ManagedDevice]]] = {}  # serial → (fingerprint, new device or None if unchanged)
+            skipped: List[str] = []
+            for entry in entries:
+                serial = _entry_serial(entry)
+                fp = (*fingerprint(entry), groups.get(serial))
+                if serial and self._prints.get(serial) == fp:
+                    parsed[serial] = (fp, None)
+                    continue
+                try:
+                    device = from_entry(entry, device_group=groups.get(serial))
+                except ValueError as exc:
+                    skipped.append(f"{serial or '<no serial>'}: {exc}")
+                    continue
+                parsed[device.serial] = (fp, device)
+
+            with self._lock:
+                added = changed = unchanged = 0
+                for serial, (fp, device) in parsed.items():
+                    if device is None:
+                        unchanged += 1
+                        continue
+                    old = self._devices.get(serial)
+                    if old is not None:
+                        self._unindex(old)
+                        changed += 1
+                    else:
+                        added += 1
+                    self._devices[serial] = device
+                    self._prints[serial] = fp
+                    self._add_index(device)
+                gone = [s for s in self._devices if s not in parsed]
+                for serial in gone:
+                    self._unindex(self._devices.pop(serial))
+                    self._prints.pop(serial, None)
+                self._fetched_at = self._clock()
+            return RefreshStats(added=added, changed=changed, removed=len(gone), unchanged=unchanged, skipped=tuple(skipped))
+
+    def _fresh(self) -> None:
+        """Refresh when stale. Call before taking _lock: refresh() takes _refreshing first."""
+        if self._fetched_at is not None and (self._clock() - self._fetched_at < self.ttl or self._refreshing.locked()):
+            return  # fresh, or another thread is refreshing and the current data still answers
+        self.refresh(force=False)
+
+    def _add_index(self, device: ManagedDevice) -> None:
+        for name in _INDEXED:
+            value = getattr(device, name)
+            if value is not None:
+                self._index[name].setdefault(value, set()).add(device.serial)
+
+    def _unindex(self, device: ManagedDevice) -> None:
+        for name in _INDEXED:
+            value = getattr(device, name)
+            bucket = self._index[name].get(value)
+            if bucket is not None:
+                bucket.discard(device.serial)
+                if not bucket:
+                    del self._index[name][value]
+
+    # ---- queries ----
+
+    def __len__(self) -> int:
+        self._fresh()
+        with self._lock:
+            return len(self._devices)
+
+    def __iter__(self) -> Iterator[ManagedDevice]:
+        self._fresh()
+        with self._lock:
+            return iter(list(self._devices.values()))
+
+    def __contains__(self, serial: object) -> bool:
+        self._fresh()
+        with self._lock:
+            return serial in self._devices
+
+    def get(self, serial: str) -> Optional[ManagedDevice]:
+        self._fresh()
+        with self._lock:
+            return self._devices.get(serial)
+
+    def find(
+            self,
+            *,
+            hostname: Optional[str] = None,
+            ip_address: Optional[str] = None,
+            model: Optional[str] = None,
+            sw_version: Optional[str] = None,
+            sw_train: Optional[str] = None,
+            device_group: Optional[str] = None,
+            connected: Optional[bool] = None,
+            ) -> List[ManagedDevice]:
+        """Devices matching every given criterion (exact values; sw_train is e.g. '10.2'), sorted by serial."""
+        wanted = {"hostname": hostname, "ip_address": ip_address, "model": model, "sw_version": sw_version, "sw_train": sw_train, "device_group": device_group, "connected": connected}
+        self._fresh()
+        with self._lock:
+            buckets = [self._index[name].get(value, set()) for name, value in wanted.items() if value is not None]
+            if not buckets:
+                hits = set(self._devices)
+            else:
+                buckets.sort(key=len)
+                hits = buckets[0].intersection(*buckets[1:])
+            return [self._devices[s] for s in sorted(hits)]
+
+    def values(self, index: str) -> List[Any]:
+        """Distinct values of one index, e.g. values('sw_version')."""
+        if index not in self._index:
+            raise KeyError(f"unknown index: {index!r}; expected one of {_INDEXED}")
+        self._fresh()
+        with self._lock:
+            return sorted(self._index[index], key=str)
+
+
+def _entry_serial(entry: Dict[str, Any]) -> str:
+    serial = entry.get("serial")
+    text = serial.get("#text") if isinstance(serial, dict) else serial
+    return str(text or entry.get("@name") or "").strip()
+
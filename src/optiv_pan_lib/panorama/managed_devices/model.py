@@ -0,0 +1,28 @@
+# src/optiv_pan_lib/panorama/managed_devices/model.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+
+@dataclass(slots=True, frozen=True)
+class ManagedDevice:
+    """One firewall as reported by `show devices all|connected`."""
+    serial: str
+    hostname: Optional[str] = None
+    ip_address: Optional[str] = None
+    model: Optional[str] = None
+    family: Optional[str] = None
+    sw_version: Optional[str] = None
+    device_group: Optional[str] = None
+    connected: bool = False
+    ha_state: Optional[str] = None
+    vsys: Tuple[str, ...] = ()
+
+    @property
+    def sw_train(self) -> Optional[str]:
+        """Major.minor release train: '10.2.9-h1' → '10.2'."""
+        if not self.sw_version:
+            return None
+        parts = self.sw_version.split(".")
+        return ".".join(parts[:2]) if len(parts) >= 2 else self.sw_version
@@ -0,0 +1,69 @@
+# src/optiv_pan_lib/panorama/managed_devices/parser.py
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from optiv_pan_lib.base.util import as_list, node_text
+from optiv_pan_lib.panorama.managed_devices.model import ManagedDevice
+
+# Entry keys ManagedDevice is built from; anything else (uptime, content versions) is ignored.
+FIELDS: Tuple[str, ...] = ("serial", "hostname", "ip-address", "model", "family", "sw-version", "device-group", "connected", "ha", "vsys")
+
+
+def pick_entries(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """<devices><entry> dicts of a `show devices` result (empty when there are none)."""
+    devices = result.get("devices")
+    raw = devices.get("entry") if isinstance(devices, dict) else None
+    return [e for e in as_list(raw) if isinstance(e, dict)]
+
+
+def fingerprint(entry: Dict[str, Any]) -> Tuple[Any, ...]:
+    """The parts of an entry the model depends on; equal fingerprints build equal devices."""
+    return tuple(entry.get(k) for k in FIELDS)
+
+
+def from_entry(entry: Dict[str, Any], *, device_group: Optional[str] = None) -> ManagedDevice:
+    serial = node_text(entry.get("serial")) or (entry.get("@name") or "").strip()
+    if not serial:
+        raise ValueError("device entry without serial")
+    ha = entry.get("ha")
+    vsys = entry.get("vsys")
+    return ManagedDevice(
+        serial=serial,
+        hostname=node_text(entry.get("hostname")),
+        ip_address=node_text(entry.get("ip-address")),
+        model=node_text(entry.get("model")),
+        family=node_text(entry.get("family")),
+        sw_version=node_text(entry.get("sw-version")),
+        device_group=node_text(entry.get("device-group")) or device_group,
+        connected=(node_text(entry.get("connected")) or "").lower() == "yes",
+        ha_state=node_text(ha.get("state")) if isinstance(ha, dict) else None,
+        vsys=tuple(n for n in ((e.get("@name") or "").strip() for e in as_list(vsys.get("entry")) if isinstance(e, dict)) if n) if isinstance(vsys, dict) else (),
+        )
+
+
+def from_xml(result: Dict[str, Any], *, device_groups: Optional[Dict[str, str]] = None) -> List[ManagedDevice]:
+    """
+    ManagedDevice items of a `show devices all|connected` result.
+    device_groups (serial → device group, see device_group_members) fills in
+    device_group for entries that do not carry one.
+    """
+    groups = device_groups or {}
+    return [from_entry(e, device_group=groups.get(node_text(e.get("serial")) or "")) for e in pick_entries(result)]
+
+
+def device_group_members(result: Dict[str, Any]) -> Dict[str, str]:
+    """serial → device group from a `show devicegroups` result."""
+    out: Dict[str, str] = {}
+    groups = result.get("devicegroups")
+    for dg in as_list(groups.get("entry") if isinstance(groups, dict) else None):
+        if not isinstance(dg, dict) or not dg.get("@name"):
+            continue
+        devices = dg.get("devices")
+        for d in as_list(devices.get("entry") if isinstance(devices, dict) else None):
+            if isinstance(d, dict):
+                serial = node_text(d.get("serial")) or (d.get("@name") or "").strip()
+                if serial:
+                    out[serial] = dg["@name"]
+    return out
+
@@ -0,0 +1,312 @@
+# src/optiv_pan_lib/snapshot.py
+from __future__ import annotations
+
+import json
+import marshal
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import quote
+
+from optiv_pan_lib.objects.address.compact import CompactAddressSet
+from optiv_pan_lib.objects.address.model import AddressObject
+from optiv_pan_lib.objects.url_category.model import UrlCategoryObject
+from optiv_pan_lib.panorama.managed_devices.model import ManagedDevice
+
+FORMAT_VERSION = 3
+MAGIC = b"PANSNAP\x00"
+_HEADER = struct.Struct("<8sI")  # magic, metadata length
+_INDEX = struct.Struct("<I")  # marshal'd index length
+_SHARED_DIR = "@shared"  # '@' is not allowed in device-group names
+
+MMAP_THRESHOLD = 1 << 20
+
+KINDS = ("address", "url_category", "managed_device")
+
+
+@dataclass(slots=True, frozen=True)
+class SnapshotMeta:
+    """Where and when a snapshot was taken. Stored as JSON ahead of the payload."""
+    kind: str
+    host: str
+    device_group: Optional[str]
+    config: str  # "candidate" | "running"
+    taken_at: float  # epoch seconds
+    count: int
+    format: int = FORMAT_VERSION
+    python: str = f"{sys.version_info[0]}.{sys.version_info[1]}"
+    marshal_version: int = marshal.version
+    byteorder: str = sys.byteorder
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.taken_at
+
+    def compatible(self) -> bool:
+        """Payload readable by this interpreter (marshal and array layouts are not portable)."""
+        return (
+            self.format == FORMAT_VERSION
+            and self.python == f"{sys.version_info[0]}.{sys.version_info[1]}"
+            and self.marshal_version == marshal.version
+            and self.byteorder == sys.byteorder
+        )
+
+
+# ----------------------------
+# Per-kind payload codecs
+#
+# encode: objects → (count, index, blobs). The index (small, marshal'd)
+# holds everything but the large flat columns, which are written raw as
+# blobs; decode gets those back as buffers (memoryview slices of the file
+# or its mapping) and copies each straight into its final container.
+# ----------------------------
+
+Encoded = Tuple[int, Any, List[bytes]]
+
+_ADDRESS_BLOBS = (0, 1, 2, 3, 4, 6, 8)  # CompactAddressSet.to_columns() positions holding raw column bytes
+
+
+def _encode_addresses(objs: Iterable[AddressObject]) -> Encoded:
+    cs = objs if isinstance(objs, CompactAddressSet) else CompactAddressSet(objs)
+    cols = cs.to_columns()
+    index = tuple(None if i in _ADDRESS_BLOBS else c for i, c in enumerate(cols))
+    return len(cs), index, [cols[i] for i in _ADDRESS_BLOBS]
+
+
+def _decode_addresses(index: Sequence[Any], blobs: Sequence[memoryview]) -> CompactAddressSet:
+    cols = list(index)
+    for i, blob in zip(_ADDRESS_BLOBS, blobs):
+        cols[i] = blob
+    return CompactAddressSet.from_columns(cols)
+
+
+def _encode_url_categories(objs: Iterable[UrlCategoryObject]) -> Encoded:
+    names: List[str] = []
+    types = bytearray()
+    members: List[Tuple[str, ...]] = []
+    descriptions: List[Optional[str]] = []
+    for o in objs:
+        names.append(o.name)
+        types.append(o.type == "Category Match")
+        members.append(o.categories if o.type == "Category Match" else o.urls)
+        descriptions.append(o.description)
+    return len(names), (names, members, descriptions), [bytes(types)]
+
+
+def _decode_url_categories(index: Sequence[Any], blobs: Sequence[memoryview]) -> List[UrlCategoryObject]:
+    names, members, descriptions = index
+    trusted = UrlCategoryObject.trusted
+    return [
+        trusted(n, "Category Match", categories=m, description=d) if t else trusted(n, "URL List", urls=m, description=d)
+        for n, t, m, d in zip(names, bytes(blobs[0]), members, descriptions)
+        ]
+
+
+_DEVICE_FIELDS = tuple(f.name for f in fields(ManagedDevice))
+
+
+def _encode_devices(devices: Iterable[Any]) -> Encoded:
+    """ManagedDevice objects as one tuple per field; raw xmltodict entries (dicts) as they are."""
+    rows = list(devices)
+    if all(isinstance(d, ManagedDevice) for d in rows):
+        return len(rows), ("typed", tuple(tuple(getattr(d, f) for d in rows) for f in _DEVICE_FIELDS)), []
+    if all(isinstance(d, dict) for d in rows):
+        return len(rows), ("raw", rows), []
+    raise ValueError("managed_device snapshots take either ManagedDevice objects or raw device dicts, not a mix")
+
+
+def _decode_devices(index: Any, blobs: Sequence[memoryview]) -> List[Any]:
+    form, payload = index
+    if form == "raw":
+        return list(payload)
+    return [ManagedDevice(*row) for row in zip(*payload)]
+
+
+# kind → (encode, decode)
+_CODECS: Dict[str, Tuple[Callable[[Any], Encoded], Callable[[Any, Sequence[memoryview]], Any]]] = {
+    "address": (_encode_addresses, _decode_addresses),
+    "url_category": (_encode_url_categories, _decode_url_categories),
+    "managed_device": (_encode_devices, _decode_devices),  # ManagedDevice (list_devices, DeviceInventory) or raw entry dicts
+    }
+
+
+# ----------------------------
+# Store
+# ----------------------------
+
+class SnapshotStore:
+    """
+    Directory of parsed collections, one file per (kind, host, device group,
+    candidate/running):
+
+        <root>/<host>/<device-group | @shared>/<candidate | running>/<kind>.snap
+
+    A file is a small JSON header (SnapshotMeta), a marshal'd index, then
+    the large flat columns as raw bytes. Addresses are stored as
+    CompactAddressSet columns and load back as one, without building a
+    model per object. Files of at least `mmap_threshold` bytes are
+    memory-mapped and each raw column is copied once, straight from the
+    mapping into its array, with no intermediate bytes objects; smaller
+    files are simply read. Writes go to a temp file and are renamed into
+    place.
+
+    marshal is specific to the Python version and array columns to the byte
+    order, so snapshots from another interpreter read as missing (see
+    SnapshotMeta.compatible). Only load snapshots this process or a trusted
+    tool wrote: marshal data is not safe against crafted input.
+    """
+
+    def __init__(self, root: str | os.PathLike[str], *, mmap_threshold: int = MMAP_THRESHOLD) -> None:
+        self.root = Path(root)
+        self.mmap_threshold = mmap_threshold
+
+    def path(self, kind: str, *, host: str, device_group: Optional[str] = None, candidate: bool = True) -> Path:
+        if kind not in _CODECS:
+            raise ValueError(f"unknown snapshot kind: {kind!r}; expected one of {KINDS}")
+        dg = _SHARED_DIR if device_group is None else quote(device_group, safe="")
+        return self.root / quote(host, safe="") / dg / ("candidate" if candidate else "running") / f"{kind}.snap"
+
+    def save(self, kind: str, objects: Iterable[Any], *, host: str, device_group: Optional[str] = None, candidate: bool = True, taken_at: Optional[float] = None) -> SnapshotMeta:
+        path = self.path(kind, host=host, device_group=device_group, candidate=candidate)
+        count, index, blobs = _CODECS[kind][0](objects)
+        meta = SnapshotMeta(
+            kind=kind,
+            host=host,
+            device_group=device_group,
+            config="candidate" if candidate else "running",
+            taken_at=time.time() if taken_at is None else taken_at,
+            count=count,
+            )
+        header = json.dumps(asdict(meta), separators=(",", ":")).encode("utf-8")
+        body = marshal.dumps((index, [len(b) for b in blobs]))
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{kind}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER.pack(MAGIC, len(header)))
+                f.write(header)
+                f.write(_INDEX.pack(len(body)))
+                f.write(body)
+                for blob in blobs:
+                    f.write(blob)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        return meta
+
+    def meta(self, kind: str, *, host: str, device_group: Optional[str] = None, candidate: bool = True) -> Optional[SnapshotMeta]:
+        """Header only; None when there is no snapshot."""
+        try:
+            with open(self.path(kind, host=host, device_group=device_group, candidate=candidate), "rb") as f:
+                return _read_meta(f.read(_HEADER.size), f)
+        except FileNotFoundError:
+            return None
+
+    def load(self, kind: str, *, host: str, device_group: Optional[str] = None, candidate: bool = True, max_age: Optional[float] = None) -> Optional[Tuple[SnapshotMeta, Any]]:
+        """
+        (meta, objects) or None when missing, older than max_age seconds, or
+        written by an incompatible interpreter. Addresses come back as a
+        CompactAddressSet, URL categories as a list, devices as a list of
+        whatever was saved (ManagedDevice objects or raw entry dicts).
+        """
+        path = self.path(kind, host=host, device_group=device_group, candidate=candidate)
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
+            return None
+        with f:
+            meta = _read_meta(f.read(_HEADER.size), f)
+            if not meta.compatible() or (max_age is not None and meta.age > max_age):
+                return None
+            offset = f.tell()
+            if os.fstat(f.fileno()).st_size >= self.mmap_threshold:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    objects = _decode(kind, mm, offset)
+            else:
+                objects = _decode(kind, f.read(), 0)
+        return meta, objects
+
+    def delete(self, kind: str, *, host: str, device_group: Optional[str] = None, candidate: bool = True) -> bool:
+        try:
+            self.path(kind, host=host, device_group=device_group, candidate=candidate).unlink()
+            return True
+        except FileNotFoundError:
+            return False
+
+    def __iter__(self) -> Iterator[SnapshotMeta]:
+        """Metadata of every snapshot under root."""
+        for p in sorted(self.root.glob("*/*/*/*.snap")):
+            try:
+                with open(p, "rb") as f:
+                    yield _read_meta(f.read(_HEADER.size), f)
+            except (OSError, ValueError):
+                continue
+
+
+def _decode(kind: str, buf: Any, offset: int) -> Any:
+    """Decode the index + raw columns starting at offset of buf (bytes or mmap)."""
+    views: List[memoryview] = [memoryview(buf)]
+    try:
+        (n,) = _INDEX.unpack_from(buf, offset)
+        offset += _INDEX.size
+        index, lengths = marshal.loads(views[0][offset:offset + n])
+        offset += n
+        for length in lengths:
+            views.append(views[0][offset:offset + length])
+            offset += length
+        if offset > len(views[0]):
+            raise ValueError("truncated snapshot payload")
+        return _CODECS[kind][1](index, views[1:])
+    finally:
+        for v in reversed(views):  # an mmap cannot close while views of it exist
+            v.release()
+
+
+def _read_meta(head: bytes, f: Any) -> SnapshotMeta:
+    if len(head) != _HEADER.size:
+        raise ValueError("truncated snapshot header")
+    magic, n = _HEADER.unpack(head)
+    if magic != MAGIC:
+        raise ValueError("not a snapshot file")
+    return SnapshotMeta(**json.loads(f.read(n)))
+
+
+# ----------------------------
+# Warm start
+# ----------------------------
+
+def load_or_fetch(
+        store: SnapshotStore,
+        kind: str,
+        fetch: Callable[[], Iterable[Any]],
+        *,
+        host: str,
+        device_group: Optional[str] = None,
+        candidate: bool = True,
+        max_age: Optional[float] = None,
+        ) -> Tuple[SnapshotMeta, Any]:
+    """
+    The stored snapshot when present and younger than max_age; otherwise
+    call fetch() (e.g. functools.partial(list_addresses, session=s,
+    device_group="DG1")), save the result and return it as loaded back, so
+    both paths hand back the same types.
+    """
+    hit = store.load(kind, host=host, device_group=device_group, candidate=candidate, max_age=max_age)
+    if hit is not None:
+        return hit
+    store.save(kind, fetch(), host=host, device_group=device_group, candidate=candidate)
+    loaded = store.load(kind, host=host, device_group=device_group, candidate=candidate)
+    if loaded is None:
+        raise RuntimeError(f"snapshot written but not readable: {store.path(kind, host=host, device_group=device_group, candidate=candidate)}")
+    return loaded
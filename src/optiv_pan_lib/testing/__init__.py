@@ -0,0 +1,4 @@
+# src/optiv_pan_lib/testing/__init__.py
+from optiv_pan_lib.testing.fake_panorama import FakePanorama
+
+__all__ = ["FakePanorama"]
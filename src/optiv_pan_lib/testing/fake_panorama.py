@@ -0,0 +1,573 @@
+# src/optiv_pan_lib/testing/fake_panorama.py
+from __future__ import annotations
+
+import argparse
+import re
+import threading
+import time
+import xml.etree.ElementTree as ET
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+from xml.sax.saxutils import escape, quoteattr
+
+from optiv_pan_lib.config import PanoramaConfig, Secret
+
+TEMPLATE_DEVICE = "/config/devices/entry[@name='localhost.localdomain']"
+PREDEFINED_URL_CATEGORIES = (
+    "abused-drugs", "adult", "business-and-economy", "computer-and-internet-info", "gambling",
+    "malware", "news", "phishing", "search-engines", "social-networking", "streaming-media", "unknown",
+    )
+
+_ENTRY_RE = re.compile(r"^(?P<parent>.+)/entry\[@name='(?P<name>[^']*)'\]$")
+_NAMES_RE = re.compile(r"^(?P<parent>.+)/entry/@name$")
+_PICK_RE = re.compile(r"^(?P<parent>.+)/entry\[(?P<pred>@name=.+ or .+)\]$")
+
+
+def _norm(xpath: str) -> str:
+    """Canonical xpath key: single-quoted predicates, no trailing slash, localhost device implied."""
+    x = xpath.strip().rstrip("/").replace('"', "'")
+    return x.replace("/config/devices/entry/", TEMPLATE_DEVICE + "/", 1) if x.startswith("/config/devices/entry/") else x
+
+
+def _tag_of(xpath: str) -> str:
+    return re.sub(r"\[.*\]$", "", xpath.rsplit("/", 1)[-1])
+
+
+def _ok(body: str = "", **attrs: Any) -> bytes:
+    a = "".join(f" {k.replace('_', '-')}={quoteattr(str(v))}" for k, v in attrs.items())
+    return f'<response status="success"><result{a}>{body}</result></response>'.encode()
+
+
+def _error(msg: str, code: int) -> bytes:
+    return f'<response status="error" code="{code}"><msg><line>{escape(msg)}</line></msg></response>'.encode()
+
+
+def _xml(e: ET.Element) -> str:
+    e.tail = None
+    return ET.tostring(e, encoding="unicode")
+
+
+def _merge(dst: ET.Element, src: ET.Element) -> None:
+    """PAN-OS 'set' semantics: leaves are replaced, named entries and containers merged, members unioned."""
+    if len(src) == 0:
+        if src.text and src.text.strip():
+            dst.text = src.text
+        return
+    for child in src:
+        if child.tag == "member":
+            if not any(m.text == child.text for m in dst.findall("member")):
+                dst.append(child)
+            continue
+        name = child.get("name")
+        match = dst.find(f"{child.tag}[@name='{name}']") if name is not None else dst.find(child.tag)
+        if match is None:
+            dst.append(child)
+        else:
+            _merge(match, child)
+
+
+class _Store:
+    """
+    Config tree kept as entry collections: collection xpath → {name: <entry> xml}.
+    Rendered responses are cached per xpath and dropped when the collection changes.
+    """
+
+    def __init__(self) -> None:
+        self.collections: Dict[str, Dict[str, str]] = {}
+        self._rendered: Dict[str, bytes] = {}
+        self._lock = threading.RLock()
+
+    def collection(self, xpath: str) -> Dict[str, str]:
+        return self.collections.setdefault(_norm(xpath), {})
+
+    def _locate(self, xpath: str) -> Tuple[Optional[str], Optional[str]]:
+        """(collection, entry name or None); (None, None) when xpath is unknown."""
+        x = _norm(xpath)
+        if x in self.collections:
+            return x, None
+        m = _ENTRY_RE.match(x)
+        if m and m.group("parent") in self.collections:
+            return m.group("parent"), m.group("name")
+        return None, None
+
+    def _touch(self, coll: str) -> None:
+        for k in [k for k in self._rendered if k.startswith(coll)]:
+            del self._rendered[k]
+
+    # ---- reads ----
+
+    def get(self, xpath: str) -> bytes:
+        x = _norm(xpath)
+        m = _PICK_RE.match(x)
+        if m and m.group("parent") in self.collections:
+            # entry[@name='a' or @name='b' ...]: matched entries straight under <result>, not cached
+            with self._lock:
+                entries = self.collections[m.group("parent")]
+                hits = [entries[n] for n in re.findall(r"@name='([^']*)'", m.group("pred")) if n in entries]
+            return _ok("".join(hits), total_count=len(hits), count=len(hits))
+        with self._lock:
+            cached = self._rendered.get(x)
+            if cached is not None:
+                return cached
+            coll, name = self._locate(x)
+            m = _NAMES_RE.match(x)
+            if coll is None and m and m.group("parent") in self.collections:
+                names = self.collections[m.group("parent")]
+                body = _ok("".join(f"<entry name={quoteattr(n)}/>" for n in names), total_count=len(names), count=len(names))
+            elif coll is None:
+                body = _ok(total_count=0, count=0)
+            elif name is None:
+                entries = self.collections[coll]
+                tag = _tag_of(coll)
+                body = _ok(f"<{tag}>{''.join(entries.values())}</{tag}>", total_count=1, count=1)
+            else:
+                entry = self.collections[coll].get(name)
+                body = _ok(entry, total_count=1, count=1) if entry else _ok(total_count=0, count=0)
+            self._rendered[x] = body
+            return body
+
+    # ---- writes ----
+
+    def set(self, xpath: str, element: str) -> bytes:
+        x = _norm(xpath)
+        with self._lock:
+            coll, name = self._locate(x)
+            if coll is None:
+                m = _ENTRY_RE.match(x)
+                coll, name = (m.group("parent"), m.group("name")) if m else (x, None)
+                self.collections.setdefault(coll, {})
+            entries = self.collections[coll]
+            try:
+                new = ET.fromstring(f"<_>{element}</_>")
+            except ET.ParseError as e:
+                return _error(f"Malformed element: {e}", 18)
+            if name is not None:
+                current = ET.fromstring(entries[name]) if name in entries else ET.Element("entry", name=name)
+                _merge(current, new)
+                entries[name] = _xml(current)
+            else:
+                for child in new:
+                    n = child.get("name")
+                    if child.tag != "entry" or not n:
+                        return _error(f"set: expected <entry name=...> under {coll}", 12)
+                    if n in entries:
+                        current = ET.fromstring(entries[n])
+                        _merge(current, child)
+                        child = current
+                    entries[n] = _xml(child)
+            self._touch(coll)
+        return _ok(msg="command succeeded")
+
+    def edit(self, xpath: str, element: str) -> bytes:
+        x = _norm(xpath)
+        with self._lock:
+            try:
+                new = ET.fromstring(element)
+            except ET.ParseError as e:
+                return _error(f"Malformed element: {e}", 18)
+            m = _ENTRY_RE.match(x)
+            if m:
+                coll, name = m.group("parent"), m.group("name")
+                if new.tag != "entry" or new.get("name") != name:
+                    return _error("edit: element does not match the xpath's last node", 12)
+                self.collections.setdefault(coll, {})[name] = _xml(new)
+            else:
+                if new.tag != _tag_of(x):
+                    return _error("edit: element does not match the xpath's last node", 12)
+                coll = x
+                self.collections[coll] = {e.get("name", ""): _xml(e) for e in new.findall("entry")}
+            self._touch(coll)
+        return _ok(msg="command succeeded")
+
+    def delete(self, xpath: str) -> bytes:
+        x = _norm(xpath)
+        with self._lock:
+            coll, name = self._locate(x)
+            if coll is not None:
+                if name is None:
+                    self.collections[coll].clear()
+                else:
+                    self.collections[coll].pop(name, None)
+                self._touch(coll)
+        return _ok(msg="command succeeded")
+
+    def multi(self, element: str) -> bytes:
+        """All-or-nothing like PAN-OS: the collections touched so far are restored when a sub-operation fails."""
+        try:
+            req = ET.fromstring(element)
+        except ET.ParseError as e:
+            return _error(f"Malformed element: {e}", 18)
+        with self._lock:
+            saved: Dict[str, Optional[Dict[str, str]]] = {}  # collection → entries before this request (None: did not exist)
+            for i, op in enumerate(req, 1):
+                xpath = op.get("xpath") or ""
+                coll = self._collection_of(xpath)
+                if coll not in saved:
+                    saved[coll] = dict(self.collections[coll]) if coll in self.collections else None
+                inner = "".join(_xml(c) for c in op)
+                if op.tag == "set":
+                    out = self.set(xpath, inner)
+                elif op.tag == "edit":
+                    out = self.edit(xpath, inner)
+                elif op.tag == "delete":
+                    out = self.delete(xpath)
+                else:
+                    out = _error(f"multi-config: unsupported action {op.tag}", 12)
+                if b'status="error"' in out:
+                    self._restore(saved)
+                    return _error(f"multi-config request {op.get('id') or i} failed: {out.decode()}", 12)
+        return _ok(msg="command succeeded")
+
+    def _collection_of(self, xpath: str) -> str:
+        """Collection a set/edit/delete on xpath writes to."""
+        x = _norm(xpath)
+        coll, _ = self._locate(x)
+        if coll is None:
+            m = _ENTRY_RE.match(x)
+            coll = m.group("parent") if m else x
+        return coll
+
+    def _restore(self, saved: Dict[str, Optional[Dict[str, str]]]) -> None:
+        for coll, entries in saved.items():
+            if entries is None:
+                self.collections.pop(coll, None)
+            else:
+                current = self.collections.setdefault(coll, {})
+                current.clear()
+                current.update(entries)
+            self._touch(coll)
+
+
+class FakePanorama:
+    """
+    In-process stand-in for the Panorama XML API, for benchmarks and local tests.
+
+    Implements keygen, config get/show/set/edit/delete/multi-config and the op
+    commands `show devices connected|all`, `show devicegroups` and `show dg-hierarchy` (from
+    `dg_parents`, device group → parent), a configuration export of all
+    stored collections, and commit / commit-all jobs that finish after
+    `job_seconds` (`show jobs id|all`), over plain HTTP on 127.0.0.1. The
+    config is seeded with synthetic address objects, custom URL categories
+    and managed devices in `device_group`; `latency` seconds are added to
+    every response.
+
+        with FakePanorama(addresses=100_000, latency=0.005) as fake:
+            with PanoramaSession(fake.config()) as pano:
+                list_addresses(session=pano, device_group=fake.device_group)
+
+    Reads also answer `<container>/entry/@name` name listings and
+    `entry[@name='a' or @name='b']` batch selectors (see base.chunked).
+
+    Not a PAN-OS emulator: only entry collections are modelled, set merges
+    leaves and members but never validates the schema. multi-config is
+    all-or-nothing, as on PAN-OS.
+    """
+
+    def __init__(
+            self,
+            *,
+            addresses: int = 1000,
+            url_categories: int = 100,
+            devices: int = 100,
+            latency: float = 0.0,
+            device_group: str = "bench",
+            username: str = "admin",
+            password: str = "admin",
+            host: str = "127.0.0.1",
+            port: int = 0,
+            ):
+        self.device_group = device_group
+        self.dg_parents: Dict[str, Optional[str]] = {device_group: None}
+        self.latency = latency
+        self.username = username
+        self.password = password
+        self.api_key = "FAKE-" + "0" * 32
+        self.requests = 0
+        self._count_lock = threading.Lock()
+        self.store = _Store()
+        self._devices: List[str] = []
+        self._op_rendered: Dict[str, bytes] = {}
+        self.job_seconds = 1.0  # how long commit / commit-all jobs take
+        self._jobs: Dict[int, Tuple[float, str, str]] = {}  # id → (enqueued at, type, description)
+        self._seed(addresses, url_categories, devices)
+
+        self._server = ThreadingHTTPServer((host, port), _handler_for(self))
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    # ---- lifecycle ----
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        host, port = self._server.server_address[:2]
+        return str(host), int(port)
+
+    @property
+    def hostname(self) -> str:
+        host, port = self.address
+        return f"{host}:{port}"
+
+    def start(self) -> "FakePanorama":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name="fake-panorama", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "FakePanorama":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def config(self, **overrides: Any) -> PanoramaConfig:
+        """PanoramaConfig pointing at this server (plain http)."""
+        pw = self.password
+        kw: Dict[str, Any] = {"hostname": self.hostname, "username": self.username, "password": Secret(lambda: pw), "scheme": "http"}
+        kw.update(overrides)
+        return PanoramaConfig(**kw)
+
+    # ---- data ----
+
+    def _seed(self, addresses: int, url_categories: int, devices: int) -> None:
+        dg = f"{TEMPLATE_DEVICE}/device-group/entry[@name='{self.device_group}']"
+        addrs = self.store.collection(f"{dg}/address")
+        for i in range(addresses):
+            name = f"addr-{i:07d}"
+            if i % 10 == 9:
+                body = f"<fqdn>host{i}.example.com</fqdn>"
+            elif i % 10 == 8:
+                body = f"<ip-range>10.{i >> 16 & 255}.{i >> 8 & 255}.1-10.{i >> 16 & 255}.{i >> 8 & 255}.254</ip-range>"
+            else:
+                body = f"<ip-netmask>10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}/32</ip-netmask>"
+            addrs[name] = f'<entry name="{name}">{body}<description>synthetic {i}</description><tag><member>bench</member></tag></entry>'
+
+        cats = self.store.collection(f"{dg}/profiles/custom-url-category")
+        for i in range(url_categories):
+            name = f"urlcat-{i:07d}"
+            if i % 5 == 4:
+                members = "".join(f"<member>{PREDEFINED_URL_CATEGORIES[(i + k) % len(PREDEFINED_URL_CATEGORIES)]}</member>" for k in range(3))
+                kind = "Category Match"
+            else:
+                members = "".join(f"<member>site{i}-{k}.example.com/path</member>" for k in range(5))
+                kind = "URL List"
+            cats[name] = f'<entry name="{name}"><list>{members}</list><type>{kind}</type><description>synthetic {i}</description></entry>'
+
+        predefined = self.store.collection("/config/predefined/pan-url-categories")
+        for name in PREDEFINED_URL_CATEGORIES:
+            predefined[name] = f'<entry name="{name}"/>'
+
+        for i in range(devices):
+            serial = f"0070{i:08d}"
+            connected = "no" if i % 50 == 49 else "yes"
+            self._devices.append(
+                f'<entry name="{serial}"><serial>{serial}</serial><hostname>fw-{i:05d}</hostname>'
+                f"<ip-address>192.0.{i >> 8 & 255}.{i & 255}</ip-address><model>PA-3220</model><sw-version>10.2.9</sw-version>"
+                f"<connected>{connected}</connected><device-group>{escape(self.device_group)}</device-group>"
+                f"<ha><state>{'active' if i % 2 == 0 else 'passive'}</state></ha><vsys><entry name=\"vsys1\"><display-name>vsys1</display-name></entry></vsys></entry>"
+                )
+
+    # ---- request dispatch ----
+
+    def handle(self, params: Dict[str, str]) -> Tuple[int, bytes]:
+        with self._count_lock:
+            self.requests += 1
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+        t = params.get("type", "")
+        if t == "keygen":
+            if params.get("user") == self.username and params.get("password") == self.password:
+                return 200, _ok(f"<key>{self.api_key}</key>")
+            return 403, _error("Invalid Credential", 403)
+        if params.get("key") != self.api_key:
+            return 403, _error("Invalid Credential", 403)
+
+        if t == "config":
+            action = params.get("action", "")
+            xpath = params.get("xpath", "")
+            if action in ("get", "show"):
+                return 200, self.store.get(xpath)
+            if action == "set":
+                return 200, self.store.set(xpath, params.get("element", ""))
+            if action == "edit":
+                return 200, self.store.edit(xpath, params.get("element", ""))
+            if action == "delete":
+                return 200, self.store.delete(xpath)
+            if action == "multi-config":
+                return 200, self.store.multi(params.get("element", ""))
+            return 200, _error(f"Unsupported config action: {action}", 12)
+        if t == "op":
+            return 200, self._op(params.get("cmd", ""))
+        if t == "commit":
+            return 200, self._commit(params.get("cmd", ""), params.get("action", ""))
+        if t == "export" and params.get("category") == "configuration":
+            return 200, self._export()
+        return 200, _error(f"Unsupported request type: {t}", 12)
+
+    def _op(self, cmd: str) -> bytes:
+        try:
+            root = ET.fromstring(cmd)
+        except ET.ParseError:
+            return _error("Malformed command", 17)
+        path = []
+        node: Optional[ET.Element] = root
+        while node is not None:
+            path.append(node.tag)
+            node = node[0] if len(node) else None
+        key = "/".join(path)
+        if key == "show/jobs/id":
+            job = self._job((root.findtext("jobs/id") or "").strip())
+            return _ok(job) if job else _error("job not found", 7)
+        if key == "show/jobs/all":
+            return _ok("".join(self._job(str(i)) for i in sorted(self._jobs, reverse=True)))
+        if key == "show/dg-hierarchy":
+            return _ok(f"<dg-hierarchy>{self._dg_tree(None)}</dg-hierarchy>")
+        cached = self._op_rendered.get(key)
+        if cached is not None:
+            return cached
+        if key == "show/devices/connected":
+            body = _ok("<devices>" + "".join(d for d in self._devices if "<connected>yes</connected>" in d) + "</devices>")
+        elif key == "show/devices/all":
+            body = _ok("<devices>" + "".join(self._devices) + "</devices>")
+        elif key == "show/devicegroups":
+            members = "".join(f"<entry name={quoteattr(m.group(1))}><serial>{m.group(1)}</serial></entry>" for m in (re.match(r'<entry name="([^"]*)"', d) for d in self._devices) if m)
+            body = _ok(f"<devicegroups><entry name={quoteattr(self.device_group)}><devices>{members}</devices></entry></devicegroups>")
+        elif key == "show/system/info":
+            body = _ok("<system><hostname>fake-panorama</hostname><model>Panorama</model><sw-version>10.2.9</sw-version></system>")
+        else:
+            return _error(f"Unsupported command: {key}", 17)
+        self._op_rendered[key] = body
+        return body
+
+
+    def _commit(self, cmd: str, action: str) -> bytes:
+        try:
+            root = ET.fromstring(cmd)
+        except ET.ParseError:
+            return _error("Malformed command", 17)
+        kind = {("commit", ""): "Commit", ("commit-all", "all"): "CommitAll"}.get((root.tag, action))
+        if kind is None:
+            return _error(f"Unsupported commit: {root.tag}", 17)
+        with self._count_lock:
+            job_id = len(self._jobs) + 1
+            self._jobs[job_id] = (time.monotonic(), kind, (root.findtext(".//description") or "").strip())
+        return _ok(f"<msg><line>{kind} job enqueued with jobid {job_id}</line></msg><job>{job_id}</job>")
+
+    def _job(self, job_id: str) -> str:
+        """`show jobs` <job> entry; progress runs linearly over job_seconds."""
+        job = self._jobs.get(int(job_id)) if job_id.isdigit() else None
+        if job is None:
+            return ""
+        started, kind, description = job
+        progress = 100 if self.job_seconds <= 0 else min(100, int((time.monotonic() - started) * 100 / self.job_seconds))
+        fin = progress >= 100
+        return (
+            f"<job><id>{job_id}</id><type>{kind}</type><status>{'FIN' if fin else 'ACT'}</status>"
+            f"<result>{'OK' if fin else 'PEND'}</result><progress>{progress}</progress>"
+            f"<description>{escape(description)}</description>"
+            f"<details>{'<line>Configuration committed successfully</line>' if fin else ''}</details></job>"
+            )
+
+    def _export(self) -> bytes:
+        """The running config as one document: every stored collection plus readonly device-group parents."""
+        tree: Dict[str, Any] = {}  # step → subtree; "" → rendered entries
+
+        def node(xpath: str) -> Dict[str, Any]:
+            d = tree
+            for step in re.findall(r"[^/\[]+(?:\[@name='[^']*'\])?", xpath)[1:]:  # below /config
+                d = d.setdefault(step, {})
+            return d
+
+        with self.store._lock:
+            for coll, entries in self.store.collections.items():
+                if coll.startswith("/config/") and entries:
+                    node(coll)[""] = "".join(entries.values())
+        node(f"{TEMPLATE_DEVICE.replace('/devices/', '/readonly/devices/', 1)}/device-group")[""] = "".join(
+            f"<entry name={quoteattr(dg)}><id>{i}</id>{'' if p is None else f'<parent-dg>{escape(p)}</parent-dg>'}</entry>"
+            for i, (dg, p) in enumerate(self.dg_parents.items(), start=11)
+            )
+
+        def render(d: Dict[str, Any]) -> str:
+            out = [d.get("", "")]
+            for step, child in d.items():
+                if step:
+                    tag, _, name = step.partition("[@name='")
+                    attr = f" name={quoteattr(name[:-2])}" if name else ""
+                    out.append(f"<{tag}{attr}>{render(child)}</{tag}>")
+            return "".join(out)
+
+        return f'<config version="10.2.0">{render(tree)}</config>'.encode()
+
+    def _dg_tree(self, parent: Optional[str]) -> str:
+        return "".join(f"<dg name={quoteattr(dg)}>{self._dg_tree(dg)}</dg>" for dg, p in self.dg_parents.items() if p == parent)
+
+
+def _handler_for(fake: FakePanorama) -> type:
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True  # headers and body go out as separate writes
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+        def _dispatch(self) -> None:
+            url = urlparse(self.path)
+            if url.path.rstrip("/") != "/api":
+                self._reply(404, b"not found")
+                return
+            q = parse_qs(url.query, keep_blank_values=True)
+            n = int(self.headers.get("Content-Length") or 0)
+            if n:
+                q.update(parse_qs(self.rfile.read(n).decode("utf-8"), keep_blank_values=True))
+            params = {k: v[-1] for k, v in q.items()}
+            try:
+                status, body = fake.handle(params)
+            except Exception as e:  # keep serving; surface as a PAN-OS style error
+                status, body = 200, _error(f"{type(e).__name__}: {e}", 1)
+            self._reply(status, body)
+
+        def _reply(self, status: int, body: bytes) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/xml; charset=UTF-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        do_GET = do_POST = _dispatch
+
+    return _Handler
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    ap = argparse.ArgumentParser(description="Run a stand-in Panorama XML API server over plain HTTP.")
+    ap.add_argument("--addresses", type=int, default=1000)
+    ap.add_argument("--url-categories", type=int, default=100)
+    ap.add_argument("--devices", type=int, default=100)
+    ap.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    ap.add_argument("--device-group", default="bench")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=0)
+    a = ap.parse_args(argv)
+
+    fake = FakePanorama(addresses=a.addresses, url_categories=a.url_categories, devices=a.devices, latency=a.latency, device_group=a.device_group, host=a.host, port=a.port)
+    print(f"fake panorama on http://{fake.hostname}/api/ (user {fake.username!r}, password {fake.password!r})", flush=True)
+    fake.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        fake.stop()
+
+
+if __name__ == "__main__":
+    main()